@@ -20,14 +20,61 @@ class Settings(BaseSettings):
     GOOGLE_API_KEY: Optional[str] = os.getenv("GOOGLE_API_KEY")
     SIFT_GEMINI_MODEL: str = os.getenv("SIFT_GEMINI_MODEL", "gemini-2.0-flash")
     GEMINI_TEMPERATURE: float = float(os.getenv("GEMINI_TEMPERATURE", "0.1"))
-    GEMINI_ENDPOINT: str = "https://generativelanguage.googleapis.com/v1beta/models"
+    GEMINI_ENDPOINT: str = os.getenv("GEMINI_ENDPOINT", "https://generativelanguage.googleapis.com/v1beta/models")
+    # Faster, cheaper model for the small structured tasks (claim extraction, query generation)
+    SIFT_GEMINI_LIGHT_MODEL: str = os.getenv("SIFT_GEMINI_LIGHT_MODEL", "gemini-2.0-flash-lite")
+    # Generation profile per LLMAnalyzer task: model ("light" for SIFT_GEMINI_LIGHT_MODEL, None for
+    # SIFT_GEMINI_MODEL; resolved when used, so values from .env apply), output-token cap, temperature
+    # (None follows GEMINI_TEMPERATURE) and timeout in seconds; other tasks use the "general" profile
+    GEMINI_TASK_PROFILES: dict = {
+        "claim_extraction": {
+            "model": "light", "max_output_tokens": 2048, "temperature": None, "timeout_seconds": 30.0,
+        },
+        "query_generation": {
+            "model": "light", "max_output_tokens": 256, "temperature": None, "timeout_seconds": 10.0,
+        },
+        "factcheck_verdict": {
+            "model": None, "max_output_tokens": 1024, "temperature": None, "timeout_seconds": 30.0,
+        },
+        "final_verdict": {
+            "model": None, "max_output_tokens": 1024, "temperature": 0.1, "timeout_seconds": 30.0,
+        },
+        "general": {
+            "model": None, "max_output_tokens": 8192, "temperature": None, "timeout_seconds": 30.0,
+        },
+    }
+    # USD per million input and output tokens by model, for the per-task cost metrics
+    GEMINI_PRICING: dict = {
+        "gemini-2.0-flash": [0.10, 0.40],
+        "gemini-2.0-flash-lite": [0.075, 0.30],
+        "gemini-2.5-flash": [0.30, 2.50],
+        "gemini-2.5-flash-lite": [0.10, 0.40],
+        "gemini-2.5-pro": [1.25, 10.00],
+    }
+    # Cached input tokens (context cache hits) are billed at this fraction of the input price
+    GEMINI_CACHED_INPUT_DISCOUNT: float = float(os.getenv("GEMINI_CACHED_INPUT_DISCOUNT", "0.25"))
+    # Upload each task's static system instruction once to Gemini's cachedContents API and reference
+    # it by handle; handles are renewed before the TTL runs out and deleted on shutdown. Gemini only
+    # caches prefixes of a model-specific minimum size, so shorter instructions are sent inline
+    GEMINI_CONTEXT_CACHE: bool = os.getenv("GEMINI_CONTEXT_CACHE", "false").lower() == "true"
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS: int = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL_SECONDS", "3600"))
+    GEMINI_CONTEXT_CACHE_MIN_TOKENS: int = int(os.getenv("GEMINI_CONTEXT_CACHE_MIN_TOKENS", "1024"))
     
     # Google Search Settings
     GOOGLE_SEARCH_API_KEY: Optional[str] = os.getenv("GOOGLE_SEARCH_API_KEY")
     GOOGLE_SEARCH_CX: Optional[str] = os.getenv("GOOGLE_SEARCH_CX")
+    CUSTOM_SEARCH_URL: str = os.getenv("CUSTOM_SEARCH_URL", "https://www.googleapis.com/customsearch/v1")
     
     # Fact Check Tools API
     FACT_CHECK_API_KEY: Optional[str] = os.getenv("FACT_CHECK_API_KEY")
+    FACT_CHECK_API_URL: str = os.getenv("FACT_CHECK_API_URL", "https://factchecktools.googleapis.com/v1alpha1/claims:search")
+    # Local SQLite FTS5 index of every ClaimReview record received (or bulk-loaded), searched first;
+    # the API is only called when it has no match or its matches are older than the TTL
+    CLAIMREVIEW_INDEX: bool = os.getenv("CLAIMREVIEW_INDEX", "true").lower() == "true"
+    CLAIMREVIEW_INDEX_PATH: str = os.getenv("CLAIMREVIEW_INDEX_PATH", "claimreview_index.sqlite3")
+    CLAIMREVIEW_INDEX_TTL_DAYS: float = float(os.getenv("CLAIMREVIEW_INDEX_TTL_DAYS", "7"))
+    # Share of a query's content terms an indexed claim must contain to count as a match
+    CLAIMREVIEW_INDEX_MIN_MATCH: float = float(os.getenv("CLAIMREVIEW_INDEX_MIN_MATCH", "0.6"))
 
     # Google Cloud Credentials
     # For local development: path to credentials file
@@ -35,16 +82,123 @@ class Settings(BaseSettings):
     # For Render deployment: JSON string from environment variable
     GOOGLE_CREDENTIALS_JSON: Optional[str] = os.getenv("GOOGLE_CREDENTIALS_JSON")
     
+    # Outbound rate limits (requests/tokens per minute, 0 disables a limit)
+    GEMINI_RPM: int = int(os.getenv("GEMINI_RPM", "60"))
+    GEMINI_TPM: int = int(os.getenv("GEMINI_TPM", "1000000"))
+    FACTCHECK_RPM: int = int(os.getenv("FACTCHECK_RPM", "120"))
+    CUSTOM_SEARCH_RPM: int = int(os.getenv("CUSTOM_SEARCH_RPM", "100"))
+    TRANSLATION_RPM: int = int(os.getenv("TRANSLATION_RPM", "300"))
+    # Retries of 429 responses (honours Retry-After, otherwise jittered exponential backoff)
+    RATE_LIMIT_MAX_RETRIES: int = int(os.getenv("RATE_LIMIT_MAX_RETRIES", "2"))
+    RATE_LIMIT_BACKOFF_BASE: float = float(os.getenv("RATE_LIMIT_BACKOFF_BASE", "1.0"))
+    RATE_LIMIT_BACKOFF_MAX: float = float(os.getenv("RATE_LIMIT_BACKOFF_MAX", "20.0"))
+    
+    # Circuit breakers: consecutive failures before opening, seconds before a half-open probe
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RECOVERY_SECONDS: float = float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "30"))
+    CRAWLER_HOST_BREAKERS_MAX: int = int(os.getenv("CRAWLER_HOST_BREAKERS_MAX", "1000"))
+    
+    # Outbound HTTP transport: live, record (append calls to the cassette) or replay (serve from it)
+    HTTP_TRANSPORT_MODE: str = os.getenv("HTTP_TRANSPORT_MODE", "live")
+    HTTP_CASSETTE_PATH: str = os.getenv("HTTP_CASSETTE_PATH", "http_cassette.jsonl")
+    # Replay with the recorded latencies ("original") or none ("zero")
+    HTTP_REPLAY_TIMING: str = os.getenv("HTTP_REPLAY_TIMING", "original")
+    # "strict" matches request bodies too; "url" only method and URL (survives prompt changes)
+    HTTP_REPLAY_MATCH: str = os.getenv("HTTP_REPLAY_MATCH", "strict")
+    # Idle seconds a pooled upstream connection is kept open for reuse
+    HTTP_KEEPALIVE_SECONDS: float = float(os.getenv("HTTP_KEEPALIVE_SECONDS", "60"))
+    
+    # Startup warm-up (langdetect profiles, Translate client, upstream connections):
+    # "background" serves requests while warming, "blocking" finishes before serving, "off" skips it
+    STARTUP_WARMUP: str = os.getenv("STARTUP_WARMUP", "background")
+    
+    # Response compression: "auto" (Brotli when the brotli-asgi package is installed, else gzip),
+    # "gzip" or "off"; responses smaller than the minimum are sent uncompressed
+    RESPONSE_COMPRESSION: str = os.getenv("RESPONSE_COMPRESSION", "auto")
+    RESPONSE_COMPRESSION_MIN_BYTES: int = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "500"))
+    
     # Cache Settings
     CACHE_TTL: int = int(os.getenv("CACHE_TTL", "3600"))
     
     # Crawler Settings
     MAX_CRAWL_DEPTH: int = 2
+    # "ranked": rank search results on snippet/title/domain first and crawl only the top K;
+    # "arrival": crawl the first CRAWL_MAX_SOURCES results in the order they arrived
+    CRAWL_STRATEGY: str = os.getenv("CRAWL_STRATEGY", "ranked")
+    CRAWL_MAX_SOURCES: int = int(os.getenv("CRAWL_MAX_SOURCES", "10"))
+    CRAWL_MIN_SOURCES: int = int(os.getenv("CRAWL_MIN_SOURCES", "3"))
+    # Snippet relevance (0-0.7) at which an authoritative result counts as already convincing
+    CRAWL_CONFIDENT_RELEVANCE: float = float(os.getenv("CRAWL_CONFIDENT_RELEVANCE", "0.35"))
     REQUEST_TIMEOUT: int = 10
     MAX_RETRIES: int = 3
+    # Response bytes read per crawled page: HTML beyond the cap is cut off (main content comes
+    # early in the document), larger PDFs are skipped
+    CRAWL_MAX_HTML_BYTES: int = int(os.getenv("CRAWL_MAX_HTML_BYTES", "3000000"))
+    CRAWL_MAX_PDF_BYTES: int = int(os.getenv("CRAWL_MAX_PDF_BYTES", "10000000"))
+    # Ceiling on the response bodies one request holds in memory at once, in MB (0 disables);
+    # a page that would go over it is skipped like an unreachable one
+    REQUEST_MEMORY_BUDGET_MB: float = float(os.getenv("REQUEST_MEMORY_BUDGET_MB", "32"))
+    # HTML extraction: "single_pass" (one streaming walk) or "soup" (BeautifulSoup tree lookups)
+    HTML_EXTRACTOR: str = os.getenv("HTML_EXTRACTOR", "single_pass")
     
     # Fact-checking Settings
     FACTCHECK_PROVIDERS: list = ["factcheck.org", "snopes", "politifact"]
+    # Extra source reputation list: one "domain[/path] category" per line (factcheck, gov, edu, news)
+    DOMAIN_REPUTATION_FILE: Optional[str] = os.getenv("DOMAIN_REPUTATION_FILE")
+    DOMAIN_REPUTATION_CACHE_SIZE: int = int(os.getenv("DOMAIN_REPUTATION_CACHE_SIZE", "65536"))
+    # Collapse near-duplicate evidence (syndicated copies) before crawling and before ranking
+    EVIDENCE_DEDUP: bool = os.getenv("EVIDENCE_DEDUP", "true").lower() == "true"
+    # Max SimHash bit difference between near-duplicates (out of 64; unrelated texts differ by ~32)
+    EVIDENCE_DEDUP_MAX_DISTANCE: int = int(os.getenv("EVIDENCE_DEDUP_MAX_DISTANCE", "6"))
+    # Time budget for a whole /analyze call in seconds (0 disables); requests may set their own
+    REQUEST_DEADLINE_SECONDS: float = float(os.getenv("REQUEST_DEADLINE_SECONDS", "45"))
+    # Admission control per worker: at most ADMISSION_MAX_IN_FLIGHT analysis pipelines run at once
+    # (0 disables), up to ADMISSION_MAX_QUEUE more wait up to ADMISSION_QUEUE_TIMEOUT_SECONDS for a
+    # slot; the rest are answered 503 with Retry-After at once
+    ADMISSION_MAX_IN_FLIGHT: int = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "8"))
+    ADMISSION_MAX_QUEUE: int = int(os.getenv("ADMISSION_MAX_QUEUE", "16"))
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "10"))
+    # Share one pipeline execution between identical concurrent /analyze requests
+    COALESCE_REQUESTS: bool = os.getenv("COALESCE_REQUESTS", "true").lower() == "true"
+    # Analysis modes selectable per request ("mode"), and the default. Per mode: claims checked,
+    # search queries per claim, sources crawled (0 uses search snippets only, None follows
+    # CRAWL_MAX_SOURCES, resolved when used so .env applies), evidence snippets given to
+    # the verdict, whether non-English text is translated, the verdict path ("full": verdict and final
+    # verdict Gemini calls, "single": verdict only, "ratings": fact-check ratings, no Gemini call),
+    # the query strategy (None follows QUERY_STRATEGY) and the deadline (None follows REQUEST_DEADLINE_SECONDS)
+    ANALYSIS_MODE: str = os.getenv("ANALYSIS_MODE", "balanced")
+    ANALYSIS_MODES: dict = {
+        "fast": {
+            "max_claims": 2, "max_queries": 1, "max_crawl_sources": 0, "max_evidence": 5,
+            "translate": False, "verdict": "ratings", "query_strategy": "local", "deadline_seconds": 5.0,
+        },
+        "balanced": {
+            "max_claims": 5, "max_queries": 3, "max_crawl_sources": None, "max_evidence": 10,
+            "translate": True, "verdict": "full", "query_strategy": None, "deadline_seconds": None,
+        },
+        "thorough": {
+            "max_claims": 8, "max_queries": 5, "max_crawl_sources": 15, "max_evidence": 15,
+            "translate": True, "verdict": "full", "query_strategy": "llm", "deadline_seconds": 90.0,
+        },
+    }
+    # Local check-worthiness pre-filter before LLM claim extraction: "skip" answers texts with no
+    # check-worthy sentence without calling Gemini, "trim" also sends only passing sentences, "off"
+    CHECKWORTHINESS_FILTER: str = os.getenv("CHECKWORTHINESS_FILTER", "skip")
+    # Sentence score (0-1) needed to pass; a plain factual assertion scores 0.2
+    CHECKWORTHINESS_THRESHOLD: float = float(os.getenv("CHECKWORTHINESS_THRESHOLD", "0.2"))
+    # Stream claim extraction (streamGenerateContent) and start checking each claim as it arrives
+    STREAM_CLAIM_EXTRACTION: bool = os.getenv("STREAM_CLAIM_EXTRACTION", "true").lower() == "true"
+    # Search query generation: "llm" asks Gemini, "local" builds queries from IDF-weighted keyphrases
+    # (no network call; also the fallback when the Gemini call fails)
+    QUERY_STRATEGY: str = os.getenv("QUERY_STRATEGY", "llm")
+    # JSON file the keyphrase IDF table (past claims and evidence) is loaded from and saved to on shutdown
+    QUERY_IDF_FILE: Optional[str] = os.getenv("QUERY_IDF_FILE")
+    QUERY_IDF_MAX_TERMS: int = int(os.getenv("QUERY_IDF_MAX_TERMS", "200000"))
+    # Re-check only new or changed paragraphs when a /factcheck-url page is analyzed again
+    INCREMENTAL_ANALYSIS: bool = os.getenv("INCREMENTAL_ANALYSIS", "true").lower() == "true"
+    # Pages whose paragraph fingerprints and claim results are kept, and for how many seconds
+    PAGE_STORE_MAX_PAGES: int = int(os.getenv("PAGE_STORE_MAX_PAGES", "500"))
+    PAGE_STORE_TTL_SECONDS: int = int(os.getenv("PAGE_STORE_TTL_SECONDS", "86400"))
     
     # CORS Settings
     # Note: FastAPI CORS doesn't support wildcards, so use specific origins or ["*"] for all
@@ -1,16 +1,53 @@
 """Main FastAPI application."""
+import time
+_import_started = time.perf_counter()
+
+import asyncio
 import logging
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from .config import settings
 from .routes import analyze
+from .services.admission import get_admission_controller
+from .services.circuit_breaker import breaker_states
+from .services.gemini_cache import close_context_cache
+from .services.http_transport import close_shared_clients
+from .services.keyphrase import save_idf_table
+from .services.metrics import llm_usage_report, render_metrics, METRICS_CONTENT_TYPE
+from .services.startup import startup_report, warm_up
 
 logger = logging.getLogger(__name__)
 
+startup_report.record("imports", time.perf_counter() - _import_started)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up on startup; on shutdown delete Gemini context caches, close pooled connections and save the IDF table."""
+    warmup_task = None
+    if settings.STARTUP_WARMUP == "blocking":
+        await warm_up(analyze.get_factcheck_service)
+    elif settings.STARTUP_WARMUP == "background":
+        warmup_task = asyncio.create_task(warm_up(analyze.get_factcheck_service))
+    else:
+        startup_report.log()
+    yield
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    await close_context_cache()
+    await close_shared_clients()
+    save_idf_table()
+
+
 app = FastAPI(
     title=settings.API_TITLE,
     version=settings.API_VERSION,
-    description="SIFT API - AI misinformation prevention & fact-checking"
+    description="SIFT API - AI misinformation prevention & fact-checking",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Get CORS origins and log them for debugging
@@ -31,6 +68,21 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Compress responses (the extension is often used on mobile data)
+if settings.RESPONSE_COMPRESSION != "off":
+    compression = None
+    if settings.RESPONSE_COMPRESSION == "auto":
+        try:
+            # Optional dependency; negotiates br and falls back to gzip for other clients
+            from brotli_asgi import BrotliMiddleware
+            compression = BrotliMiddleware
+        except ImportError:
+            pass
+    if compression is None:
+        compression = GZipMiddleware
+    app.add_middleware(compression, minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES)
+    logger.info(f"Response compression: {compression.__name__}")
+
 # Include routers
 app.include_router(analyze.router, prefix=settings.API_PREFIX, tags=["analysis"])
 
@@ -66,9 +118,21 @@ async def health():
         "status": "healthy",
         "cors_configured": len(settings.cors_origins) > 0,
         "cors_origins_count": len(settings.cors_origins),
+        "circuit_breakers": breaker_states(),
+        # Analysis pipelines running and queued for a slot in this worker
+        "admission": get_admission_controller().state(),
+        "startup": startup_report.as_dict(),
+        # Gemini calls, latency, tokens and estimated cost per task since startup
+        "llm_usage": llm_usage_report(),
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics: stage latencies, upstream calls, cache hit ratios, in-flight requests."""
+    return Response(content=render_metrics(), headers={"Content-Type": METRICS_CONTENT_TYPE})
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host=settings.HOST, port=settings.PORT)
@@ -0,0 +1,188 @@
+"""Typed records passed between the pipeline stages.
+
+Slotted dataclasses: no per-instance __dict__, attribute access instead of
+dict lookups, and one object per item that stages update in place. The LLM
+records carry the Gemini ``responseSchema`` their JSON is constrained to and
+a ``from_json`` that coerces a parsed reply into the record.
+"""
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional
+
+# Evidence sources
+FACT_CHECK_API = "fact_check_api"
+CUSTOM_SEARCH = "google_custom_search"
+
+
+def _as_float(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_str(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+@dataclass(slots=True)
+class Claim:
+    """A checkable claim extracted from the input text."""
+
+    claim: str
+    type: str = "general"
+    confidence: float = 0.0
+
+    RESPONSE_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "OBJECT",
+        "properties": {
+            "claims": {
+                "type": "ARRAY",
+                "items": {
+                    "type": "OBJECT",
+                    "properties": {
+                        "claim": {"type": "STRING"},
+                        "type": {"type": "STRING"},
+                        "confidence": {"type": "NUMBER"},
+                    },
+                    "required": ["claim", "type", "confidence"],
+                },
+            },
+        },
+        "required": ["claims"],
+    }
+
+    @classmethod
+    def from_json(cls, data: Any) -> Optional["Claim"]:
+        """Claim from one parsed item, or None if it has no claim text."""
+        if isinstance(data, str):
+            data = {"claim": data}
+        if not isinstance(data, dict) or not _as_str(data.get("claim")).strip():
+            return None
+        return cls(
+            claim=data["claim"].strip(),
+            type=_as_str(data.get("type")) or "general",
+            confidence=_as_float(data.get("confidence")),
+        )
+
+    @classmethod
+    def list_from_json(cls, data: Any) -> List["Claim"]:
+        """Claims from a parsed {"claims": [...]} object or bare array."""
+        items = data.get("claims", []) if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            return []
+        return [claim for claim in map(cls.from_json, items) if claim is not None]
+
+
+@dataclass(slots=True)
+class Evidence:
+    """A search result, enriched by the crawl and ranking stages."""
+
+    url: str
+    title: str = ""
+    snippet: str = ""
+    source: str = ""
+    # Fact Check API results only
+    textual_rating: str = ""
+    claim_original: str = ""
+    fact_check_reviews: List[str] = field(default_factory=list)
+    # Set by the crawl stage
+    crawled_text: str = ""
+    # Set by deduplication: other URLs carrying the same text
+    alternate_citations: List[str] = field(default_factory=list)
+    # Set by EvidenceRanker.rank_by_relevance
+    relevance_score: float = 0.0
+    source_priority: float = 0.0
+    final_score: float = 0.0
+    is_authoritative: bool = False
+
+
+@dataclass(slots=True)
+class CrawledPage:
+    """Content fetched and extracted from a URL."""
+
+    url: str
+    title: str = ""
+    description: str = ""
+    text: str = ""
+    # Content blocks in page order, for incremental re-analysis
+    paragraphs: List[str] = field(default_factory=list)
+    status_code: int = 0
+    content_type: str = "html"
+
+
+@dataclass(slots=True)
+class Verdict:
+    """Gemini's verdict on a claim given the top-ranked evidence."""
+
+    verdict: str = "unverified"
+    confidence: float = 0.0
+    explanation: str = ""
+    evidence: str = ""
+
+    VERDICTS: ClassVar[tuple] = ("true", "false", "partially_true", "unverified")
+    RESPONSE_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "OBJECT",
+        "properties": {
+            "verdict": {"type": "STRING", "enum": list(VERDICTS)},
+            "confidence": {"type": "NUMBER"},
+            "explanation": {"type": "STRING"},
+            "evidence": {"type": "STRING"},
+        },
+        "required": ["verdict", "confidence", "explanation", "evidence"],
+    }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Verdict":
+        """Verdict from a parsed reply; unknown verdicts become "unverified"."""
+        verdict = _as_str(data.get("verdict")).lower()
+        return cls(
+            verdict=verdict if verdict in cls.VERDICTS else "unverified",
+            confidence=min(max(_as_float(data.get("confidence")), 0.0), 1.0),
+            explanation=_as_str(data.get("explanation")),
+            evidence=_as_str(data.get("evidence")),
+        )
+
+
+@dataclass(slots=True)
+class FinalVerdict:
+    """Gemini's 0-100 truth score and label over all gathered evidence."""
+
+    score: int = 50
+    verdict: str = "UNCERTAIN"
+    confidence: str = "low"
+    reasoning: str = ""
+    citations: List[str] = field(default_factory=list)
+
+    VERDICTS: ClassVar[Dict[str, str]] = {
+        "TRUE": "TRUE",
+        "LIKELY_TRUE": "LIKELY_TRUE",
+        "UNCERTAIN": "UNCERTAIN",
+        "MIXED": "UNCERTAIN",
+        "LIKELY_FALSE": "LIKELY_FALSE",
+        "FALSE": "FALSE",
+    }
+    CONFIDENCES: ClassVar[tuple] = ("high", "medium", "low")
+    RESPONSE_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "OBJECT",
+        "properties": {
+            "score": {"type": "INTEGER"},
+            "verdict": {"type": "STRING", "enum": ["TRUE", "LIKELY_TRUE", "UNCERTAIN", "LIKELY_FALSE", "FALSE"]},
+            "confidence": {"type": "STRING", "enum": list(CONFIDENCES)},
+            "reasoning": {"type": "STRING"},
+            "citations": {"type": "ARRAY", "items": {"type": "STRING"}},
+        },
+        "required": ["score", "verdict", "confidence", "reasoning", "citations"],
+    }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "FinalVerdict":
+        """Final verdict from a parsed reply, clamped and normalized."""
+        confidence = _as_str(data.get("confidence")).lower()
+        citations = data.get("citations")
+        return cls(
+            score=max(0, min(100, int(_as_float(data.get("score"), 50)))),
+            verdict=cls.VERDICTS.get(_as_str(data.get("verdict")).upper(), "UNCERTAIN"),
+            confidence=confidence if confidence in cls.CONFIDENCES else "medium",
+            reasoning=_as_str(data.get("reasoning")),
+            citations=[c for c in citations if isinstance(c, str)][:5] if isinstance(citations, list) else [],
+        )
@@ -1,8 +1,14 @@
 """Routes for text analysis and fact-checking."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Literal
+from ..services.admission import ServiceOverloaded
 from ..services.factcheck_service import FactCheckService
+from ..services.rate_limiter import request_priority
+from ..services.metrics import REQUESTS_IN_FLIGHT
+from ..services.http_transport import record_workload_input
+from ..services.responses import BOILERPLATE, BOILERPLATE_VERSION, compact_response
 
 router = APIRouter()
 
@@ -11,15 +17,52 @@ class AnalyzeRequest(BaseModel):
     """Request model for text analysis."""
     text: str = Field(..., description="Text to analyze and fact-check", min_length=10)
     url: Optional[str] = Field(None, description="Optional URL source of the text")
+    deadline_seconds: Optional[float] = Field(
+        None, gt=0, le=300, description="Time budget for the whole analysis; defaults to REQUEST_DEADLINE_SECONDS"
+    )
+    priority: Literal["interactive", "batch"] = Field(
+        "interactive", description="Queue priority for outbound API calls; batch work yields to interactive requests"
+    )
+    compact: bool = Field(
+        False, description="Compact response: boilerplate and repeated text replaced by references (see /boilerplate)"
+    )
+    mode: Optional[Literal["fast", "balanced", "thorough"]] = Field(
+        None, description="Analysis mode (latency/quality tier, see ANALYSIS_MODES); defaults to ANALYSIS_MODE"
+    )
 
 
 class AnalyzeURLRequest(BaseModel):
     """Request model for URL analysis."""
     url: str = Field(..., description="URL to analyze and fact-check")
+    deadline_seconds: Optional[float] = Field(
+        None, gt=0, le=300, description="Time budget for the whole analysis; defaults to REQUEST_DEADLINE_SECONDS"
+    )
+    priority: Literal["interactive", "batch"] = Field(
+        "interactive", description="Queue priority for outbound API calls; batch work yields to interactive requests"
+    )
+    compact: bool = Field(
+        False, description="Compact response: boilerplate and repeated text replaced by references (see /boilerplate)"
+    )
+    mode: Optional[Literal["fast", "balanced", "thorough"]] = Field(
+        None, description="Analysis mode (latency/quality tier, see ANALYSIS_MODES); defaults to ANALYSIS_MODE"
+    )
 
 
-# Initialize service
-factcheck_service = FactCheckService()
+# Service is built on first use (or by the startup warm-up), not at import
+_factcheck_service: Optional[FactCheckService] = None
+
+
+def get_factcheck_service() -> FactCheckService:
+    """Shared FactCheckService instance."""
+    global _factcheck_service
+    if _factcheck_service is None:
+        _factcheck_service = FactCheckService()
+    return _factcheck_service
+
+
+def _overloaded(error: ServiceOverloaded) -> HTTPException:
+    """503 telling the client when to retry."""
+    return HTTPException(status_code=503, detail=str(error), headers={"Retry-After": str(error.retry_after)})
 
 
 @router.post("/analyze")
@@ -28,9 +71,18 @@ async def analyze(request: AnalyzeRequest):
     
     Returns structured JSON with claims, verdicts, confidence scores, explanations, and citations.
     """
+    record_workload_input("text", request.model_dump())
     try:
-        result = await factcheck_service.analyze_text(request.text, request.url)
-        return result
+        with REQUESTS_IN_FLIGHT.labels("analyze").track_inprogress(), request_priority(request.priority):
+            result = await get_factcheck_service().analyze_text(
+                request.text, request.url, request.deadline_seconds, request.mode
+            )
+        if request.compact:
+            result = compact_response(result)
+        # Results are plain JSON types: serialize directly, skipping jsonable_encoder
+        return ORJSONResponse(result)
+    except ServiceOverloaded as e:
+        raise _overloaded(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -44,17 +96,36 @@ async def analyze_url(request: AnalyzeURLRequest):
     
     Returns structured JSON with claims, verdicts, confidence scores, explanations, and citations.
     """
+    record_workload_input("url", request.model_dump())
     try:
-        result = await factcheck_service.factcheck_url(request.url)
+        with REQUESTS_IN_FLIGHT.labels("analyze_url").track_inprogress(), request_priority(request.priority):
+            result = await get_factcheck_service().factcheck_url(
+                request.url, request.deadline_seconds, request.mode
+            )
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
-        return result
+        if request.compact:
+            result = compact_response(result)
+        return ORJSONResponse(result)
     except HTTPException:
         raise
+    except ServiceOverloaded as e:
+        raise _overloaded(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/boilerplate")
+async def boilerplate(response: Response):
+    """Static texts (methodology, limitations) referenced by compact responses.
+    
+    Cacheable: the version changes whenever a text changes.
+    """
+    response.headers["Cache-Control"] = "public, max-age=86400"
+    response.headers["ETag"] = f'"{BOILERPLATE_VERSION}"'
+    return {"version": BOILERPLATE_VERSION, "texts": BOILERPLATE}
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -0,0 +1,150 @@
+"""Service for admission control of analysis pipelines (bounded concurrency and wait queue)."""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+from ..config import settings
+from ..services.deadline import stage_timeout
+from ..services.metrics import ADMISSION_QUEUE_DEPTH, ADMISSION_WAIT, record_admission
+
+logger = logging.getLogger(__name__)
+
+# Assumed pipeline duration until one has been measured
+_INITIAL_DURATION_SECONDS = 5.0
+# Weight of the newest pipeline duration in the moving average
+_DURATION_EWMA_ALPHA = 0.2
+_MAX_RETRY_AFTER_SECONDS = 120
+
+# Set while the current task (and the tasks it starts) holds a pipeline slot
+_holding_slot: ContextVar[bool] = ContextVar("sift_admission_slot", default=False)
+
+
+class ServiceOverloaded(Exception):
+    """Raised when a pipeline is not admitted; ``retry_after`` is a hint in whole seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Service overloaded ({reason}), retry in {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """At most ``max_in_flight`` pipelines at once; a bounded FIFO queue waits for a slot.
+
+    A request is rejected at once when the queue is full, and after
+    ``queue_timeout`` seconds (or what is left of its deadline) in the queue.
+    Rejections are cheap, so an overloaded worker sheds the excess instead of
+    slowing every request down until they all time out. A freed slot is
+    handed straight to the oldest waiter, so arrivals cannot overtake the queue.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int, queue_timeout: float):
+        """Initialize controller; ``max_in_flight`` of 0 admits everything."""
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._mean_duration = _INITIAL_DURATION_SECONDS
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until a retry is likely to be admitted: the queue ahead drained at the current rate."""
+        if not self.max_in_flight:
+            return 1
+        waves = (len(self._waiters) + 1) / self.max_in_flight
+        return min(_MAX_RETRY_AFTER_SECONDS, max(1, math.ceil(waves * self._mean_duration)))
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a pipeline slot for the enclosed block; raises ServiceOverloaded if none comes free.
+
+        Nested admissions reuse the slot already held, so a URL request
+        admitted before fetching its page runs the analysis in the same slot.
+        """
+        if not self.max_in_flight or _holding_slot.get():
+            yield
+            return
+        await self._acquire()
+        token = _holding_slot.set(True)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            _holding_slot.reset(token)
+            duration = time.monotonic() - started
+            self._mean_duration += _DURATION_EWMA_ALPHA * (duration - self._mean_duration)
+            self._release()
+
+    async def _acquire(self) -> None:
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            record_admission("admitted")
+            return
+        if len(self._waiters) >= self.max_queue:
+            record_admission("rejected_queue_full")
+            raise ServiceOverloaded("queue full", self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), stage_timeout(self.queue_timeout))
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended; pass it on
+                self._release()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            record_admission("rejected_timeout")
+            raise ServiceOverloaded("queue timeout", self.retry_after())
+        ADMISSION_WAIT.observe(time.monotonic() - started)
+        record_admission("queued")
+
+    def _release(self) -> None:
+        """Hand the slot to the oldest waiter, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+            if not waiter.done():
+                # in_flight is unchanged: the slot moves to the waiter
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def state(self) -> Dict[str, Any]:
+        """Current occupancy, for the health endpoint."""
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queue_depth": len(self._waiters),
+            "max_queue": self.max_queue,
+            "mean_pipeline_seconds": round(self._mean_duration, 2),
+        }
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Process-wide admission controller for analysis pipelines."""
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController(
+            settings.ADMISSION_MAX_IN_FLIGHT,
+            settings.ADMISSION_MAX_QUEUE,
+            settings.ADMISSION_QUEUE_TIMEOUT_SECONDS
+        )
+    return _controller
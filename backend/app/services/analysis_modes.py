@@ -0,0 +1,47 @@
+"""Named analysis modes that trade result quality for latency (fast, balanced, thorough)."""
+from dataclasses import dataclass
+from typing import Optional
+from ..config import settings
+
+# Verdict paths: "full" asks Gemini for a verdict and a final verdict over all evidence,
+# "single" only for the verdict, "ratings" makes no Gemini call and reads fact-check ratings
+VERDICT_PATHS = ("full", "single", "ratings")
+
+
+@dataclass(frozen=True)
+class AnalysisProfile:
+    """Per-request limits of the fact-checking pipeline."""
+
+    name: str
+    max_claims: int = 5
+    max_queries: int = 3
+    # Sources crawled per claim; 0 skips crawling and uses search snippets (None in
+    # ANALYSIS_MODES follows CRAWL_MAX_SOURCES)
+    max_crawl_sources: int = 10
+    max_evidence: int = 10
+    translate: bool = True
+    verdict: str = "full"
+    # "llm" or "local"; None follows QUERY_STRATEGY
+    query_strategy: Optional[str] = None
+    # None follows REQUEST_DEADLINE_SECONDS
+    deadline_seconds: Optional[float] = None
+
+    @property
+    def crawl(self) -> bool:
+        """Whether evidence sources are crawled."""
+        return self.max_crawl_sources > 0
+
+
+def get_analysis_profile(mode: Optional[str] = None) -> AnalysisProfile:
+    """Profile of a mode named in ANALYSIS_MODES (ANALYSIS_MODE when not given)."""
+    name = mode or settings.ANALYSIS_MODE
+    try:
+        values = dict(settings.ANALYSIS_MODES[name])
+    except KeyError:
+        raise ValueError(f"Unknown analysis mode: {name}")
+    if values.get("max_crawl_sources") is None:
+        values["max_crawl_sources"] = settings.CRAWL_MAX_SOURCES
+    profile = AnalysisProfile(name=name, **values)
+    if profile.verdict not in VERDICT_PATHS:
+        raise ValueError(f"Unknown verdict path for analysis mode {name}: {profile.verdict}")
+    return profile
@@ -0,0 +1,108 @@
+"""Local check-worthiness scoring of sentences, run before LLM claim extraction.
+
+A sentence is worth checking when it asserts something verifiable: numbers,
+dates, named entities, causal or statistical language. Questions, first-person
+opinions, subjective reactions and short fragments score low. Scoring is a
+handful of precompiled regexes per sentence, so a selection with nothing to
+check is answered without a Gemini call.
+"""
+import re
+from typing import Dict, List, Pattern, Tuple
+
+# Claim-type patterns, shared with ClaimExtractor's pattern fallback
+CLAIM_TYPE_PATTERNS: Dict[str, Pattern] = {
+    "statistical": re.compile(
+        r'\d+%|\d+\s+(percent|percentage|million|billion)|(studies|research|data)\s+(show|indicate|suggest)',
+        re.IGNORECASE
+    ),
+    "historical": re.compile(
+        r'(in|on|during)\s+\d{4}|(happened|occurred|took place)\s+(in|on)',
+        re.IGNORECASE
+    ),
+    "scientific": re.compile(
+        r'(research|study|scientists)\s+(find|found|discover)|(proven|proves|evidence)\s+(that|shows)',
+        re.IGNORECASE
+    ),
+}
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?।])\s+')
+
+_NUMBER = re.compile(
+    r'\d|\b(one|two|three|four|five|six|seven|eight|nine|ten|hundred|thousand|million|billion|trillion|'
+    r'percent|half|twice|double|triple|dozen)\b',
+    re.IGNORECASE
+)
+_ASSERTION = re.compile(
+    r"\b(is|are|was|were|has|have|had|will|can|does|did|contains?|became|remains?|"
+    r"says?|said|claims?|claimed|reports?|reported|announced|approved|banned|killed|died|born|"
+    r"founded|launched|won|lost|rose|fell|grew|increased|decreased|reached|passed|owns?|"
+    r"\w+ed)\b",
+    re.IGNORECASE
+)
+_CAUSAL = re.compile(
+    r"\b(causes?|caused|leads? to|led to|linked to|cures?|cured|prevents?|prevented|kills?|"
+    r"increases? the risk|reduces?|reduced|spreads?|proves?|proved|confirms?|confirmed)\b",
+    re.IGNORECASE
+)
+_ABSOLUTE = re.compile(
+    r"\b(most|least|largest|smallest|highest|lowest|first|last|only|every|never|always|all|none|"
+    r"more than|less than|fewer than|record)\b",
+    re.IGNORECASE
+)
+# Capitalized word after the first one (names, places, organizations); "I" excluded
+_PROPER_NOUN = re.compile(r"(?<!^)(?<![.!?]\s)\b(?!I\b)[A-Z][a-zA-Z]+")
+_OPINION = re.compile(
+    r"\b(i|we) (think|believe|feel|guess|hope|wish|love|hate|like|prefer)\b|\bin my (opinion|view)\b|"
+    r"\b(imo|imho|personally)\b|\bi'm (sure|glad|sorry|not sure)\b",
+    re.IGNORECASE
+)
+_SUBJECTIVE = re.compile(
+    r"\b(amazing|awesome|cool|great|terrible|horrible|beautiful|ugly|cute|nice|boring|fun|funny|"
+    r"delicious|disgusting|stupid|lol|wow|omg|yay|sad|happy|love|hate)\b",
+    re.IGNORECASE
+)
+_RECOMMENDATION = re.compile(r"\b(should|ought to|let's|please)\b", re.IGNORECASE)
+
+
+def score_sentence(sentence: str) -> float:
+    """Check-worthiness of one sentence, 0 (nothing to check) to 1."""
+    sentence = sentence.strip()
+    if len(sentence.split()) < 3 or sentence.endswith("?"):
+        return 0.0
+
+    score = 0.0
+    if _ASSERTION.search(sentence):
+        score += 0.2
+    if _NUMBER.search(sentence):
+        score += 0.3
+    if any(pattern.search(sentence) for pattern in CLAIM_TYPE_PATTERNS.values()):
+        score += 0.3
+    if _CAUSAL.search(sentence):
+        score += 0.3
+    if _PROPER_NOUN.search(sentence):
+        score += 0.15
+    if _ABSOLUTE.search(sentence):
+        score += 0.1
+    if _OPINION.search(sentence):
+        score -= 0.4
+    if _SUBJECTIVE.search(sentence):
+        score -= 0.3
+    if _RECOMMENDATION.search(sentence):
+        score -= 0.2
+    return min(max(score, 0.0), 1.0)
+
+
+class CheckWorthinessFilter:
+    """Select the sentences of a text worth sending to claim extraction."""
+
+    def __init__(self, threshold: float = 0.2):
+        """Initialize filter; sentences scoring at least ``threshold`` pass."""
+        self.threshold = threshold
+
+    def score(self, text: str) -> List[Tuple[str, float]]:
+        """(sentence, score) for every sentence of the text."""
+        return [(s, score_sentence(s)) for s in SENTENCE_SPLIT.split(text.strip()) if s.strip()]
+
+    def select(self, text: str) -> List[str]:
+        """Sentences that pass the threshold, in text order."""
+        return [sentence for sentence, score in self.score(text) if score >= self.threshold]
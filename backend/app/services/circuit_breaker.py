@@ -0,0 +1,140 @@
+"""Circuit breakers for upstream dependencies (Gemini, Google APIs, crawled hosts)."""
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the upstream's breaker is open."""
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one upstream.
+
+    - closed: calls pass; ``failure_threshold`` consecutive failures open it.
+    - open: calls are refused until ``recovery_timeout`` seconds have passed.
+    - half_open: a single probe call is let through; its success closes the
+      breaker, its failure re-opens it for another ``recovery_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: Optional[int] = None, recovery_timeout: Optional[float] = None):
+        """Initialize circuit breaker."""
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or settings.CIRCUIT_RECOVERY_SECONDS
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker turns half-open once its timeout elapses."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_started = None
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a call may be made now."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN:
+            now = time.monotonic()
+            # One probe at a time; a probe that never reported back is replaced
+            if self._probe_started is None or now - self._probe_started >= self.recovery_timeout:
+                self._probe_started = now
+                return True
+        return False
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if a call may not be made now."""
+        if not self.allow_request():
+            raise CircuitOpenError(f"Circuit breaker '{self.name}' is open")
+
+    def record_success(self) -> None:
+        """Record a healthy response from the upstream."""
+        if self._state != self.CLOSED:
+            logger.info(f"Circuit breaker '{self.name}' closed")
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Record a failed call (timeout, connection error, 5xx, exhausted 429)."""
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                logger.warning(f"Circuit breaker '{self.name}' opened after {self._failures} consecutive failures")
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probe_started = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being refused."""
+        return self.state == self.OPEN
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State summary for the health endpoint."""
+        state = self.state
+        info = {"state": state, "consecutive_failures": self._failures}
+        if state == self.OPEN:
+            info["retry_in_seconds"] = round(max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)), 1)
+        return info
+
+
+def is_failure_status(status_code: int) -> bool:
+    """Whether an HTTP status means the upstream itself is unhealthy."""
+    return status_code >= 500 or status_code == 429
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_host_breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the shared breaker for an upstream ("gemini", "factcheck", ...)."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(name)
+        _breakers[name] = breaker
+    return breaker
+
+
+def get_host_breaker(host: str) -> CircuitBreaker:
+    """Return the crawler breaker for a host (least recently used hosts are evicted)."""
+    host = host.lower()
+    breaker = _host_breakers.get(host)
+    if breaker is None:
+        breaker = CircuitBreaker(f"crawler:{host}")
+        _host_breakers[host] = breaker
+        if len(_host_breakers) > settings.CRAWLER_HOST_BREAKERS_MAX:
+            _host_breakers.popitem(last=False)
+    else:
+        _host_breakers.move_to_end(host)
+    return breaker
+
+
+def breaker_states() -> Dict[str, Any]:
+    """Snapshot of upstream breakers plus crawler hosts that are not closed."""
+    states = {name: breaker.snapshot() for name, breaker in _breakers.items()}
+    tripped_hosts = {
+        host: breaker.snapshot()
+        for host, breaker in _host_breakers.items()
+        if breaker.state != CircuitBreaker.CLOSED
+    }
+    states["crawler"] = {
+        "tracked_hosts": len(_host_breakers),
+        "tripped_hosts": tripped_hosts,
+    }
+    return states
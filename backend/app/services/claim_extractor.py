@@ -1,9 +1,16 @@
 """Service for extracting claims from text."""
 import re
-from typing import List, Dict, Any
+import logging
+from typing import AsyncIterator, List, Optional
+from ..config import settings
+from ..models import Claim
+from ..services.checkworthiness import CLAIM_TYPE_PATTERNS, CheckWorthinessFilter
+from ..services.metrics import CHECKWORTHINESS_DECISIONS
 from ..services.utils import clean_text
 from ..services.llm_analyzer import LLMAnalyzer
 
+logger = logging.getLogger(__name__)
+
 
 class ClaimExtractor:
     """Extract factual claims from text using LLM."""
@@ -11,17 +18,95 @@ class ClaimExtractor:
     def __init__(self, llm_analyzer: LLMAnalyzer):
         """Initialize claim extractor."""
         self.llm_analyzer = llm_analyzer
+        self.checkworthiness = CheckWorthinessFilter(settings.CHECKWORTHINESS_THRESHOLD)
     
-    async def extract_claims(self, text: str) -> List[Dict[str, Any]]:
-        """Extract factual claims from text."""
+    async def extract_claims(self, text: str, english: bool = True) -> List[Claim]:
+        """Extract factual claims from text; ``english`` is False for untranslated non-English text."""
         if not text or len(text.strip()) < 10:
             return []
         
         # Clean text
         cleaned_text = clean_text(text)
+        extraction_text = self._prefilter(cleaned_text, english)
+        if extraction_text is None:
+            return []
         
         # Use LLM to extract claims
-        prompt = f"""Analyze the following text and extract all factual claims that can be fact-checked.
+        prompt = self._build_prompt(extraction_text)
+        
+        try:
+            response = await self.llm_analyzer.analyze(
+                prompt, response_format="json", task="claim_extraction", response_schema=Claim.RESPONSE_SCHEMA
+            )
+            if (isinstance(response, dict) and "claims" in response) or isinstance(response, list):
+                return Claim.list_from_json(response)
+        except Exception as e:
+            logger.warning(f"Error extracting claims, using pattern fallback: {e}")
+        
+        # Fallback: simple pattern-based extraction
+        return self._extract_claims_fallback(cleaned_text)
+    
+    async def stream_claims(self, text: str, english: bool = True) -> AsyncIterator[Claim]:
+        """Yield claims as Gemini streams them, so checking can start before extraction ends.
+        
+        ``english`` is as in extract_claims. Falls back to pattern extraction if the stream fails before any claim
+        arrived; a stream interrupted later ends with the claims received.
+        """
+        if not text or len(text.strip()) < 10:
+            return
+        
+        cleaned_text = clean_text(text)
+        extraction_text = self._prefilter(cleaned_text, english)
+        if extraction_text is None:
+            return
+        
+        received = 0
+        try:
+            async for item in self.llm_analyzer.stream_json_items(
+                self._build_prompt(extraction_text), task="claim_extraction", response_schema=Claim.RESPONSE_SCHEMA
+            ):
+                claim = Claim.from_json(item)
+                if claim is not None:
+                    received += 1
+                    yield claim
+            return
+        except Exception as e:
+            if received:
+                logger.warning(f"Claim stream interrupted after {received} claims: {e}")
+                return
+            logger.warning(f"Error streaming claims, using pattern fallback: {e}")
+        
+        for claim in self._extract_claims_fallback(cleaned_text):
+            yield claim
+    
+    def _prefilter(self, cleaned_text: str, english: bool = True) -> Optional[str]:
+        """Text to send to the LLM, or None when no sentence is worth checking.
+        
+        CHECKWORTHINESS_FILTER "skip" only drops texts with nothing to check;
+        "trim" also sends just the sentences that pass; "off" sends everything.
+        The scorer only knows English, so non-English text (translation skipped
+        or unavailable) is always sent whole.
+        """
+        mode = settings.CHECKWORTHINESS_FILTER
+        if mode == "off" or not english:
+            return cleaned_text
+        
+        selected = self.checkworthiness.select(cleaned_text)
+        if not selected:
+            CHECKWORTHINESS_DECISIONS.labels("skipped").inc()
+            logger.debug(f"No check-worthy sentence, skipping claim extraction: {cleaned_text[:50]}...")
+            return None
+        if mode == "trim":
+            trimmed = " ".join(selected)
+            if len(trimmed) < len(cleaned_text):
+                CHECKWORTHINESS_DECISIONS.labels("trimmed").inc()
+                return trimmed
+        CHECKWORTHINESS_DECISIONS.labels("passed").inc()
+        return cleaned_text
+    
+    def _build_prompt(self, cleaned_text: str) -> str:
+        """Claim extraction prompt."""
+        return f"""Analyze the following text and extract all factual claims that can be fact-checked.
         
         A claim is a statement that can be verified as true or false. Focus on:
         - Statistical statements
@@ -39,55 +124,21 @@ class ClaimExtractor:
         - "confidence": confidence score (0-1)
         
         Format: {{"claims": [{{"claim": "...", "type": "...", "confidence": 0.9}}]}}"""
-        
-        try:
-            response = await self.llm_analyzer.analyze(prompt, response_format="json")
-            if isinstance(response, dict) and "claims" in response:
-                return response["claims"]
-            elif isinstance(response, list):
-                return response
-        except Exception as e:
-            print(f"Error extracting claims: {e}")
-        
-        # Fallback: simple pattern-based extraction
-        return self._extract_claims_fallback(cleaned_text)
     
-    def _extract_claims_fallback(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_claims_fallback(self, text: str) -> List[Claim]:
         """Fallback claim extraction using patterns."""
         claims = []
         
-        # Patterns for common claim types
-        patterns = {
-            "statistical": [
-                r'\d+%',
-                r'\d+\s+(percent|percentage|million|billion)',
-                r'(studies|research|data)\s+(show|indicate|suggest)',
-            ],
-            "historical": [
-                r'(in|on|during)\s+\d{4}',
-                r'(happened|occurred|took place)\s+(in|on)',
-            ],
-            "scientific": [
-                r'(research|study|scientists)\s+(find|found|discover)',
-                r'(proven|proves|evidence)\s+(that|shows)',
-            ]
-        }
-        
         sentences = re.split(r'[.!?]\s+', text)
         for sentence in sentences:
             sentence = sentence.strip()
             if len(sentence) < 20:
                 continue
             
-            for claim_type, patterns_list in patterns.items():
-                for pattern in patterns_list:
-                    if re.search(pattern, sentence, re.IGNORECASE):
-                        claims.append({
-                            "claim": sentence,
-                            "type": claim_type,
-                            "confidence": 0.5
-                        })
-                        break
+            # Patterns for common claim types
+            for claim_type, pattern in CLAIM_TYPE_PATTERNS.items():
+                if pattern.search(sentence):
+                    claims.append(Claim(sentence, claim_type, 0.5))
         
         return claims[:10]  # Limit to top 10 claims
 
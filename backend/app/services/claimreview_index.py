@@ -0,0 +1,269 @@
+"""Local full-text index of ClaimReview records, searched before the Fact Check Tools API.
+
+Records are stored as the Fact Check Tools API returns them (a claim with its
+``claimReview`` list) in SQLite, with an FTS5 index over the claim text and
+review titles. Every API response is added as it arrives, and dumps can be
+bulk-loaded from the command line:
+
+    python -m app.services.claimreview_index dump.jsonl [more.json ...]
+
+Dumps may hold API responses ({"claims": [...]}), API claim objects, or
+schema.org ClaimReview objects (including the DataFeed format), as JSON or
+JSON lines.
+"""
+import hashlib
+import logging
+import sqlite3
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import orjson
+from ..config import settings
+from ..services.relevance import query_terms, tokenize
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS claim_reviews (
+    id INTEGER PRIMARY KEY,
+    claim_key TEXT UNIQUE NOT NULL,
+    text TEXT NOT NULL,
+    claim_json BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS claim_reviews_fts USING fts5(
+    text, content='claim_reviews', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS claim_reviews_ai AFTER INSERT ON claim_reviews BEGIN
+    INSERT INTO claim_reviews_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS claim_reviews_ad AFTER DELETE ON claim_reviews BEGIN
+    INSERT INTO claim_reviews_fts(claim_reviews_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS claim_reviews_au AFTER UPDATE OF text ON claim_reviews BEGIN
+    INSERT INTO claim_reviews_fts(claim_reviews_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO claim_reviews_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TABLE IF NOT EXISTS searched_queries (
+    query_key TEXT PRIMARY KEY,
+    searched_at REAL NOT NULL
+);
+"""
+
+# Candidates fetched from FTS5 per requested result, before the term coverage filter
+_CANDIDATES_PER_RESULT = 4
+
+
+def _claim_key(claim: Dict[str, Any]) -> str:
+    """Identity of a claim record: its text and first review URL."""
+    reviews = claim.get("claimReview") or [{}]
+    key = f"{claim.get('text', '').strip().casefold()}\x1f{reviews[0].get('url', '')}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _indexed_text(claim: Dict[str, Any]) -> str:
+    """Claim text plus review titles (which often restate the claim)."""
+    titles = [review.get("title", "") for review in claim.get("claimReview", []) if review.get("title")]
+    return " ".join([claim.get("text", "")] + titles)
+
+
+class ClaimReviewIndex:
+    """SQLite FTS5 index of ClaimReview records with per-record freshness."""
+
+    def __init__(self, path: str, ttl_seconds: float, min_match: float = 0.6):
+        """Open (or create) the index at ``path``."""
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.min_match = min_match
+        # Only used from the event loop thread; queries take well under a millisecond
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._conn.execute("DELETE FROM searched_queries WHERE searched_at < ?", (time.time() - ttl_seconds,))
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM claim_reviews").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def add_claims(self, claims: Iterable[Dict[str, Any]], fetched_at: Optional[float] = None) -> int:
+        """Insert or refresh API claim records; returns how many were written."""
+        fetched_at = fetched_at or time.time()
+        rows = [
+            (_claim_key(claim), _indexed_text(claim), orjson.dumps(claim), fetched_at)
+            for claim in claims
+            if isinstance(claim, dict) and claim.get("text") and claim.get("claimReview")
+        ]
+        if not rows:
+            return 0
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO claim_reviews (claim_key, text, claim_json, fetched_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(claim_key) DO UPDATE SET "
+                "text = excluded.text, claim_json = excluded.claim_json, fetched_at = excluded.fetched_at",
+                rows
+            )
+        return len(rows)
+
+    def search(self, query: str, limit: int = 5) -> Tuple[List[Dict[str, Any]], bool]:
+        """Claim records matching the query, and whether all of them are fresh.
+
+        A record matches when it contains at least ``min_match`` of the
+        query's content terms. Matches are ordered by term coverage, then BM25.
+        """
+        terms = query_terms(query)
+        if not terms:
+            return [], True
+        match = " OR ".join(f'"{term}"' for term in terms)
+        rows = self._conn.execute(
+            "SELECT c.text, c.claim_json, c.fetched_at FROM claim_reviews_fts "
+            "JOIN claim_reviews c ON c.id = claim_reviews_fts.rowid "
+            "WHERE claim_reviews_fts MATCH ? ORDER BY bm25(claim_reviews_fts) LIMIT ?",
+            (match, limit * _CANDIDATES_PER_RESULT)
+        ).fetchall()
+
+        wanted = set(terms)
+        matches = []
+        for rank, (text, claim_json, fetched_at) in enumerate(rows):
+            coverage = len(wanted.intersection(tokenize(text))) / len(wanted)
+            if coverage >= self.min_match:
+                matches.append((-coverage, rank, claim_json, fetched_at))
+        matches.sort()
+        matches = matches[:limit]
+        stale_before = time.time() - self.ttl_seconds
+        fresh = all(fetched_at >= stale_before for _, _, _, fetched_at in matches)
+        return [orjson.loads(claim_json) for _, _, claim_json, _ in matches], fresh
+
+    def mark_searched(self, query: str) -> None:
+        """Remember that the API had no records for this query (so the miss can be answered locally)."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searched_queries (query_key, searched_at) VALUES (?, ?)",
+                (" ".join(query_terms(query)), time.time())
+            )
+
+    def recently_searched(self, query: str) -> bool:
+        """Whether the API had no records for this query within the TTL."""
+        row = self._conn.execute(
+            "SELECT searched_at FROM searched_queries WHERE query_key = ?", (" ".join(query_terms(query)),)
+        ).fetchone()
+        return row is not None and row[0] >= time.time() - self.ttl_seconds
+
+    def load_dump(self, path: str, batch_size: int = 5000) -> int:
+        """Bulk-load a ClaimReview dump; returns the number of records written."""
+        loaded = 0
+        batch: List[Dict[str, Any]] = []
+        for claim in claims_from_dump(path):
+            batch.append(claim)
+            if len(batch) >= batch_size:
+                loaded += self.add_claims(batch)
+                batch = []
+        loaded += self.add_claims(batch)
+        return loaded
+
+
+def claims_from_dump(path: str) -> Iterator[Dict[str, Any]]:
+    """API claim records from a JSON or JSON lines dump."""
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        documents = [orjson.loads(data)]
+    except orjson.JSONDecodeError:
+        documents = [orjson.loads(line) for line in data.splitlines() if line.strip()]
+    for document in documents:
+        yield from _claims_in(document)
+
+
+def _claims_in(data: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _claims_in(item)
+    elif isinstance(data, dict):
+        if "claimReview" in data:
+            yield data
+        elif "claimReviewed" in data:
+            claim = _from_schema_org(data)
+            if claim:
+                yield claim
+        elif "claims" in data:
+            yield from _claims_in(data["claims"])
+        elif "dataFeedElement" in data:
+            yield from _claims_in(data["dataFeedElement"])
+        elif "item" in data:
+            yield from _claims_in(data["item"])
+
+
+def _name(value: Any) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else {}
+    return value.get("name", "") if isinstance(value, dict) else str(value or "")
+
+
+def _from_schema_org(review: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """API claim record from a schema.org ClaimReview."""
+    text = review.get("claimReviewed")
+    if not isinstance(text, str) or not text.strip():
+        return None
+    rating = review.get("reviewRating") or {}
+    if isinstance(rating, list):
+        rating = rating[0] if rating else {}
+    item = review.get("itemReviewed") or {}
+    if isinstance(item, list):
+        item = item[0] if item else {}
+    claim_review = {
+        "publisher": {"name": _name(review.get("author"))},
+        "url": review.get("url", ""),
+        "title": review.get("name") or review.get("headline") or "",
+        "reviewDate": review.get("datePublished", ""),
+        "textualRating": rating.get("alternateName") or rating.get("name") or "",
+        "languageCode": review.get("inLanguage", ""),
+    }
+    return {
+        "text": text.strip(),
+        "claimant": _name(item.get("author")),
+        "claimDate": item.get("datePublished", ""),
+        "claimReview": [claim_review],
+    }
+
+
+_index: Optional[ClaimReviewIndex] = None
+_index_failed = False
+
+
+def get_claimreview_index() -> Optional[ClaimReviewIndex]:
+    """Process-wide index at CLAIMREVIEW_INDEX_PATH, or None when disabled or unavailable."""
+    global _index, _index_failed
+    if _index is None and settings.CLAIMREVIEW_INDEX and not _index_failed:
+        try:
+            _index = ClaimReviewIndex(
+                settings.CLAIMREVIEW_INDEX_PATH,
+                settings.CLAIMREVIEW_INDEX_TTL_DAYS * 86400,
+                settings.CLAIMREVIEW_INDEX_MIN_MATCH
+            )
+        except sqlite3.Error as e:
+            # e.g. an SQLite build without FTS5, or an unwritable path
+            _index_failed = True
+            logger.error(f"ClaimReview index unavailable, using the Fact Check Tools API only: {e}")
+    return _index
+
+
+def main(paths: List[str]) -> None:
+    """Bulk-load dumps into the index at CLAIMREVIEW_INDEX_PATH."""
+    logging.basicConfig(level=logging.INFO)
+    index = ClaimReviewIndex(
+        settings.CLAIMREVIEW_INDEX_PATH, settings.CLAIMREVIEW_INDEX_TTL_DAYS * 86400, settings.CLAIMREVIEW_INDEX_MIN_MATCH
+    )
+    for path in paths:
+        started = time.perf_counter()
+        loaded = index.load_dump(path)
+        logger.info(f"Loaded {loaded} ClaimReview records from {path} in {time.perf_counter() - started:.1f}s")
+    logger.info(f"Index {settings.CLAIMREVIEW_INDEX_PATH} holds {len(index)} records")
+    index.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,18 +1,39 @@
 """Service for crawling web pages with enhanced text extraction."""
 import httpx
 import logging
-from typing import List, Dict, Any, Optional
+import re
+import time
+from typing import Iterable, List, Dict, Any, Optional
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 import io
 from ..config import settings
+from ..models import CrawledPage
 from ..services.utils import (
     is_valid_url, normalize_url, extract_domain
 )
+from ..services.circuit_breaker import get_host_breaker, is_failure_status
+from ..services.http_transport import shared_client
+from ..services.deadline import deadline_expired, stage_timeout
+from ..services.html_extractor import PARAGRAPH_TAGS, ExtractedHTML, extract_html
+from ..services.memory_budget import Reservation, reservation
+from ..services.metrics import record_upstream_call
 
 logger = logging.getLogger(__name__)
 
 
+def _join_pages(texts: Iterable[str], max_chars: Optional[int] = None) -> str:
+    """Join page texts, reading no more pages once ``max_chars`` characters are in."""
+    pages = []
+    length = 0
+    for text in texts:
+        pages.append(text)
+        length += len(text) + 1
+        if max_chars is not None and length >= max_chars:
+            break
+    return "\n".join(pages).strip()
+
+
 class Crawler:
     """Web crawler for fetching and parsing web pages."""
     
@@ -89,46 +110,188 @@ class Crawler:
         
         return ""
     
-    async def _extract_pdf_content(self, url: str, content: bytes) -> Optional[str]:
-        """Extract text content from PDF."""
+    def _extract_paragraphs(self, soup: BeautifulSoup) -> List[str]:
+        """Text of the content blocks (paragraphs, list items, headings) in page order.
+        
+        Call after _extract_text_from_semantic_tags, which removes navigation
+        and scripts. Blocks containing other blocks are skipped so no text is
+        counted twice.
+        """
+        root = soup.find('article') or soup.find('main') or soup.find('body') or soup
+        paragraphs = []
+        for block in root.find_all(PARAGRAPH_TAGS):
+            if block.find(PARAGRAPH_TAGS):
+                continue
+            text = block.get_text(separator=' ', strip=True)
+            if len(text) >= 20:
+                paragraphs.append(text)
+        return paragraphs
+    
+    async def _extract_pdf_content(
+        self, url: str, content: bytes, max_chars: Optional[int] = None
+    ) -> Optional[str]:
+        """Extract text content from PDF.
+        
+        Pages are read one at a time and reading stops once ``max_chars``
+        characters are in; the parser and its buffer are closed on return.
+        """
         try:
             # Try PyPDF2 first
             try:
                 import PyPDF2
-                pdf_file = io.BytesIO(content)
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+                with io.BytesIO(content) as pdf_file:
+                    pdf_reader = PyPDF2.PdfReader(pdf_file)
+                    return _join_pages((page.extract_text() for page in pdf_reader.pages), max_chars)
             except ImportError:
                 pass
             
             # Try pdfplumber as fallback
             try:
                 import pdfplumber
-                pdf_file = io.BytesIO(content)
-                with pdfplumber.open(pdf_file) as pdf:
-                    text = ""
+                
+                def page_texts(pdf: Any) -> Iterable[str]:
                     for page in pdf.pages:
                         page_text = page.extract_text()
+                        # Drop the page's cached layout objects as soon as its text is out
+                        page.close()
                         if page_text:
-                            text += page_text + "\n"
-                return text.strip()
+                            yield page_text
+                
+                with io.BytesIO(content) as pdf_file, pdfplumber.open(pdf_file) as pdf:
+                    return _join_pages(page_texts(pdf), max_chars)
             except ImportError:
                 pass
             
             # If no PDF library available, return None
-            print(f"PDF libraries not available. Install PyPDF2 or pdfplumber for PDF support.")
+            logger.warning("PDF libraries not available. Install PyPDF2 or pdfplumber for PDF support.")
             return None
             
         except Exception as e:
-            print(f"Error extracting PDF content: {e}")
+            logger.warning(f"Error extracting PDF content: {e}")
+            return None
+    
+    async def _read_body(
+        self, response: httpx.Response, url: str, limit: int, truncate: bool, held: Reservation
+    ) -> Optional[bytearray]:
+        """Stream a response body of at most ``limit`` bytes, reserving it against the request's memory budget.
+        
+        A longer body is cut off at the limit when ``truncate`` is set, else
+        skipped. Returns None for a skipped page, including one that does not
+        fit the request's memory budget.
+        """
+        declared = response.headers.get("content-length", "")
+        if not truncate and declared.isdigit() and int(declared) > limit:
+            logger.info(f"Skipping {url}: {declared} bytes is over the {limit} byte limit")
             return None
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            if len(body) + len(chunk) > limit:
+                if not truncate:
+                    logger.info(f"Skipping {url}: body is over the {limit} byte limit")
+                    return None
+                chunk = chunk[:limit - len(body)]
+            if not held.add(len(chunk)):
+                record_upstream_call("crawler", "over_budget")
+                logger.info(f"Skipping {url}: request memory budget spent")
+                return None
+            body += chunk
+            if len(body) >= limit:
+                break
+        return body
+    
+    def _extract_with_soup(self, html: str, with_paragraphs: bool = True) -> ExtractedHTML:
+        """Title, description, main text and paragraphs via BeautifulSoup lookups.
+        
+        The parse tree is torn down before returning rather than left to the
+        cycle collector, so it never outlives the call.
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        try:
+            # Extract title and description first (needed for fallback)
+            title = ""
+            if soup.title:
+                title = soup.title.string or ""
+            else:
+                og_title = soup.find("meta", property="og:title")
+                if og_title:
+                    title = og_title.get("content", "")
+                else:
+                    h1 = soup.find("h1")
+                    if h1:
+                        title = h1.get_text(strip=True)
+            
+            description = ""
+            meta_desc = soup.find("meta", {"name": "description"})
+            if meta_desc:
+                description = meta_desc.get("content", "")
+            else:
+                og_desc = soup.find("meta", property="og:description")
+                if og_desc:
+                    description = og_desc.get("content", "")
+                else:
+                    # Use first paragraph as description
+                    first_p = soup.find("p")
+                    if first_p:
+                        description = first_p.get_text(strip=True)[:200]
+            
+            # Extract text using semantic tags
+            text = self._extract_text_from_semantic_tags(soup)
+            paragraphs = self._extract_paragraphs(soup) if with_paragraphs else []
+        finally:
+            soup.decompose()
+        return ExtractedHTML(title=title, description=description, text=text, paragraphs=paragraphs)
+    
+    def _parse_html(
+        self, url: str, html: str, status_code: int, max_text_chars: Optional[int] = None
+    ) -> CrawledPage:
+        """Title, description, main text and paragraphs of an HTML page."""
+        # Evidence crawls only use the start of the text, never the paragraphs
+        with_paragraphs = max_text_chars is None
+        if settings.HTML_EXTRACTOR == "soup":
+            extracted = self._extract_with_soup(html, with_paragraphs)
+        else:
+            extracted = extract_html(html, with_paragraphs)
+        title, description, paragraphs = extracted.title, extracted.description, extracted.paragraphs
+        
+        # Clean up text
+        text = re.sub(r'\s+', ' ', extracted.text)
+        text = text.strip()
+        
+        # Fallback: If no readable text but we have title/description, use those
+        if not text or len(text) < 50:
+            # Combine title and description as minimal context
+            fallback_text = f"{title}. {description}".strip()
+            if len(fallback_text) > 10:
+                text = fallback_text
+                paragraphs = [text]
+                logger.warning(f"Limited text extracted from {url}, using title/description fallback")
+        
+        return CrawledPage(
+            url=normalize_url(url),
+            title=title.strip(),
+            description=description.strip(),
+            text=text[:max_text_chars] if max_text_chars is not None else text,
+            paragraphs=paragraphs,
+            status_code=status_code,
+            content_type="html"
+        )
     
-    async def fetch_url(self, url: str) -> Optional[Dict[str, Any]]:
-        """Fetch a single URL and return parsed content with enhanced text extraction."""
-        if not is_valid_url(url):
+    async def fetch_url(self, url: str, max_text_chars: Optional[int] = None) -> Optional[CrawledPage]:
+        """Fetch a single URL and return parsed content with enhanced text extraction.
+        
+        With ``max_text_chars`` (evidence crawls) only that much text is kept
+        and paragraphs are not extracted. The body is streamed within
+        CRAWL_MAX_HTML_BYTES / CRAWL_MAX_PDF_BYTES and counts against the
+        request's memory budget until it has been parsed; neither the raw body
+        nor the parse tree outlives this call.
+        """
+        if not is_valid_url(url) or deadline_expired():
+            return None
+        
+        breaker = get_host_breaker(extract_domain(url))
+        if not breaker.allow_request():
+            record_upstream_call("crawler", "circuit_open")
+            logger.debug(f"Crawler circuit open for {extract_domain(url)}, skipping {url}")
             return None
         
         # Modern browser User-Agent header
@@ -143,91 +306,67 @@ class Crawler:
         }
         
         for attempt in range(self.max_retries):
+            if attempt > 0 and (breaker.is_open or deadline_expired()):
+                break
             try:
-                async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                    response = await client.get(url, headers=headers)
-                    response.raise_for_status()
-                    
-                    content_type = response.headers.get("content-type", "").lower()
-                    
-                    # Handle PDF files
-                    if "application/pdf" in content_type or url.lower().endswith('.pdf'):
-                        pdf_content = await self._extract_pdf_content(url, response.content)
-                        if pdf_content:
-                            return {
-                                "url": normalize_url(url),
-                                "title": url.split('/')[-1] or "PDF Document",
-                                "description": pdf_content[:200] + "..." if len(pdf_content) > 200 else pdf_content,
-                                "text": pdf_content,
-                                "html": "",
-                                "status_code": response.status_code,
-                                "content_type": "pdf"
-                            }
-                    
-                    # Handle HTML content
-                    html = response.text
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extract title and description first (needed for fallback)
-                    title = ""
-                    if soup.title:
-                        title = soup.title.string or ""
-                    else:
-                        og_title = soup.find("meta", property="og:title")
-                        if og_title:
-                            title = og_title.get("content", "")
+                async with shared_client("crawler", follow_redirects=True) as client:
+                    start = time.perf_counter()
+                    async with client.stream(
+                        "GET", url, headers=headers, timeout=stage_timeout(self.timeout)
+                    ) as response:
+                        # Latency up to the response headers; the body is read below
+                        record_upstream_call("crawler", str(response.status_code), time.perf_counter() - start)
+                        if is_failure_status(response.status_code):
+                            breaker.record_failure()
                         else:
-                            h1 = soup.find("h1")
-                            if h1:
-                                title = h1.get_text(strip=True)
-                    
-                    description = ""
-                    meta_desc = soup.find("meta", {"name": "description"})
-                    if meta_desc:
-                        description = meta_desc.get("content", "")
-                    else:
-                        og_desc = soup.find("meta", property="og:description")
-                        if og_desc:
-                            description = og_desc.get("content", "")
-                        else:
-                            # Use first paragraph as description
-                            first_p = soup.find("p")
-                            if first_p:
-                                description = first_p.get_text(strip=True)[:200]
-                    
-                    # Extract text using semantic tags
-                    text = self._extract_text_from_semantic_tags(soup)
-                    
-                    # Clean up text
-                    import re
-                    text = re.sub(r'\s+', ' ', text)
-                    text = text.strip()
-                    
-                    # Fallback: If no readable text but we have title/description, use those
-                    if not text or len(text) < 50:
-                        # Combine title and description as minimal context
-                        fallback_text = f"{title}. {description}".strip()
-                        if len(fallback_text) > 10:
-                            text = fallback_text
-                            logger.warning(f"Limited text extracted from {url}, using title/description fallback")
-                    
-                    return {
-                        "url": normalize_url(url),
-                        "title": title.strip(),
-                        "description": description.strip(),
-                        "text": text,
-                        "html": html[:50000],  # Limit HTML size
-                        "status_code": response.status_code,
-                        "content_type": "html"
-                    }
+                            breaker.record_success()
+                        response.raise_for_status()
+                        
+                        content_type = response.headers.get("content-type", "").lower()
+                        is_pdf = "application/pdf" in content_type or url.lower().endswith('.pdf')
+                        limit = settings.CRAWL_MAX_PDF_BYTES if is_pdf else settings.CRAWL_MAX_HTML_BYTES
+                        
+                        with reservation() as held:
+                            body = await self._read_body(response, url, limit, not is_pdf, held)
+                            if body is None:
+                                return None
+                            
+                            # Handle PDF files
+                            if is_pdf:
+                                pdf_content = await self._extract_pdf_content(url, body, max_text_chars)
+                                if pdf_content:
+                                    return CrawledPage(
+                                        url=normalize_url(url),
+                                        title=url.split('/')[-1] or "PDF Document",
+                                        description=pdf_content[:200] + "..." if len(pdf_content) > 200 else pdf_content,
+                                        text=pdf_content[:max_text_chars] if max_text_chars is not None else pdf_content,
+                                        status_code=response.status_code,
+                                        content_type="pdf"
+                                    )
+                            
+                            # Handle HTML content
+                            html = body.decode(response.encoding or "utf-8", errors="replace")
+                            del body
+                            return self._parse_html(url, html, response.status_code, max_text_chars)
             
             except httpx.TimeoutException:
+                record_upstream_call("crawler", "timeout")
+                breaker.record_failure()
                 if attempt == self.max_retries - 1:
                     logger.warning(f"Timeout fetching {url}")
                 continue
+            except httpx.TransportError as e:
+                record_upstream_call("crawler", "error")
+                breaker.record_failure()
+                if attempt == self.max_retries - 1:
+                    logger.warning(f"Connection error fetching {url}: {e}")
+                continue
             except httpx.HTTPStatusError as e:
                 if attempt == self.max_retries - 1:
                     logger.warning(f"HTTP {e.response.status_code} error fetching {url}")
+                # Client errors (404, 403, ...) will not change on retry
+                if e.response.status_code < 500 and e.response.status_code != 429:
+                    break
                 continue
             except Exception as e:
                 if attempt == self.max_retries - 1:
@@ -236,7 +375,7 @@ class Crawler:
         
         return None
     
-    async def fetch_multiple(self, urls: List[str]) -> List[Dict[str, Any]]:
+    async def fetch_multiple(self, urls: List[str]) -> List[CrawledPage]:
         """Fetch multiple URLs concurrently."""
         import asyncio
         
@@ -246,7 +385,7 @@ class Crawler:
         # Filter out None and exceptions
         valid_results = []
         for result in results:
-            if result and isinstance(result, dict):
+            if isinstance(result, CrawledPage):
                 valid_results.append(result)
         
         return valid_results
@@ -0,0 +1,80 @@
+"""Request-level deadlines shared by every stage of the analysis pipeline."""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+# Never hand a stage less than this; below it the stage should be skipped instead
+MIN_STAGE_TIMEOUT = 0.25
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a stage is skipped because the request budget is spent."""
+
+
+class Deadline:
+    """Absolute point in time by which a request must finish."""
+
+    def __init__(self, seconds: float):
+        """Initialize deadline ``seconds`` from now."""
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left in the budget (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """True once there is not enough budget left to start another stage."""
+        return self.remaining() < MIN_STAGE_TIMEOUT
+
+    def timeout(self, default: float) -> float:
+        """Shrink a stage's own timeout so it fits the remaining budget."""
+        return max(MIN_STAGE_TIMEOUT, min(default, self.remaining()))
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("sift_request_deadline", default=None)
+
+
+def get_deadline() -> Optional[Deadline]:
+    """Deadline of the request being processed, if any."""
+    return _current_deadline.get()
+
+
+def stage_timeout(default: float) -> float:
+    """Timeout for a stage: its own default, capped by the request deadline."""
+    deadline = _current_deadline.get()
+    return deadline.timeout(default) if deadline else default
+
+
+def deadline_expired() -> bool:
+    """Whether the current request has run out of time."""
+    deadline = _current_deadline.get()
+    return deadline is not None and deadline.expired
+
+
+def check_deadline(stage: str) -> None:
+    """Raise DeadlineExceeded if the current request has run out of time."""
+    if deadline_expired():
+        raise DeadlineExceeded(f"Request deadline reached before {stage}")
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """Apply a deadline to the enclosed block and the tasks it spawns.
+
+    An enclosing deadline that expires sooner is kept; ``None`` or a
+    non-positive value adds no limit of its own.
+    """
+    current = _current_deadline.get()
+    deadline = Deadline(seconds) if seconds and seconds > 0 else None
+    if deadline is None or (current is not None and current.expires_at <= deadline.expires_at):
+        yield current
+        return
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
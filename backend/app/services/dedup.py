@@ -0,0 +1,131 @@
+"""SimHash near-duplicate removal for evidence snippets and crawled pages.
+
+Syndicated stories appear under many URLs with almost the same text. Each
+evidence item is fingerprinted with a 64-bit SimHash over word 3-shingles;
+items whose fingerprints differ in at most ``max_distance`` bits are grouped,
+the most authoritative copy is kept and the other URLs are attached to it as
+``alternate_citations``.
+"""
+import hashlib
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from ..models import Evidence
+from ..services.relevance import tokenize
+
+FINGERPRINT_BITS = 64
+
+
+def _shingle_hashes(tokens: List[str], size: int) -> np.ndarray:
+    if len(tokens) < size:
+        shingles = [" ".join(tokens)]
+    else:
+        shingles = [" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)]
+    digests = b"".join(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest() for s in shingles)
+    return np.frombuffer(digests, dtype=np.uint8).reshape(len(shingles), 8)
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """64-bit SimHash of the word shingles of ``text``."""
+    tokens = tokenize(text)
+    if not tokens:
+        return 0
+    bits = np.unpackbits(_shingle_hashes(tokens, shingle_size), axis=1)
+    # Bit i is set where most shingles have it set
+    votes = 2 * bits.sum(axis=0, dtype=np.int64) - bits.shape[0]
+    return int("".join("1" if v > 0 else "0" for v in votes), 2)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits."""
+    return bin(a ^ b).count("1")
+
+
+def _bands(max_distance: int) -> List[Tuple[int, int]]:
+    """(shift, mask) of max_distance + 1 bit ranges covering the fingerprint.
+
+    Two fingerprints at most max_distance bits apart agree exactly on at least
+    one range, so only items sharing a range value need comparing.
+    """
+    count = min(max_distance + 1, FINGERPRINT_BITS)
+    edges = [round(i * FINGERPRINT_BITS / count) for i in range(count + 1)]
+    return [(start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])]
+
+
+class EvidenceDeduplicator:
+    """Collapse near-duplicate evidence to its most authoritative copy."""
+
+    def __init__(
+        self,
+        priority: Callable[[Evidence], float],
+        max_distance: int = 6,
+        min_tokens: int = 8
+    ):
+        """Initialize deduplicator.
+
+        ``priority`` ranks copies (higher is kept); texts shorter than
+        ``min_tokens`` words are too short to fingerprint reliably and are
+        always kept.
+        """
+        self.priority = priority
+        self.max_distance = max_distance
+        self.min_tokens = min_tokens
+
+    def deduplicate(
+        self,
+        evidence: List[Evidence],
+        text_of: Callable[[Evidence], str]
+    ) -> List[Evidence]:
+        """Evidence without near-duplicates, in the original order of the kept items.
+
+        Dropped items' URLs (and their own alternates) are merged into the
+        kept item's ``alternate_citations``.
+        """
+        fingerprints: List[Optional[int]] = []
+        for item in evidence:
+            text = text_of(item) or ""
+            fingerprints.append(simhash(text) if len(text.split()) >= self.min_tokens else None)
+
+        # Union of items whose fingerprints are close; candidates come from shared bands
+        parent = list(range(len(evidence)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        bands = _bands(self.max_distance)
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for i, fingerprint in enumerate(fingerprints):
+            if fingerprint is None:
+                continue
+            keys = [(shift, (fingerprint >> shift) & mask) for shift, mask in bands]
+            for j in [j for key in keys for j in buckets.get(key, ())]:
+                if find(i) == find(j):
+                    continue
+                if hamming_distance(fingerprint, fingerprints[j]) <= self.max_distance:
+                    parent[find(i)] = find(j)
+            for key in keys:
+                buckets.setdefault(key, []).append(i)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(evidence)):
+            groups.setdefault(find(i), []).append(i)
+
+        kept = []
+        for members in groups.values():
+            if len(members) == 1:
+                kept.append(members[0])
+                continue
+            # Highest priority wins; earlier arrival breaks ties
+            best = max(members, key=lambda i: (self.priority(evidence[i]), -i))
+            alternates = evidence[best].alternate_citations
+            for i in members:
+                if i == best:
+                    continue
+                for url in [evidence[i].url] + evidence[i].alternate_citations:
+                    if url and url != evidence[best].url and url not in alternates:
+                        alternates.append(url)
+            kept.append(best)
+
+        return [evidence[i] for i in sorted(kept)]
@@ -0,0 +1,211 @@
+"""Host-based domain reputation index for evidence source classification.
+
+Entries are domain suffixes ("snopes.com", "gov", "ac.uk"), optionally with a
+path prefix ("indiatoday.in/fact-check"). A host is classified by looking up
+its suffixes from the most specific ("www.cdc.gov") to the least ("gov"), so
+the cost is O(labels in the host) dict lookups regardless of how many
+domains are loaded. Results are memoized per host.
+"""
+import logging
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Categories
+FACT_CHECKER = "factcheck"
+AUTHORITATIVE = "authoritative"  # government, education, major news
+
+# Names accepted in external domain lists
+CATEGORY_ALIASES = {
+    "factcheck": FACT_CHECKER,
+    "fact_check": FACT_CHECKER,
+    "fact-check": FACT_CHECKER,
+    "authoritative": AUTHORITATIVE,
+    "gov": AUTHORITATIVE,
+    "edu": AUTHORITATIVE,
+    "news": AUTHORITATIVE,
+}
+
+DEFAULT_FACT_CHECKERS = [
+    "factcheck.org",
+    "snopes.com",
+    "politifact.com",
+    "factchecker.in",
+    "fullfact.org",
+    "africacheck.org",
+    "checkyourfact.com",
+    "leadstories.com",
+    # Indian fact-checking whitelist
+    "altnews.in",
+    "boomlive.in",
+    "factly.in",
+    "pib.gov.in",
+    "indiatoday.in/fact-check",
+    "thequint.com/fact-check",
+    "factcrescendo.com",
+]
+
+# Host labels that mark a fact-checking site on unlisted domains (e.g. factcheck.afp.com)
+FACT_CHECK_HOST_KEYWORDS = ("factcheck", "snopes", "politifact")
+
+DEFAULT_AUTHORITATIVE = [
+    # Government
+    "gov", "gov.uk", "gov.au", "gov.ca", "europa.eu",
+    # Education
+    "edu", "ac.uk", "edu.au", "ac.ca",
+    # Major news organizations
+    "reuters.com",
+    "ap.org",
+    "bbc.com",
+    "bbc.co.uk",
+    "nytimes.com",
+    "washingtonpost.com",
+    "theguardian.com",
+    "wsj.com",
+    "bloomberg.com",
+    "cnn.com",
+    "npr.org",
+    "pbs.org",
+]
+
+
+def _normalize_host(host: str) -> str:
+    host = host.strip().lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+class DomainReputationIndex:
+    """Suffix index of domain categories with optional path-prefix rules."""
+
+    def __init__(self, cache_size: int = 65536):
+        """Initialize an empty index."""
+        self._suffixes: Dict[str, str] = {}
+        # host suffix -> [(path prefix, category)], longest prefix first
+        self._path_rules: Dict[str, List[Tuple[str, str]]] = {}
+        self.classify_host = lru_cache(maxsize=cache_size)(self._classify_host)
+
+    def __len__(self) -> int:
+        return len(self._suffixes) + sum(len(rules) for rules in self._path_rules.values())
+
+    def add(self, entry: str, category: str) -> None:
+        """Add ``domain`` or ``domain/path-prefix`` with a category."""
+        domain, _, path = entry.strip().lower().partition("/")
+        domain = _normalize_host(domain.lstrip("."))
+        if not domain:
+            return
+        if path:
+            rules = self._path_rules.setdefault(domain, [])
+            rules.append(("/" + path.rstrip("/"), category))
+            rules.sort(key=lambda rule: len(rule[0]), reverse=True)
+        else:
+            self._suffixes[domain] = category
+        self.classify_host.cache_clear()
+
+    def add_many(self, entries: Iterable[str], category: str) -> None:
+        """Add many entries with the same category."""
+        for entry in entries:
+            self.add(entry, category)
+
+    def load_file(self, path: str) -> int:
+        """Load ``domain[/path] category`` lines (whitespace or comma separated).
+
+        Blank lines and ``#`` comments are skipped; a missing category means
+        authoritative. Returns the number of entries added.
+        """
+        added = 0
+        skipped = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if not line:
+                    continue
+                parts = line.replace(",", " ").split()
+                category = CATEGORY_ALIASES.get(parts[1].lower() if len(parts) > 1 else AUTHORITATIVE)
+                if category is None:
+                    skipped += 1
+                    continue
+                self.add(parts[0], category)
+                added += 1
+        if skipped:
+            logger.warning(f"Skipped {skipped} entries with unknown categories in {path}")
+        logger.info(f"Loaded {added} domain reputation entries from {path}")
+        return added
+
+    def _classify_host(self, host: str) -> Tuple[Optional[str], Optional[List[Tuple[str, str]]]]:
+        """Category of the most specific listed suffix of ``host``, and its path rules."""
+        labels = host.split(".")
+        category = None
+        path_rules = None
+        for i in range(len(labels)):
+            suffix = ".".join(labels[i:])
+            if path_rules is None:
+                path_rules = self._path_rules.get(suffix)
+            category = self._suffixes.get(suffix)
+            if category:
+                break
+        if category is None and any(
+            keyword in label for label in labels[:-1] for keyword in FACT_CHECK_HOST_KEYWORDS
+        ):
+            category = FACT_CHECKER
+        return category, path_rules
+
+    def classify_url(self, url: str) -> Optional[str]:
+        """Category of a URL, or None for unlisted sources."""
+        host, path = _split_host_path(url)
+        if not host:
+            return None
+        category, path_rules = self.classify_host(host)
+        if path_rules:
+            path = path.lower()
+            for prefix, rule_category in path_rules:
+                if path == prefix or path.startswith(prefix + "/"):
+                    return rule_category
+        return category
+
+
+def _split_host_path(url: str) -> Tuple[str, str]:
+    """Normalized host and path of a URL (cheaper than urlsplit on the hot path)."""
+    scheme_end = url.find("://")
+    if scheme_end < 0:
+        return "", ""
+    rest = url[scheme_end + 3:]
+    end = len(rest)
+    for delimiter in "/?#":
+        index = rest.find(delimiter)
+        if 0 <= index < end:
+            end = index
+    netloc = rest[:end].rpartition("@")[2]
+    if netloc.startswith("["):
+        return "", ""  # IP literals are never listed
+    host = netloc.partition(":")[0]
+    path = rest[end:].partition("?")[0].partition("#")[0] or "/"
+    return _normalize_host(host), path
+
+
+def build_default_index() -> DomainReputationIndex:
+    """Index of the built-in lists plus DOMAIN_REPUTATION_FILE, if set."""
+    index = DomainReputationIndex(settings.DOMAIN_REPUTATION_CACHE_SIZE)
+    index.add_many(DEFAULT_AUTHORITATIVE, AUTHORITATIVE)
+    index.add_many(DEFAULT_FACT_CHECKERS, FACT_CHECKER)
+    if settings.DOMAIN_REPUTATION_FILE:
+        try:
+            index.load_file(settings.DOMAIN_REPUTATION_FILE)
+        except OSError as e:
+            logger.error(f"Could not load domain reputation list: {e}")
+    return index
+
+
+_default_index: Optional[DomainReputationIndex] = None
+
+
+def get_domain_reputation() -> DomainReputationIndex:
+    """Process-wide index, built on first use."""
+    global _default_index
+    if _default_index is None:
+        _default_index = build_default_index()
+    return _default_index
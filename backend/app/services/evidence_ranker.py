@@ -1,7 +1,53 @@
 """Service for ranking and summarizing evidence snippets with priority levels."""
-from typing import List, Dict, Any, Optional
+import heapq
+import re
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
+from ..models import FACT_CHECK_API, Evidence, Verdict
 from ..services.llm_analyzer import LLMAnalyzer
+from ..services.domain_reputation import AUTHORITATIVE, FACT_CHECKER, get_domain_reputation
+from ..services.relevance import BM25Scorer, query_terms
+
+
+# Fact-check ratings that settle a claim either way ("False", "Pants on Fire", "Correct")
+CONCLUSIVE_RATING = re.compile(
+    r"\b(false|true|fake|hoax|scam|incorrect|correct|inaccurate|accurate|wrong|fabricated|baseless|doctored|morphed|"
+    r"pants on fire)\b",
+    re.IGNORECASE
+)
+# Conclusive ratings that refute the claim ("Doctored"/"Morphed" media is common in Indian fact-checks)
+FALSE_RATING = re.compile(
+    r"\b(false|fake|hoax|scam|incorrect|inaccurate|wrong|fabricated|baseless|doctored|morphed|pants on fire)\b",
+    re.IGNORECASE
+)
+# Negated ratings: "Not true" refutes the claim, "Not false" says too little to read a verdict from
+NEGATED_TRUE_RATING = re.compile(r"\b(not|no)\s+(true|accurate|correct)\b", re.IGNORECASE)
+NEGATED_FALSE_RATING = re.compile(r"\b(not|no)\s+(false|inaccurate|incorrect|wrong)\b", re.IGNORECASE)
+# Ratings that leave the claim open ("Unproven", "Unverified")
+UNPROVEN_RATING = re.compile(r"\b(unproven|unverified|unsupported|unsubstantiated)\b", re.IGNORECASE)
+# Ratings about the form or age of a claim rather than its truth ("Satire", "Outdated")
+OFF_TOPIC_RATING = re.compile(r"\b(satire|satirical|parody|outdated|out of date)\b", re.IGNORECASE)
+# Ratings that hedge ("Partly false", "Mixture", "Misleading", "Needs context", "Not entirely true")
+HEDGED_RATING = re.compile(
+    r"\b(partly|partially|half|mostly|mix|mixed|mixture|misleading|exaggerated|exaggeration|distorted|"
+    r"(missing|needs|lacks|out of) context|not (entirely|quite|completely|fully|wholly))\b",
+    re.IGNORECASE
+)
+
+
+def _read_rating(rating: str) -> Optional[Tuple[str, float]]:
+    """Verdict and confidence a fact-check rating supports, or None if it supports none."""
+    if OFF_TOPIC_RATING.search(rating) or NEGATED_FALSE_RATING.search(rating):
+        return None
+    if UNPROVEN_RATING.search(rating):
+        return "unverified", 0.6
+    if HEDGED_RATING.search(rating):
+        return "partially_true", 0.6
+    if NEGATED_TRUE_RATING.search(rating) or FALSE_RATING.search(rating):
+        return "false", 0.8
+    if CONCLUSIVE_RATING.search(rating):
+        return "true", 0.8
+    return None
 
 
 class EvidenceRanker:
@@ -12,121 +58,95 @@ class EvidenceRanker:
     PRIORITY_GOV_EDU_NEWS = 2.0    # Medium-high priority
     PRIORITY_OTHERS = 1.0           # Lower priority
     
+    # Relevance weights of title and body matches
+    TITLE_WEIGHT = 0.4
+    TEXT_WEIGHT = 0.3
+    
     def __init__(self, llm_analyzer: LLMAnalyzer):
         """Initialize evidence ranker."""
         self.llm_analyzer = llm_analyzer
+        self.reputation = get_domain_reputation()
+        self.scorer = BM25Scorer()
     
     def _get_source_priority(self, url: str, source_type: str = None) -> float:
-        """Determine priority level based on URL and source type."""
-        url_lower = url.lower()
-        
+        """Determine priority level based on URL host and source type."""
         # Priority 1: Fact Check API direct hits
-        if source_type == "fact_check_api":
+        if source_type == FACT_CHECK_API:
             return self.PRIORITY_FACT_CHECK_API
         
-        # Check for fact-check domains (including Indian fact-checking sources)
-        factcheck_domains = [
-            "factcheck.org",
-            "snopes.com",
-            "politifact.com",
-            "factchecker.in",
-            "fullfact.org",
-            "africacheck.org",
-            "checkyourfact.com",
-            "leadstories.com",
-            "factcheck",
-            "snopes",
-            "politifact",
-            # Indian fact-checking whitelist
-            "altnews.in",
-            "boomlive.in",
-            "factly.in",
-            "pib.gov.in",
-            "indiatoday.in/fact-check",
-            "thequint.com/fact-check",
-            "factcrescendo.com"
-        ]
-        if any(domain in url_lower for domain in factcheck_domains):
+        category = self.reputation.classify_url(url) if url else None
+        if category == FACT_CHECKER:
             return self.PRIORITY_FACT_CHECK_API
-        
-        # Priority 2: Government sources
-        gov_domains = [".gov", ".gov.uk", ".gov.au", ".gov.ca", ".europa.eu"]
-        if any(url_lower.endswith(domain) or f"/{domain.split('.')[0]}" in url_lower for domain in gov_domains):
-            return self.PRIORITY_GOV_EDU_NEWS
-        
-        # Priority 2: Educational sources
-        edu_domains = [".edu", ".ac.uk", ".edu.au", ".ac.ca"]
-        if any(url_lower.endswith(domain) or domain in url_lower for domain in edu_domains):
+        # Priority 2: Gov/Edu/News
+        if category == AUTHORITATIVE:
             return self.PRIORITY_GOV_EDU_NEWS
-        
-        # Priority 2: News sources (major news organizations)
-        news_domains = [
-            "reuters.com",
-            "ap.org",
-            "bbc.com",
-            "bbc.co.uk",
-            "nytimes.com",
-            "washingtonpost.com",
-            "theguardian.com",
-            "wsj.com",
-            "bloomberg.com",
-            "cnn.com",
-            "npr.org",
-            "pbs.org"
-        ]
-        if any(domain in url_lower for domain in news_domains):
-            return self.PRIORITY_GOV_EDU_NEWS
-        
         # Priority 3: Others
         return self.PRIORITY_OTHERS
     
-    def _is_authoritative_source(self, url: str) -> bool:
-        """Check if URL is from an authoritative source."""
-        priority = self._get_source_priority(url)
-        return priority >= self.PRIORITY_GOV_EDU_NEWS
+    def source_priority(self, snippet: Evidence) -> float:
+        """Priority level of an evidence snippet."""
+        return self._get_source_priority(snippet.url, snippet.source)
+    
+    def has_conclusive_rating(self, snippet: Evidence) -> bool:
+        """Whether a Fact Check API result carries an unhedged true/false rating."""
+        if snippet.source != FACT_CHECK_API or not snippet.textual_rating:
+            return False
+        reading = _read_rating(snippet.textual_rating)
+        return reading is not None and reading[0] in ("true", "false")
+    
+    def rating_verdict(self, snippets: List[Evidence]) -> Verdict:
+        """Verdict read from the best-ranked fact-check rating, without an LLM call."""
+        reviews = [s for s in snippets if s.source == FACT_CHECK_API and s.textual_rating]
+        for snippet in sorted(reviews, key=_final_score, reverse=True):
+            rating = snippet.textual_rating
+            reading = _read_rating(rating)
+            if reading is None:
+                continue
+            verdict, confidence = reading
+            return Verdict(
+                verdict=verdict,
+                confidence=confidence,
+                explanation=f'A fact-check of a matching claim rated it "{rating}": {snippet.title}',
+                evidence=snippet.url
+            )
+        return Verdict(
+            verdict="unverified",
+            confidence=0.3,
+            explanation="No fact-check rating was found for this claim; run a full analysis to weigh other sources."
+        )
     
     def rank_by_relevance(
         self,
         claim: str,
-        evidence_snippets: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+        evidence_snippets: List[Evidence],
+        sort: bool = True
+    ) -> List[Evidence]:
         """Rank evidence snippets by relevance and priority.
         
         Priority order:
         1. Fact Check API direct hits
         2. Gov/Edu/News authoritative sources
         3. Others
+        
+        Relevance is BM25 of the claim against titles (weight 0.4) and against
+        snippet plus crawled text (weight 0.3), so it stays on the 0-0.7 scale.
+        Scores are added to the snippets in place. With ``sort=False`` the
+        input order is kept, for callers that select with summarize_evidence.
         """
         if not evidence_snippets:
             return []
         
-        claim_lower = claim.lower()
-        claim_words = set(claim_lower.split())
+        terms = query_terms(claim)
+        titles = [snippet.title for snippet in evidence_snippets]
+        bodies = [f"{snippet.snippet} {snippet.crawled_text}" for snippet in evidence_snippets]
+        relevance = (
+            self.TITLE_WEIGHT * self.scorer.score(terms, titles)
+            + self.TEXT_WEIGHT * self.scorer.score(terms, bodies)
+        )
         
-        scored_snippets = []
-        for snippet in evidence_snippets:
-            url = snippet.get("url", "")
-            source_type = snippet.get("source", "")
-            text = (snippet.get("snippet", "") or snippet.get("text", "") or "").lower()
-            title = (snippet.get("title", "") or "").lower()
-            
-            # Calculate base relevance score
-            relevance_score = 0.0
-            
-            # Title matches are more important
-            if title:
-                title_words = set(title.split())
-                title_overlap = len(claim_words & title_words) / max(len(claim_words), 1)
-                relevance_score += title_overlap * 0.4
-            
-            # Text matches
-            if text:
-                text_words = set(text.split())
-                text_overlap = len(claim_words & text_words) / max(len(claim_words), 1)
-                relevance_score += text_overlap * 0.3
-            
-            # Get source priority
-            source_priority = self._get_source_priority(url, source_type)
+        for snippet, relevance_score in zip(evidence_snippets, relevance.tolist()):
+            # Get source priority (once; a fact_check_api hit is authoritative regardless of host)
+            source_priority = self._get_source_priority(snippet.url, snippet.source)
             
             # Calculate final score: relevance * priority multiplier
             # Priority acts as a multiplier to boost authoritative sources
@@ -136,38 +156,48 @@ class EvidenceRanker:
             if source_priority == self.PRIORITY_FACT_CHECK_API:
                 final_score += 0.5  # Bonus for fact-check API
             
-            scored_snippets.append({
-                **snippet,
-                "relevance_score": relevance_score,
-                "source_priority": source_priority,
-                "final_score": final_score,
-                "text": snippet.get("snippet", "") or snippet.get("text", ""),
-                "is_authoritative": self._is_authoritative_source(url)
-            })
+            snippet.relevance_score = relevance_score
+            snippet.source_priority = source_priority
+            snippet.final_score = final_score
+            snippet.is_authoritative = source_priority >= self.PRIORITY_GOV_EDU_NEWS
         
+        if not sort:
+            return evidence_snippets
         # Sort by final_score (descending) - this ensures priority AND relevance
-        scored_snippets.sort(key=lambda x: x.get("final_score", 0.0), reverse=True)
-        
-        return scored_snippets
+        return sorted(evidence_snippets, key=_final_score, reverse=True)
     
     async def summarize_evidence(
         self,
         claim: str,
-        ranked_snippets: List[Dict[str, Any]],
+        ranked_snippets: List[Evidence],
         max_snippets: int = 10
-    ) -> List[Dict[str, Any]]:
-        """Summarize and select top evidence snippets."""
+    ) -> List[Evidence]:
+        """Summarize and select top evidence snippets.
+        
+        Takes up to 5 fact-check hits, then fills with authoritative sources and
+        then others, each by final_score. Snippets need not be sorted.
+        """
         # Prioritize: Fact Check API > Gov/Edu/News > Others
-        fact_check_snippets = [s for s in ranked_snippets if s.get("source_priority") == self.PRIORITY_FACT_CHECK_API]
-        authoritative_snippets = [s for s in ranked_snippets if s.get("source_priority") == self.PRIORITY_GOV_EDU_NEWS]
-        other_snippets = [s for s in ranked_snippets if s.get("source_priority") == self.PRIORITY_OTHERS]
+        buckets: Dict[float, List[Evidence]] = {
+            self.PRIORITY_FACT_CHECK_API: [],
+            self.PRIORITY_GOV_EDU_NEWS: [],
+            self.PRIORITY_OTHERS: [],
+        }
+        for snippet in ranked_snippets:
+            bucket = buckets.get(snippet.source_priority)
+            if bucket is not None:
+                bucket.append(snippet)
         
         # Build final list maintaining priority order
-        top_snippets = []
-        top_snippets.extend(fact_check_snippets[:5])  # Top 5 from Fact Check API
-        remaining = max_snippets - len(top_snippets)
-        top_snippets.extend(authoritative_snippets[:remaining])  # Fill with authoritative
-        remaining = max_snippets - len(top_snippets)
-        top_snippets.extend(other_snippets[:remaining])  # Fill with others
+        top_snippets = heapq.nlargest(min(5, max_snippets), buckets[self.PRIORITY_FACT_CHECK_API], key=_final_score)
+        for priority in (self.PRIORITY_GOV_EDU_NEWS, self.PRIORITY_OTHERS):
+            remaining = max_snippets - len(top_snippets)
+            if remaining <= 0:
+                break
+            top_snippets.extend(heapq.nlargest(remaining, buckets[priority], key=_final_score))
         
-        return top_snippets[:max_snippets]
+        return top_snippets
+
+
+def _final_score(snippet: Evidence) -> float:
+    return snippet.final_score
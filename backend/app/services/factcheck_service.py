@@ -1,17 +1,42 @@
 """Main fact-checking service that orchestrates the workflow."""
+import asyncio
 import logging
-from typing import List, Dict, Any
+from contextlib import aclosing
+from typing import AsyncIterator, List, Dict, Any, Optional, Set, Tuple
+from ..models import CUSTOM_SEARCH, FACT_CHECK_API, Claim, Evidence, FinalVerdict
+from ..services.admission import get_admission_controller
+from ..services.analysis_modes import AnalysisProfile, get_analysis_profile
 from ..services.claim_extractor import ClaimExtractor
 from ..services.query_generator import QueryGenerator
 from ..services.search_service import SearchService
 from ..services.crawler import Crawler
 from ..services.llm_analyzer import LLMAnalyzer
 from ..services.evidence_ranker import EvidenceRanker
+from ..services.dedup import EvidenceDeduplicator
+from ..services.page_store import (
+    PageAnalysisStore, paragraph_fingerprint, source_paragraphs, split_paragraphs
+)
 from ..services.language_service import LanguageService
 from ..services.translation_service import TranslationService
+from ..services.responses import (
+    LIMITATIONS, LIMITATIONS_NO_CLAIMS, LIMITATIONS_SHORT, METHODOLOGY, METHODOLOGY_NO_CLAIMS, METHODOLOGY_SHORT
+)
+from ..services.request_coalescer import RequestCoalescer, make_coalescing_key
+from ..services.deadline import (
+    DeadlineExceeded, deadline_expired, deadline_scope, get_deadline
+)
+from ..services.memory_budget import memory_scope
+from ..services.metrics import PIPELINES_IN_FLIGHT, stage_timer
+from ..services.utils import normalize_url
+from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Characters of a crawled evidence page kept for ranking and the verdict prompts
+CRAWLED_TEXT_CHARS = 1000
+# Top-level result fields describing the language of the analyzed text
+PAGE_LANGUAGE_FIELDS = ("original_text", "translated_text", "detected_language")
+
 
 class FactCheckService:
     """Main service for fact-checking content."""
@@ -24,14 +49,70 @@ class FactCheckService:
         self.search_service = SearchService()
         self.crawler = Crawler()
         self.evidence_ranker = EvidenceRanker(self.llm_analyzer)
+        self.deduplicator = EvidenceDeduplicator(
+            self.evidence_ranker.source_priority, settings.EVIDENCE_DEDUP_MAX_DISTANCE
+        )
         self.language_service = LanguageService()
         self.translation_service = TranslationService()
+        self.coalescer = RequestCoalescer()
+        self.page_store = PageAnalysisStore(settings.PAGE_STORE_MAX_PAGES, settings.PAGE_STORE_TTL_SECONDS)
     
-    async def analyze_text(self, text: str, url: str = None) -> Dict[str, Any]:
+    async def analyze_text(
+        self,
+        text: str,
+        url: str = None,
+        deadline_seconds: Optional[float] = None,
+        mode: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Analyze text and fact-check claims.
+        
+        ``mode`` names an analysis profile in ANALYSIS_MODES ("fast",
+        "balanced", "thorough"; ANALYSIS_MODE by default) that sets how many
+        claims, queries, crawled sources and evidence snippets are used,
+        whether translation runs, and the verdict path.
+        
+        Identical concurrent requests (same normalized text, URL and mode) are
+        coalesced onto a single pipeline execution and all receive its result.
+        
+        The whole analysis is bounded by a request deadline (deadline_seconds,
+        else the mode's deadline, else REQUEST_DEADLINE_SECONDS). Claims not
+        finished in time are returned with status "deadline_exceeded".
+        Coalesced callers share the deadline of the request that started the
+        execution.
+        
+        Crawled response bodies held at once are capped by
+        REQUEST_MEMORY_BUDGET_MB; sources that would exceed it are not crawled.
+        
+        Raises ServiceOverloaded when the worker has no pipeline slot to spare
+        (see AdmissionController); coalesced callers need no slot of their own.
+        
+        See _analyze_text for the workflow and response format.
+        """
+        profile = get_analysis_profile(mode)
+        with deadline_scope(deadline_seconds or profile.deadline_seconds or settings.REQUEST_DEADLINE_SECONDS), \
+                memory_scope(int(settings.REQUEST_MEMORY_BUDGET_MB * 1024 * 1024)):
+            if not settings.COALESCE_REQUESTS:
+                return await self._run_pipeline(text, url, profile)
+            
+            key = make_coalescing_key(text, url, profile.name)
+            result = await self.coalescer.run(key, lambda: self._run_pipeline(text, url, profile))
+            # Each caller gets its own top-level dict so callers can annotate it safely
+            return dict(result)
+    
+    async def _run_pipeline(self, text: str, url: str, profile: AnalysisProfile) -> Dict[str, Any]:
+        """Run one pipeline execution once admitted, tracked in the metrics."""
+        async with get_admission_controller().admit():
+            with PIPELINES_IN_FLIGHT.track_inprogress(), stage_timer("pipeline"):
+                result = await self._analyze_text(text, url, profile)
+                result["mode"] = profile.name
+                return result
+    
+    async def _analyze_text(self, text: str, url: str, profile: AnalysisProfile) -> Dict[str, Any]:
         """Analyze text and fact-check claims.
         
         Workflow:
-        1. extract_claims() - Extract factual claims from text
+        1. extract_claims() - Extract factual claims from text (streamed; each
+           claim enters steps 2-7 as soon as it is extracted, claims run concurrently)
         2. build_search_queries() - Generate search queries for each claim
         3. call Fact Check Tools API - Search fact-checking sources
         4. call Custom Search API - Search general web
@@ -47,150 +128,269 @@ class FactCheckService:
                     "verdict": "true|false|misleading|no_info",
                     "confidence": 0-1,
                     "explanation": "...",
-                    "citations": ["https://..."]
+                    "citations": ["https://..."],
+                    "status": "complete|deadline_exceeded"
                 }
             ],
             "summary": "...",
             "methodology": "...",
-            "limitations": "..."
+            "limitations": "...",
+            "partial": true  # only when the request deadline cut the analysis short
         }
         """
         if not text or len(text.strip()) < 10:
             return {
                 "claims": [],
                 "summary": "No analyzable text found. Please select at least 10 characters.",
-                "methodology": "SIFT uses AI-powered claim extraction and fact-checking against verified sources.",
-                "limitations": "Analysis quality depends on available sources and may not cover all claims."
+                "methodology": METHODOLOGY_SHORT,
+                "limitations": LIMITATIONS_SHORT
             }
         
         # Step 0: Detect language and translate to English BEFORE claim extraction
         original_text = text
-        detected_language = self.language_service.detect_language(text)
+        detected_language, text = await self._to_english(text, profile)
+        # Untranslated non-English text (fast mode, Translate unavailable) skips the English-only pre-filter
+        english = detected_language == "en" or text != original_text
         
+        # Steps 1-2: Extract claims (from translated English text) and fact-check
+        # each one as soon as it is extracted, overlapping with the rest of extraction
+        checks: List[asyncio.Task] = []
+        try:
+            with stage_timer("claim_extraction"):
+                async with aclosing(self._extracted_claims(text, english)) as claims:
+                    async for claim_data in claims:
+                        checks.append(asyncio.create_task(
+                            self._check_claim_within_deadline(claim_data, text, original_text, detected_language, profile)
+                        ))
+                        if len(checks) == profile.max_claims:
+                            break
+            claim_results = list(await asyncio.gather(*checks))
+        except BaseException:
+            for check in checks:
+                check.cancel()
+            raise
+        
+        if not claim_results:
+            return {
+                "claims": [],
+                "summary": "No factual claims detected in the selected text.",
+                "methodology": METHODOLOGY_NO_CLAIMS,
+                "limitations": LIMITATIONS_NO_CLAIMS
+            }
+        
+        result = {
+            "claims": claim_results,
+            "summary": self._build_summary(claim_results),
+            "methodology": METHODOLOGY,
+            "limitations": LIMITATIONS
+        }
+        
+        if any(c.get("status") == "deadline_exceeded" for c in claim_results):
+            result["partial"] = True
+        
+        # Add language information at top level
         if detected_language != "en":
+            result["original_text"] = original_text
+            result["translated_text"] = text
+            result["detected_language"] = detected_language
+        
+        return result
+    
+    async def _to_english(self, text: str, profile: AnalysisProfile) -> Tuple[str, str]:
+        """Detected language of the text and its English translation (the text itself if none is made)."""
+        with stage_timer("language_detection"):
+            detected_language = self.language_service.detect_language(text)
+        
+        if detected_language != "en" and not profile.translate:
+            logger.debug(f"Detected {detected_language}; analysis mode {profile.name} skips translation")
+        elif detected_language != "en":
             logger.info(f"Detected non-English language: {detected_language}, translating to English before analysis")
-            text = self.translation_service.translate_to_english(text)
-            logger.info(f"Translation completed. Original length: {len(original_text)}, Translated length: {len(text)}")
+            original_length = len(text)
+            with stage_timer("translation"):
+                text = await self.translation_service.translate_to_english(text)
+            logger.info(f"Translation completed. Original length: {original_length}, Translated length: {len(text)}")
         else:
             logger.debug("Text is already in English, no translation needed")
+        return detected_language, text
+    
+    async def _extracted_claims(self, text: str, english: bool = True) -> AsyncIterator[Claim]:
+        """Claims of the text, streamed from Gemini when STREAM_CLAIM_EXTRACTION is on."""
+        if settings.STREAM_CLAIM_EXTRACTION:
+            async for claim in self.claim_extractor.stream_claims(text, english):
+                yield claim
+        else:
+            for claim in await self.claim_extractor.extract_claims(text, english):
+                yield claim
+    
+    async def _check_claim_within_deadline(
+        self,
+        claim_data: Claim,
+        text: str,
+        original_text: str,
+        detected_language: str,
+        profile: AnalysisProfile
+    ) -> Dict[str, Any]:
+        """Check a claim, or return it unfinished if the request deadline cuts it short."""
+        deadline = get_deadline()
+        if deadline_expired():
+            return self._unfinished_claim_result(claim_data, original_text, detected_language)
         
-        # Step 1: Extract claims (from translated English text)
-        claims = await self.claim_extractor.extract_claims(text)
+        try:
+            check = self._check_claim(claim_data, text, original_text, detected_language, profile)
+            # Hard stop in case a stage overruns its shrunken timeout
+            if deadline is not None:
+                return await asyncio.wait_for(check, timeout=deadline.remaining())
+            return await check
+        except (asyncio.TimeoutError, DeadlineExceeded):
+            logger.warning(f"Request deadline reached while checking claim: {claim_data.claim[:50]}...")
+            return self._unfinished_claim_result(claim_data, original_text, detected_language)
+    
+    async def _check_claim(
+        self,
+        claim_data: Claim,
+        text: str,
+        original_text: str,
+        detected_language: str,
+        profile: AnalysisProfile
+    ) -> Dict[str, Any]:
+        """Run search, crawl, ranking and verdict stages for a single claim, within the profile's limits."""
+        claim_text = claim_data.claim  # Already in English
+        claim_type = claim_data.type
         
-        if not claims:
-            return {
-                "claims": [],
-                "summary": "No factual claims detected in the selected text.",
-                "methodology": "SIFT analyzes text for verifiable factual claims using AI.",
-                "limitations": "Opinions, questions, and subjective statements may not be detected."
-            }
+        # Step 3 & 4: Build search queries and call APIs
+        with stage_timer("query_generation"):
+            queries = await self.query_generator.generate_queries(claim_text, claim_type, profile.query_strategy)
         
-        # Step 2: Fact-check each claim (already in English after translation)
-        claim_results = []
-        for claim_data in claims[:5]:  # Limit to top 5 claims
-            claim_text = claim_data.get("claim", "")  # Already in English
-            claim_type = claim_data.get("type", "general")
-            
-            # Step 3 & 4: Build search queries and call APIs
-            queries = await self.query_generator.generate_queries(claim_text, claim_type)
-            
-            # Collect evidence from multiple sources
-            all_evidence = []
-            fact_check_has_results = False
+        # Collect evidence from multiple sources
+        all_evidence = []
+        fact_check_has_results = False
+        
+        for query in queries[:profile.max_queries]:
+            if deadline_expired():
+                break
             
-            for query in queries[:3]:  # Use top 3 queries
-                # Call Fact Check Tools API
+            # Call Fact Check Tools API
+            with stage_timer("search_factcheck"):
                 fact_check_results = await self.search_service.search_factcheck_api(query, 5)
-                if fact_check_results:
-                    fact_check_has_results = True
-                all_evidence.extend(fact_check_results)
-                
-                # Call Custom Search API
-                google_results = await self.search_service.search_google_custom(query, 5)
-                all_evidence.extend(google_results)
-            
-            # Deduplicate by URL
-            seen_urls = set()
-            unique_evidence = []
-            for item in all_evidence:
-                url = item.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_evidence.append(item)
-            
-            # Step 5: Crawl and extract useful text from top sources
-            crawled_evidence = []
-            for source in unique_evidence[:10]:  # Limit crawling to top 10
-                url = source.get("url", "")
-                if url:
-                    try:
-                        crawled = await self.crawler.fetch_url(url)
-                        if crawled:
-                            # Enhance source with crawled content
-                            source["crawled_text"] = crawled.get("text", "")[:1000]  # First 1000 chars
-                            crawled_evidence.append(source)
-                    except Exception as e:
-                        logger.warning(f"Error crawling source {url}: {e}")
-                        # Use snippet if available, continue analysis
-                        crawled_evidence.append(source)
+            if fact_check_results:
+                fact_check_has_results = True
+            all_evidence.extend(fact_check_results)
             
-            # Use crawled evidence, fallback to original if crawling failed
-            if not crawled_evidence:
-                crawled_evidence = unique_evidence
-            
-            # Step 6: Summarize and rank evidence snippets
+            # Call Custom Search API
+            with stage_timer("search_custom_search"):
+                google_results = await self.search_service.search_google_custom(query, 5)
+            all_evidence.extend(google_results)
+        
+        # Deduplicate by URL
+        seen_urls = set()
+        unique_evidence = []
+        for item in all_evidence:
+            url = item.url
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                unique_evidence.append(item)
+        
+        # Past claims and evidence weight the terms of local query generation
+        self.query_generator.observe(claim_text, (f"{e.title} {e.snippet}" for e in unique_evidence))
+        
+        # Collapse syndicated copies before spending crawl slots on them
+        if settings.EVIDENCE_DEDUP:
+            unique_evidence = self.deduplicator.deduplicate(unique_evidence, _snippet_text)
+        
+        # Step 5: Crawl and extract useful text from top sources
+        crawled_evidence = []
+        if profile.crawl:
+            to_crawl, crawled_evidence = self._select_crawl_targets(
+                claim_text, unique_evidence, profile.max_crawl_sources
+            )
+            crawled_evidence.extend(await self._crawl_sources(to_crawl))
+        
+        # Use crawled evidence, fallback to original if crawling failed
+        if not crawled_evidence:
+            crawled_evidence = unique_evidence
+        elif settings.EVIDENCE_DEDUP:
+            # Pages whose snippets differed can still carry the same story
+            crawled_evidence = self.deduplicator.deduplicate(
+                crawled_evidence, lambda e: e.crawled_text or _snippet_text(e)
+            )
+        
+        # Step 6: Summarize and rank evidence snippets
+        with stage_timer("ranking"):
             ranked_evidence = self.evidence_ranker.rank_by_relevance(
                 claim_text,
-                crawled_evidence
+                crawled_evidence,
+                sort=False  # summarize_evidence selects the top snippets itself
             )
             
             top_evidence = await self.evidence_ranker.summarize_evidence(
                 claim_text,
                 ranked_evidence,
-                max_snippets=10
+                max_snippets=profile.max_evidence
             )
-            
-            # Extract citations
-            citations = [e.get("url", "") for e in top_evidence if e.get("url")]
-            
-            # Step 7: LLM call (Gemini) - Generate structured JSON verdict
+        
+        # Extract citations
+        citations = [e.url for e in top_evidence if e.url]
+        # Other URLs carrying the same text as a cited source
+        alternate_citations = [
+            alt for e in top_evidence for alt in e.alternate_citations if alt not in citations
+        ]
+        
+        # Step 7: LLM call (Gemini) - Generate structured JSON verdict
+        if profile.verdict == "ratings":
+            factcheck_result = self.evidence_ranker.rating_verdict(top_evidence)
+        else:
             factcheck_result = await self.llm_analyzer.factcheck_claim(
                 claim_text,
                 context=text[:500],  # First 500 chars as context (already in English)
                 evidence_snippets=top_evidence
             )
-            
-            # Map verdict to required format
-            verdict = factcheck_result.get("verdict", "unverified")
-            verdict_mapping = {
-                "true": "true",
-                "false": "false",
-                "partially_true": "misleading",
-                "unverified": "no_info"
-            }
-            mapped_verdict = verdict_mapping.get(verdict, "no_info")
-            
-            # Adjust confidence based on Fact Check API results
-            base_confidence = factcheck_result.get("confidence", 0.0)
-            
-            # If Fact Check API returned 403 or zero results, lower confidence slightly
-            # But don't change verdict to "no_info" - let LLM decision stand
-            if not fact_check_has_results and not citations:
-                # No fact-check matches and no other sources - lower confidence by 10%
-                adjusted_confidence = max(base_confidence * 0.9, 0.1)
-            elif not fact_check_has_results:
-                # No fact-check matches but we have other sources - lower confidence by 5%
-                adjusted_confidence = max(base_confidence * 0.95, 0.1)
-            else:
-                # Fact Check API had results - use base confidence
-                adjusted_confidence = base_confidence
-            
-            # Step 8: Generate AI-verified final verdict by analyzing ALL evidence
-            # Separate evidence by type for final verdict
-            factcheck_api_results = [e for e in unique_evidence if e.get("source") == "fact_check_api"]
-            crawled_content_list = [e for e in crawled_evidence if e.get("crawled_text")]
-            search_snippets_list = [e for e in all_evidence if e.get("source") == "google_custom_search" or (e.get("url") and not e.get("crawled_text"))]
-            
+        
+        # Map verdict to required format
+        verdict = factcheck_result.verdict
+        verdict_mapping = {
+            "true": "true",
+            "false": "false",
+            "partially_true": "misleading",
+            "unverified": "no_info"
+        }
+        mapped_verdict = verdict_mapping.get(verdict, "no_info")
+        
+        # Adjust confidence based on Fact Check API results
+        base_confidence = factcheck_result.confidence
+        
+        # If Fact Check API returned 403 or zero results, lower confidence slightly
+        # But don't change verdict to "no_info" - let LLM decision stand
+        if not fact_check_has_results and not citations:
+            # No fact-check matches and no other sources - lower confidence by 10%
+            adjusted_confidence = max(base_confidence * 0.9, 0.1)
+        elif not fact_check_has_results:
+            # No fact-check matches but we have other sources - lower confidence by 5%
+            adjusted_confidence = max(base_confidence * 0.95, 0.1)
+        else:
+            # Fact Check API had results - use base confidence
+            adjusted_confidence = base_confidence
+        
+        # Step 8: Generate AI-verified final verdict by analyzing ALL evidence
+        # Separate evidence by type for final verdict
+        factcheck_api_results: List[Evidence] = []
+        search_snippets_list: List[Evidence] = []
+        for e in unique_evidence:
+            if e.source == FACT_CHECK_API:
+                factcheck_api_results.append(e)
+            if e.source == CUSTOM_SEARCH or (e.url and not e.crawled_text):
+                search_snippets_list.append(e)
+        crawled_content_list = [e for e in crawled_evidence if e.crawled_text]
+        
+        evidence_only_verdict = FinalVerdict(
+            score=int(adjusted_confidence * 100),
+            verdict=mapped_verdict.upper(),
+            confidence="medium",
+            reasoning=factcheck_result.explanation,
+            citations=citations[:5]
+        )
+        if profile.verdict != "full":
+            final_verdict = evidence_only_verdict
+        else:
             try:
                 final_verdict = await self.llm_analyzer.generate_final_verdict(
                     claim_text,
@@ -198,51 +398,137 @@ class FactCheckService:
                     crawled_content_list,
                     search_snippets_list
                 )
-                logger.info(f"Final verdict generated for claim: {claim_text[:50]}... Score: {final_verdict.get('score')}, Verdict: {final_verdict.get('verdict')}")
+                logger.info(f"Final verdict generated for claim: {claim_text[:50]}... Score: {final_verdict.score}, Verdict: {final_verdict.verdict}")
             except Exception as e:
                 logger.warning(f"Final verdict generation failed for claim: {e}, using evidence-only result")
-                final_verdict = {
-                    "score": int(adjusted_confidence * 100),
-                    "verdict": mapped_verdict.upper(),
-                    "confidence": "medium",
-                    "reasoning": factcheck_result.get("explanation", ""),
-                    "citations": citations[:5]
-                }
-            
-            # Build claim result with language information
-            # Note: claim_text is already in English after translation
-            claim_result = {
-                "claim": claim_text,  # English claim (from translated text)
-                "verdict": mapped_verdict,  # Keep LLM verdict, don't auto-change to "no_info"
-                "confidence": round(adjusted_confidence, 2),
-                "explanation": factcheck_result.get("explanation", ""),
-                "citations": citations,
-                "analysis_language": detected_language,  # Language of original input
-                # Final AI-verified scoring
-                "final_score": final_verdict.get("score", 50),
-                "final_verdict": final_verdict.get("verdict", "UNCERTAIN"),
-                "final_reasoning": final_verdict.get("reasoning", ""),
-                "final_citations": final_verdict.get("citations", [])
-            }
-            
-            # Add original claim if translation was performed
-            if detected_language != "en":
-                # Try to find corresponding original claim text
-                # Since we translated the entire text, we need to map back
-                # For now, we'll store the full original text context
-                claim_result["original_claim"] = original_text  # Store full original text
-                claim_result["claim_translated"] = claim_text  # English version
-            else:
-                claim_result["original_claim"] = claim_text  # Same for English
-            
-            claim_results.append(claim_result)
+                final_verdict = evidence_only_verdict
         
-        # Generate summary text
-        total = len(claim_results)
-        true_count = sum(1 for c in claim_results if c["verdict"] == "true")
-        false_count = sum(1 for c in claim_results if c["verdict"] == "false")
-        misleading_count = sum(1 for c in claim_results if c["verdict"] == "misleading")
-        no_info_count = sum(1 for c in claim_results if c["verdict"] == "no_info")
+        # Build claim result with language information
+        # Note: claim_text is already in English after translation
+        claim_result = {
+            "claim": claim_text,  # English claim (from translated text)
+            "verdict": mapped_verdict,  # Keep LLM verdict, don't auto-change to "no_info"
+            "confidence": round(adjusted_confidence, 2),
+            "explanation": factcheck_result.explanation,
+            "citations": citations,
+            "alternate_citations": alternate_citations,
+            "analysis_language": detected_language,  # Language of original input
+            # Final AI-verified scoring
+            "final_score": final_verdict.score,
+            "final_verdict": final_verdict.verdict,
+            "final_reasoning": final_verdict.reasoning,
+            "final_citations": final_verdict.citations,
+            "status": "complete"
+        }
+        self._add_original_claim(claim_result, claim_text, original_text, detected_language)
+        return claim_result
+    
+    def _select_crawl_targets(
+        self,
+        claim_text: str,
+        evidence: List[Evidence],
+        max_sources: int
+    ) -> Tuple[List[Evidence], List[Evidence]]:
+        """Choose which sources to crawl.
+        
+        Returns (sources to crawl, sources used as-is). With the "ranked"
+        strategy, fact-check results with a conclusive rating are used without
+        crawling, the rest are ranked on snippet, title and domain, and only the
+        top K are crawled. K starts at ``max_sources`` (the analysis mode's
+        limit) and drops by two for every result that is already convincing
+        (a conclusive fact-check, or an authoritative source whose snippet
+        closely matches the claim), down to CRAWL_MIN_SOURCES.
+        """
+        if settings.CRAWL_STRATEGY != "ranked":
+            return evidence[:max_sources], []
+        
+        settled = [e for e in evidence if self.evidence_ranker.has_conclusive_rating(e)]
+        candidates = self.evidence_ranker.rank_by_relevance(
+            claim_text, [e for e in evidence if not self.evidence_ranker.has_conclusive_rating(e)]
+        )
+        convincing = len(settled) + sum(
+            1 for e in candidates[:max_sources]
+            if e.is_authoritative and e.relevance_score >= settings.CRAWL_CONFIDENT_RELEVANCE
+        )
+        k = max(min(settings.CRAWL_MIN_SOURCES, max_sources), max_sources - 2 * convincing)
+        logger.debug(f"Crawling top {k} of {len(candidates)} sources ({len(settled)} settled by fact-check ratings)")
+        return candidates[:k], settled
+    
+    async def _crawl_sources(self, sources: List[Evidence]) -> List[Evidence]:
+        """Crawl sources concurrently; returns those with content (or a crawl error), in order."""
+        async def crawl(source: Evidence) -> Optional[Evidence]:
+            url = source.url
+            if not url or deadline_expired():
+                return None
+            try:
+                with stage_timer("crawl"):
+                    crawled = await self.crawler.fetch_url(url, max_text_chars=CRAWLED_TEXT_CHARS)
+                if crawled:
+                    # Enhance source with crawled content
+                    source.crawled_text = crawled.text
+                    return source
+            except Exception as e:
+                logger.warning(f"Error crawling source {url}: {e}")
+                # Use snippet if available, continue analysis
+                return source
+            return None
+        
+        crawled = await asyncio.gather(*(crawl(source) for source in sources))
+        return [source for source in crawled if source is not None]
+    
+    def _unfinished_claim_result(
+        self,
+        claim_data: Claim,
+        original_text: str,
+        detected_language: str
+    ) -> Dict[str, Any]:
+        """Placeholder result for a claim the request deadline left unchecked."""
+        claim_text = claim_data.claim
+        claim_result = {
+            "claim": claim_text,
+            "verdict": "no_info",
+            "confidence": 0.0,
+            "explanation": "This claim was not checked because the analysis reached its time limit.",
+            "citations": [],
+            "alternate_citations": [],
+            "analysis_language": detected_language,
+            "final_score": 50,
+            "final_verdict": "UNCERTAIN",
+            "final_reasoning": "",
+            "final_citations": [],
+            "status": "deadline_exceeded"
+        }
+        self._add_original_claim(claim_result, claim_text, original_text, detected_language)
+        return claim_result
+    
+    def _add_original_claim(
+        self,
+        claim_result: Dict[str, Any],
+        claim_text: str,
+        original_text: str,
+        detected_language: str
+    ) -> None:
+        """Attach the original-language text to a claim result."""
+        # Add original claim if translation was performed
+        if detected_language != "en":
+            # Try to find corresponding original claim text
+            # Since we translated the entire text, we need to map back
+            # For now, we'll store the full original text context
+            claim_result["original_claim"] = original_text  # Store full original text
+            claim_result["claim_translated"] = claim_text  # English version
+        else:
+            claim_result["original_claim"] = claim_text  # Same for English
+    
+    def _build_summary(self, claim_results: List[Dict[str, Any]]) -> str:
+        """Generate summary text from claim results."""
+        checked = [c for c in claim_results if c.get("status") != "deadline_exceeded"]
+        unfinished_count = len(claim_results) - len(checked)
+        
+        total = len(checked)
+        true_count = sum(1 for c in checked if c["verdict"] == "true")
+        false_count = sum(1 for c in checked if c["verdict"] == "false")
+        misleading_count = sum(1 for c in checked if c["verdict"] == "misleading")
+        no_info_count = sum(1 for c in checked if c["verdict"] == "no_info")
         
         summary_parts = []
         if total > 0:
@@ -258,28 +544,24 @@ class FactCheckService:
         else:
             summary_parts.append("No claims analyzed")
         
-        summary_text = ". ".join(summary_parts) + "."
-        
-        result = {
-            "claims": claim_results,
-            "summary": summary_text,
-            "methodology": "SIFT uses Gemini 2.0 Flash to extract factual claims from text, searches verified fact-checking sources via Fact Check Tools API and Google Custom Search, crawls source content, ranks evidence by relevance, and uses Gemini to provide verdicts with confidence scores. Citations link to original fact-check articles and sources.",
-            "limitations": "Fact-checking accuracy depends on: (1) availability of relevant sources in Fact Check Tools API and search results, (2) recency of information (new claims may lack verification), (3) AI interpretation quality (Gemini model limitations), and (4) source reliability. Always review citations for complete context. Some claims may require expert review."
-        }
-        
-        # Add language information at top level
-        if detected_language != "en":
-            result["original_text"] = original_text
-            result["translated_text"] = text
-            result["detected_language"] = detected_language
+        if unfinished_count > 0:
+            summary_parts.append(f"{unfinished_count} not checked before the time limit")
         
-        return result
+        return ". ".join(summary_parts) + "."
     
-    async def factcheck_url(self, url: str) -> Dict[str, Any]:
+    async def factcheck_url(
+        self,
+        url: str,
+        deadline_seconds: Optional[float] = None,
+        mode: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Fact-check content from a URL.
         
         Fetches content from URL (supports HTML and PDF), extracts text,
-        and runs the same fact-checking pipeline as text analysis.
+        and runs the same fact-checking pipeline as text analysis, in the
+        given analysis mode. The request deadline, memory budget and
+        pipeline slot cover fetching the page as well as the analysis, so an
+        overloaded worker raises ServiceOverloaded before downloading anything.
         
         Returns the same format as analyze_text:
         {
@@ -289,6 +571,14 @@ class FactCheckService:
             "limitations": "..."
         }
         """
+        profile = get_analysis_profile(mode)
+        with deadline_scope(deadline_seconds or profile.deadline_seconds or settings.REQUEST_DEADLINE_SECONDS), \
+                memory_scope(int(settings.REQUEST_MEMORY_BUDGET_MB * 1024 * 1024)):
+            async with get_admission_controller().admit():
+                return await self._factcheck_url(url, profile.name)
+    
+    async def _factcheck_url(self, url: str, mode: str) -> Dict[str, Any]:
+        """Fetch a URL and run the analysis pipeline on its text."""
         # Fetch URL content (includes PDF support via crawler)
         content = await self.crawler.fetch_url(url)
         
@@ -296,27 +586,159 @@ class FactCheckService:
             return {
                 "claims": [],
                 "summary": "Could not fetch URL content. Please check if the URL is accessible and try again.",
-                "methodology": "SIFT uses Gemini 2.0 Flash to extract factual claims from text, searches verified fact-checking sources via Fact Check Tools API and Google Custom Search, crawls source content, ranks evidence by relevance, and uses Gemini to provide verdicts with confidence scores. Citations link to original fact-check articles and sources.",
-                "limitations": "Fact-checking accuracy depends on: (1) availability of relevant sources in Fact Check Tools API and search results, (2) recency of information (new claims may lack verification), (3) AI interpretation quality (Gemini model limitations), and (4) source reliability. Always review citations for complete context. Some claims may require expert review."
+                "methodology": METHODOLOGY,
+                "limitations": LIMITATIONS
             }
         
         # Extract text from content (supports both HTML and PDF)
-        text = content.get("text", "")
+        text = content.text
         if not text or len(text.strip()) < 10:
             return {
                 "claims": [],
                 "summary": "No analyzable text content found in URL. The page may be empty, contain only images, or be inaccessible.",
-                "methodology": "SIFT uses Gemini 2.0 Flash to extract factual claims from text, searches verified fact-checking sources via Fact Check Tools API and Google Custom Search, crawls source content, ranks evidence by relevance, and uses Gemini to provide verdicts with confidence scores. Citations link to original fact-check articles and sources.",
-                "limitations": "Fact-checking accuracy depends on: (1) availability of relevant sources in Fact Check Tools API and search results, (2) recency of information (new claims may lack verification), (3) AI interpretation quality (Gemini model limitations), and (4) source reliability. Always review citations for complete context. Some claims may require expert review."
+                "methodology": METHODOLOGY,
+                "limitations": LIMITATIONS
             }
         
         # Use analyze_text pipeline (same as /analyze endpoint)
-        result = await self.analyze_text(text, url)
+        if settings.INCREMENTAL_ANALYSIS:
+            paragraphs = content.paragraphs or split_paragraphs(text)
+            result = await self._analyze_page(url, text, paragraphs, mode)
+        else:
+            result = await self.analyze_text(text, url, mode=mode)
         
         # Add URL metadata if available
-        if content.get("title"):
-            result["source_title"] = content.get("title", "")
-        if content.get("description"):
-            result["source_description"] = content.get("description", "")
+        if content.title:
+            result["source_title"] = content.title
+        if content.description:
+            result["source_description"] = content.description
         
         return result
+
+    
+    async def _analyze_page(self, url: str, text: str, paragraphs: List[str], mode: str) -> Dict[str, Any]:
+        """Analyze a fetched page, re-checking only what changed since the last visit.
+        
+        Each claim is stored against the paragraphs it was extracted from and
+        reused while all of them are still on the page (visits in another
+        analysis mode are stored separately). New paragraphs, and
+        paragraphs whose claims can no longer be reused, go through extraction
+        and verification again. A pass that reaches the mode's max_claims
+        stops early, so the paragraphs after its last claim count as not yet
+        seen; they are analyzed on a later visit once fewer than max_claims
+        claims can be reused. The combined claims are capped at max_claims.
+        Adds an "incremental" summary to the result and marks reused claims
+        with "reused": true.
+        """
+        key = f"{mode}:{normalize_url(url)}"
+        max_claims = get_analysis_profile(mode).max_claims
+        current = {paragraph_fingerprint(p): p for p in paragraphs}
+        record = self.page_store.get(key)
+        
+        if record is None:
+            result = await self.analyze_text(text, url, mode=mode)
+            self._store_page(key, set(), [], current, result, max_claims)
+            result["incremental"] = {"reused_claims": 0, "analyzed_paragraphs": len(current), "total_paragraphs": len(current)}
+            return result
+        
+        to_analyze = {fp for fp in current if fp not in record.fingerprints}
+        reused = [(sources, claim) for sources, claim in record.claims]
+        # A dropped claim's remaining paragraphs must be re-analyzed, which may drop more claims
+        while True:
+            kept = [(sources, claim) for sources, claim in reused
+                    if sources <= current.keys() and not sources & to_analyze]
+            dropped = set().union(*(sources for sources, _ in reused)) - set().union(*(sources for sources, _ in kept))
+            reused = kept
+            if not (dropped & current.keys()) - to_analyze:
+                break
+            to_analyze |= dropped & current.keys()
+        
+        if to_analyze and len(reused) < max_claims:
+            analyzed = {fp: p for fp, p in current.items() if fp in to_analyze}
+            logger.info(f"Re-analyzing {len(analyzed)} of {len(current)} paragraphs of {url}")
+            result = await self.analyze_text("\n\n".join(analyzed.values()), url, mode=mode)
+            new_claims = result["claims"]
+        else:
+            analyzed = {}
+            result = dict(record.template)
+            new_claims = []
+        
+        # The top-level fields describe the whole page, not just the re-analyzed paragraphs
+        for field in PAGE_LANGUAGE_FIELDS:
+            result.pop(field, None)
+        result.update(await self._page_language_fields(text, mode, record.template))
+        seen = (record.fingerprints & current.keys()) - to_analyze
+        self._store_page(key, seen, reused, analyzed, result, max_claims)
+        
+        result["claims"] = ([dict(claim, reused=True) for _, claim in reused] + new_claims)[:max_claims]
+        result["summary"] = self._build_summary(result["claims"])
+        if result["claims"]:
+            result["methodology"], result["limitations"] = METHODOLOGY, LIMITATIONS
+        result["incremental"] = {
+            "reused_claims": len(reused),
+            "analyzed_paragraphs": len(analyzed),
+            "total_paragraphs": len(current)
+        }
+        return result
+    
+    async def _page_language_fields(self, text: str, mode: str, template: Dict[str, Any]) -> Dict[str, Any]:
+        """Top-level language fields of a full analysis of the page text.
+        
+        Taken from the stored result while the page text is unchanged; the
+        whole-page translation otherwise comes from the translation cache or
+        one translation call.
+        """
+        if template.get("original_text") == text:
+            return {field: template[field] for field in PAGE_LANGUAGE_FIELDS if field in template}
+        detected_language, english_text = await self._to_english(text, get_analysis_profile(mode))
+        if detected_language == "en":
+            return {}
+        return {"original_text": text, "translated_text": english_text, "detected_language": detected_language}
+    
+    def _store_page(
+        self,
+        key: str,
+        seen: Set[str],
+        reused: List[Tuple[frozenset, Dict[str, Any]]],
+        analyzed: Dict[str, str],
+        result: Dict[str, Any],
+        max_claims: int
+    ) -> None:
+        """Store a page's seen paragraphs with its reused and newly checked claims.
+        
+        ``seen`` are the earlier paragraphs whose claims are settled; of the
+        ``analyzed`` ones, those the extraction pass got to are added.
+        Results cut short by the deadline are not stored, so the next visit
+        analyzes those paragraphs again.
+        """
+        if result.get("partial"):
+            return
+        new = [(source_paragraphs(claim.get("claim", ""), analyzed), dict(claim)) for claim in result.get("claims", [])]
+        examined = _examined_paragraphs(analyzed, new, max_claims)
+        claims = list(reused)
+        for sources, claim in new:
+            claims.append((sources & examined or frozenset(examined), claim))
+        template = {k: v for k, v in result.items() if k not in ("claims", "incremental")}
+        self.page_store.put(key, seen | examined, claims, template)
+
+
+def _examined_paragraphs(
+    analyzed: Dict[str, str], claims: List[Tuple[frozenset, Dict[str, Any]]], max_claims: int
+) -> Set[str]:
+    """Fingerprints of the analyzed paragraphs (in page order) that claim extraction got to.
+    
+    All of them, unless extraction stopped at ``max_claims``: then those up to
+    the last paragraph a claim was traced to.
+    """
+    if len(claims) < max_claims:
+        return set(analyzed)
+    order = {fingerprint: position for position, fingerprint in enumerate(analyzed)}
+    traced = [order[fp] for sources, _ in claims if len(sources) == 1 for fp in sources]
+    if not traced:
+        return set(analyzed)
+    return set(list(analyzed)[:max(traced) + 1])
+
+
+def _snippet_text(evidence: Evidence) -> str:
+    """Title and snippet text of a search result."""
+    return f"{evidence.title} {evidence.snippet}"
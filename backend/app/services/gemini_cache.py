@@ -0,0 +1,133 @@
+"""Service for Gemini context caching of static system instructions.
+
+With GEMINI_CONTEXT_CACHE on, each distinct (model, system instruction) pair
+is uploaded once to the cachedContents API and later calls reference it by
+handle instead of re-sending the text. Handles are created on first use
+(one upload even when many calls race for it), replaced shortly before they
+expire, dropped when Gemini no longer knows them, and deleted on shutdown.
+Whenever a handle cannot be had, callers send the instruction inline.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Dict, Optional, Tuple
+import httpx
+import orjson
+from ..config import settings
+from ..services.http_transport import shared_client
+from ..services.metrics import record_upstream_call
+from ..services.rate_limiter import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Replace a handle this long before it expires, so no call references an expired one
+_RENEW_MARGIN_SECONDS = 60.0
+# After a failed upload, send the instruction inline for this long before trying again
+_RETRY_AFTER_SECONDS = 300.0
+
+
+class ContextCache:
+    """cachedContents handles keyed by model and system instruction."""
+
+    def __init__(self, endpoint_base: str, api_key: Optional[str], ttl_seconds: int, min_tokens: int):
+        """Initialize cache."""
+        # GEMINI_ENDPOINT points at .../v1beta/models; cachedContents is its sibling collection
+        self.api_base = endpoint_base.rstrip("/").rsplit("/models", 1)[0]
+        self.api_key = api_key
+        self.ttl_seconds = ttl_seconds
+        self.min_tokens = min_tokens
+        # key -> (handle name, expiry as a monotonic time)
+        self._handles: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._failed_until: Dict[Tuple[str, str], float] = {}
+
+    @staticmethod
+    def _key(model: str, system_instruction: str) -> Tuple[str, str]:
+        return model, hashlib.sha256(system_instruction.encode("utf-8")).hexdigest()
+
+    async def handle(self, model: str, system_instruction: str) -> Optional[str]:
+        """Handle of the cached instruction for the model, or None to send it inline."""
+        if not self.api_key or estimate_tokens(system_instruction) < self.min_tokens:
+            return None
+        key = self._key(model, system_instruction)
+        now = time.monotonic()
+        cached = self._handles.get(key)
+        if cached and cached[1] - _RENEW_MARGIN_SECONDS > now:
+            return cached[0]
+        if self._failed_until.get(key, 0.0) > now:
+            return None
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._create(key, model, system_instruction))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        # Shielded so one caller's timeout does not cancel the upload the others wait on
+        return await asyncio.shield(pending)
+
+    async def _create(self, key: Tuple[str, str], model: str, system_instruction: str) -> Optional[str]:
+        """Upload the instruction; remembers the handle, or the failure for a while."""
+        body = {
+            "model": f"models/{model}",
+            "systemInstruction": {"parts": [{"text": system_instruction}]},
+            "ttl": f"{self.ttl_seconds}s",
+        }
+        started = time.perf_counter()
+        try:
+            async with shared_client("gemini") as client:
+                response = await client.post(
+                    f"{self.api_base}/cachedContents", json=body, params={"key": self.api_key}, timeout=10.0
+                )
+            record_upstream_call("gemini_cache", str(response.status_code), time.perf_counter() - started)
+            response.raise_for_status()
+            name = orjson.loads(response.content)["name"]
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            # e.g. the instruction is below the model's minimum cacheable size, or the model has no caching
+            logger.warning(f"Could not cache system instruction for {model}, sending it inline: {e}")
+            self._failed_until[key] = time.monotonic() + _RETRY_AFTER_SECONDS
+            return None
+
+        # A replaced handle is left to expire on its own; calls sent with it may still be running
+        self._handles[key] = (name, time.monotonic() + self.ttl_seconds)
+        logger.info(f"Cached system instruction for {model} as {name} ({estimate_tokens(system_instruction)} tokens)")
+        return name
+
+    def invalidate(self, model: str, system_instruction: str) -> None:
+        """Forget the handle Gemini rejected (expired or deleted early); the next call uploads again."""
+        self._handles.pop(self._key(model, system_instruction), None)
+
+    async def close(self) -> None:
+        """Delete every handle still alive, so they stop accruing storage cost."""
+        handles = [name for name, expires_at in self._handles.values() if expires_at > time.monotonic()]
+        self._handles.clear()
+        if not handles:
+            return
+        async with shared_client("gemini") as client:
+            for name in handles:
+                try:
+                    await client.delete(f"{self.api_base}/{name}", params={"key": self.api_key}, timeout=5.0)
+                except httpx.HTTPError as e:
+                    logger.warning(f"Could not delete context cache {name}: {e}")
+
+
+_context_cache: Optional[ContextCache] = None
+
+
+def get_context_cache() -> Optional[ContextCache]:
+    """Process-wide context cache, or None when GEMINI_CONTEXT_CACHE is off."""
+    global _context_cache
+    if _context_cache is None and settings.GEMINI_CONTEXT_CACHE:
+        _context_cache = ContextCache(
+            settings.GEMINI_ENDPOINT,
+            settings.GOOGLE_API_KEY,
+            settings.GEMINI_CONTEXT_CACHE_TTL_SECONDS,
+            settings.GEMINI_CONTEXT_CACHE_MIN_TOKENS
+        )
+    return _context_cache
+
+
+async def close_context_cache() -> None:
+    """Delete the process-wide cache's handles (on shutdown)."""
+    if _context_cache is not None:
+        await _context_cache.close()
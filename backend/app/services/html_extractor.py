@@ -0,0 +1,264 @@
+"""Single-pass extraction of title, description, main text and paragraphs from HTML.
+
+One walk over the document with the standard library's streaming
+``HTMLParser`` collects everything the crawler needs: the <title>, og:title
+and first <h1> (title fallbacks), the description metas and first <p>
+(description fallbacks), the text of every <article> and <main>, the
+paragraphs, the body text, and the leaf content blocks. No parse tree is
+built. The main text is then chosen in the same order as the BeautifulSoup
+extractor (article, main, paragraph cluster, body), except that among several
+<article> or <main> elements the one with the most non-link text wins
+instead of simply the first, so teaser cards do not shadow the story.
+"""
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Set, Tuple
+
+# Block elements treated as paragraphs for incremental re-analysis
+PARAGRAPH_TAGS = ["p", "li", "blockquote", "h1", "h2", "h3", "h4", "h5", "h6"]
+_PARAGRAPH_TAGS = frozenset(PARAGRAPH_TAGS)
+
+# Text inside these never counts as content
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template"})
+# Page furniture left out of the main text and the paragraphs
+_BOILERPLATE_TAGS = frozenset({"nav", "aside", "header", "footer"}) | _SKIPPED_TAGS
+
+# Elements without an end tag
+_VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr",
+})
+# Start tags that close an open <p> (HTML's implied end tags)
+_CLOSES_P = frozenset({
+    "address", "article", "aside", "blockquote", "details", "div", "dl", "fieldset", "figure", "footer", "form",
+    "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "main", "nav", "ol", "p", "pre", "section", "table", "ul",
+})
+
+# A container needs this much text to count as the main content
+MIN_CONTENT_CHARS = 100
+# Shorter paragraphs are left out of the paragraph cluster / the paragraph list
+MIN_CLUSTER_PARAGRAPH_CHARS = 10
+MIN_PARAGRAPH_CHARS = 20
+
+
+@dataclass
+class ExtractedHTML:
+    """Fields the crawler takes from an HTML page."""
+
+    title: str = ""
+    description: str = ""
+    text: str = ""
+    paragraphs: List[str] = field(default_factory=list)
+
+
+class _Capture:
+    """Text collected for one element while it is open."""
+
+    __slots__ = ("parts", "chars", "link_chars", "skip_boilerplate", "has_block", "containers")
+
+    def __init__(self, skip_boilerplate: bool, containers: Tuple[int, ...] = ()):
+        self.parts: List[str] = []
+        self.chars = 0
+        self.link_chars = 0
+        self.skip_boilerplate = skip_boilerplate
+        # For content blocks: whether a nested block makes this one a wrapper, and the
+        # ids of the <article>/<main>/<body> captures it sits in
+        self.has_block = False
+        self.containers = containers
+
+    def text(self, separator: str = " ") -> str:
+        return separator.join(self.parts)
+
+    @property
+    def score(self) -> int:
+        """Non-link text length: high for an article body, low for link lists and teasers."""
+        return self.chars - self.link_chars
+
+
+class MainContentExtractor(HTMLParser):
+    """Streaming extractor; ``feed`` the document (in one or more chunks), then call ``result``."""
+
+    def __init__(self, with_paragraphs: bool = True):
+        """Initialize extractor; without paragraphs, leaf blocks are not collected."""
+        super().__init__(convert_charrefs=True)
+        self.with_paragraphs = with_paragraphs
+        # Open elements with the captures they started
+        self._stack: List[Tuple[str, List[_Capture]]] = []
+        self._active: List[_Capture] = []
+        self._skip_depth = 0
+        self._boilerplate_depth = 0
+        self._link_depth = 0
+        self._open_blocks: List[_Capture] = []
+
+        self._title: Optional[_Capture] = None
+        self._h1: Optional[_Capture] = None
+        self._first_p: Optional[_Capture] = None
+        self._body: Optional[_Capture] = None
+        self._metas: Dict[str, str] = {}
+        self._articles: List[_Capture] = []
+        self._mains: List[_Capture] = []
+        self._container_ids: Set[int] = set()
+        self._paragraphs: List[str] = []
+        self._blocks: List[_Capture] = []
+
+    def _open(self, tag: str, captures: List[_Capture]) -> None:
+        self._stack.append((tag, captures))
+        self._active.extend(captures)
+        if tag in _BOILERPLATE_TAGS:
+            self._boilerplate_depth += 1
+            if tag in _SKIPPED_TAGS:
+                self._skip_depth += 1
+        elif tag == "a":
+            self._link_depth += 1
+
+    def _close_top(self) -> None:
+        tag, captures = self._stack.pop()
+        if tag in _BOILERPLATE_TAGS:
+            self._boilerplate_depth -= 1
+            if tag in _SKIPPED_TAGS:
+                self._skip_depth -= 1
+        elif tag == "a":
+            self._link_depth -= 1
+        for capture in captures:
+            self._active.remove(capture)
+            if capture in self._open_blocks:
+                self._open_blocks.remove(capture)
+        if tag == "p" and captures and captures[-1] is not self._first_p and not captures[-1].skip_boilerplate:
+            self._paragraphs.append(captures[-1].text())
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "meta":
+            self._meta(attrs)
+            return
+        if tag in _CLOSES_P and self._stack and self._stack[-1][0] == "p":
+            self._close_top()
+        elif tag == "li" and self._stack and self._stack[-1][0] == "li":
+            self._close_top()
+        if tag in _VOID_TAGS:
+            return
+
+        captures: List[_Capture] = []
+        if tag == "title":
+            if self._title is None:
+                self._title = _Capture(skip_boilerplate=False)
+                captures.append(self._title)
+        elif tag == "h1" and self._h1 is None:
+            self._h1 = _Capture(skip_boilerplate=False)
+            captures.append(self._h1)
+        elif tag in ("article", "main", "body"):
+            container = _Capture(skip_boilerplate=True)
+            self._container_ids.add(id(container))
+            if tag == "article":
+                self._articles.append(container)
+            elif tag == "main":
+                self._mains.append(container)
+            elif self._body is None:
+                self._body = container
+            captures.append(container)
+
+        if tag == "p":
+            if self._first_p is None:
+                self._first_p = _Capture(skip_boilerplate=False)
+                captures.append(self._first_p)
+            if not self._boilerplate_depth:
+                # Paragraph text for the cluster (kept last in the captures, see _close_top)
+                captures.append(_Capture(skip_boilerplate=False))
+        if self.with_paragraphs and tag in _PARAGRAPH_TAGS and not self._boilerplate_depth:
+            for block in self._open_blocks:
+                block.has_block = True
+            containers = tuple(id(c) for c in self._active if id(c) in self._container_ids)
+            block = _Capture(skip_boilerplate=True, containers=containers)
+            self._open_blocks.append(block)
+            self._blocks.append(block)
+            captures.insert(0, block)
+        self._open(tag, captures)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "meta":
+            self._meta(attrs)
+        elif tag not in _VOID_TAGS:
+            # <div/> and the like: an empty element
+            self.handle_starttag(tag, attrs)
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        while self._stack:
+            open_tag = self._stack[-1][0]
+            self._close_top()
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        text = data.strip()
+        if not text:
+            return
+        in_boilerplate = self._boilerplate_depth > 0
+        in_link = self._link_depth > 0
+        for capture in self._active:
+            if in_boilerplate and capture.skip_boilerplate:
+                continue
+            capture.parts.append(text)
+            capture.chars += len(text) + 1
+            if in_link:
+                capture.link_chars += len(text) + 1
+
+    def _meta(self, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        values = dict(attrs)
+        key = values.get("name") if values.get("name") == "description" else values.get("property")
+        if key in ("description", "og:title", "og:description") and key not in self._metas:
+            self._metas[key] = values.get("content") or ""
+
+    def result(self) -> ExtractedHTML:
+        """Close the document and pick the fields."""
+        self.close()
+        while self._stack:
+            self._close_top()
+
+        if self._title is not None:
+            title = self._title.text()
+        elif "og:title" in self._metas:
+            title = self._metas["og:title"]
+        else:
+            title = self._h1.text() if self._h1 else ""
+
+        if "description" in self._metas:
+            description = self._metas["description"]
+        elif "og:description" in self._metas:
+            description = self._metas["og:description"]
+        else:
+            description = self._first_p.text()[:200] if self._first_p else ""
+
+        article = max(self._articles, key=lambda c: c.score, default=None)
+        main = max(self._mains, key=lambda c: c.score, default=None)
+        text = ""
+        for container in (article, main):
+            if container is not None and len(container.text()) > MIN_CONTENT_CHARS:
+                text = container.text()
+                break
+        if not text:
+            cluster = " ".join(p for p in self._paragraphs if len(p) >= MIN_CLUSTER_PARAGRAPH_CHARS)
+            if len(cluster) > MIN_CONTENT_CHARS:
+                text = cluster
+            elif self._body is not None:
+                text = self._body.text()
+
+        paragraphs: List[str] = []
+        if self.with_paragraphs:
+            root = article or main or self._body
+            for block in self._blocks:
+                if block.has_block or (root is not None and id(root) not in block.containers):
+                    continue
+                block_text = block.text()
+                if len(block_text) >= MIN_PARAGRAPH_CHARS:
+                    paragraphs.append(block_text)
+        return ExtractedHTML(title=title, description=description, text=text, paragraphs=paragraphs)
+
+
+def extract_html(html: str, with_paragraphs: bool = True) -> ExtractedHTML:
+    """Title, description, main text and (optionally) content paragraphs of an HTML document."""
+    extractor = MainContentExtractor(with_paragraphs)
+    extractor.feed(html)
+    return extractor.result()
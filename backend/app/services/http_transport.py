@@ -0,0 +1,254 @@
+"""Shared httpx client factory with a pluggable record/replay transport.
+
+HTTP_TRANSPORT_MODE selects how outbound calls from LLMAnalyzer, SearchService
+and Crawler are made:
+
+- live: normal network access (default)
+- record: calls go to the network and every request/response pair is appended
+  to the cassette file (JSON lines), along with the /analyze inputs that
+  caused them
+- replay: calls are answered from the cassette, either with the recorded
+  timings or with zero latency
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import httpx
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Never written to cassettes
+_REDACTED_PARAMS = {"key", "cx"}
+_REDACTED_HEADERS = {"x-goog-api-key", "authorization", "cookie", "set-cookie"}
+
+
+def _redacted_url(url: httpx.URL) -> str:
+    """URL with credentials removed and query parameters in a stable order."""
+    parts = urlsplit(str(url))
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _REDACTED_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def _interaction_key(method: str, url: str, body: bytes, match: str) -> Tuple[str, str, str]:
+    body_hash = hashlib.sha256(body).hexdigest() if match == "strict" and body else ""
+    return method.upper(), url, body_hash
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Send requests over the network and append each interaction to a cassette."""
+
+    def __init__(self, path: str, inner: Optional[httpx.AsyncBaseTransport] = None):
+        """Initialize recording transport."""
+        self.path = path
+        self.inner = inner or httpx.AsyncHTTPTransport()
+        self._lock = threading.Lock()
+        # Upstream endpoints in use, so a replay can be pointed at the same URLs
+        self.write({"type": "config", "endpoints": recorded_endpoints(), "recorded_at": time.time()})
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        """Append one JSON line to the cassette."""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        start = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        # Raw (still content-encoded) bytes so replay hands httpx exactly what the server sent
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        await response.aclose()
+        elapsed = time.perf_counter() - start
+
+        self.write({
+            "type": "http",
+            "method": request.method,
+            "url": _redacted_url(request.url),
+            "request_sha256": hashlib.sha256(body).hexdigest() if body else "",
+            "status": response.status_code,
+            "headers": [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _REDACTED_HEADERS],
+            "body_b64": base64.b64encode(raw).decode("ascii"),
+            "elapsed": round(elapsed, 4),
+            "recorded_at": time.time(),
+        })
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=raw,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        # Shared by every client; closing one client must not close the pool under the others
+        pass
+
+    async def shutdown(self) -> None:
+        """Close the underlying connection pool."""
+        await self.inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answer requests from a cassette instead of the network.
+
+    Interactions are matched on method and redacted URL, plus the request body
+    when ``match`` is "strict". Repeated identical requests are served in the
+    recorded order; once exhausted, the last recording is reused. A request
+    with no recording fails like an unreachable host.
+    """
+
+    def __init__(self, path: str, timing: str = "zero", match: str = "strict"):
+        """Initialize replay transport."""
+        self.path = path
+        self.timing = timing
+        self.match = match
+        self.rewind()
+
+    def rewind(self) -> None:
+        """Reload the cassette so the next requests see the recorded order again."""
+        match = self.match
+        self.calls = 0
+        self.misses = 0
+        self._interactions: Dict[Tuple[str, str, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._last: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        for entry in load_cassette(self.path):
+            if entry.get("type") != "http":
+                continue
+            body_hash = entry.get("request_sha256", "") if match == "strict" else ""
+            self._interactions[(entry["method"].upper(), entry["url"], body_hash)].append(entry)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        key = _interaction_key(request.method, _redacted_url(request.url), body, self.match)
+        self.calls += 1
+
+        queue = self._interactions.get(key)
+        if queue:
+            entry = queue.popleft()
+            self._last[key] = entry
+        else:
+            entry = self._last.get(key)
+        if entry is None:
+            self.misses += 1
+            raise httpx.ConnectError(f"No recorded response for {request.method} {key[1]}", request=request)
+
+        if self.timing == "original" and entry.get("elapsed"):
+            await asyncio.sleep(entry["elapsed"])
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["body_b64"]),
+            request=request,
+        )
+
+
+def recorded_endpoints() -> Dict[str, str]:
+    """Endpoint settings that determine the URLs of API calls."""
+    return {name: getattr(settings, name) for name in ("GEMINI_ENDPOINT", "FACT_CHECK_API_URL", "CUSTOM_SEARCH_URL")}
+
+
+def load_cassette(path: str) -> List[Dict[str, Any]]:
+    """All entries of a cassette file."""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    return entries
+
+
+_transport: Optional[httpx.AsyncBaseTransport] = None
+
+
+def get_transport() -> Optional[httpx.AsyncBaseTransport]:
+    """Transport shared by all outbound clients (None means httpx's default)."""
+    global _transport
+    mode = settings.HTTP_TRANSPORT_MODE
+    if mode == "live" or _transport is not None:
+        return _transport
+    if mode == "record":
+        _transport = RecordingTransport(settings.HTTP_CASSETTE_PATH)
+    elif mode == "replay":
+        _transport = ReplayTransport(settings.HTTP_CASSETTE_PATH, settings.HTTP_REPLAY_TIMING, settings.HTTP_REPLAY_MATCH)
+    else:
+        raise ValueError(f"Unknown HTTP_TRANSPORT_MODE: {mode}")
+    logger.info(f"Outbound HTTP in {mode} mode using cassette {settings.HTTP_CASSETTE_PATH}")
+    return _transport
+
+
+def create_async_client(**kwargs: Any) -> httpx.AsyncClient:
+    """httpx.AsyncClient for outbound calls, using the configured transport."""
+    transport = get_transport()
+    if transport is not None:
+        kwargs["transport"] = transport
+    return httpx.AsyncClient(**kwargs)
+
+
+def record_workload_input(kind: str, payload: Dict[str, Any]) -> None:
+    """In record mode, store an /analyze input so the workload can be replayed."""
+    transport = get_transport()
+    if isinstance(transport, RecordingTransport):
+        transport.write({"type": "input", "kind": kind, "payload": payload, "recorded_at": time.time()})
+
+
+# Long-lived client per upstream and event loop, so connections are reused across calls
+_shared_clients: Dict[str, Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def get_shared_client(name: str, **kwargs: Any) -> httpx.AsyncClient:
+    """Pooled client for one upstream; pass timeouts per request."""
+    loop = asyncio.get_running_loop()
+    entry = _shared_clients.get(name)
+    if entry is None or entry[0] is not loop or entry[1].is_closed:
+        limits = httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=settings.HTTP_KEEPALIVE_SECONDS
+        )
+        entry = (loop, create_async_client(limits=limits, **kwargs))
+        _shared_clients[name] = entry
+    return entry[1]
+
+
+@asynccontextmanager
+async def shared_client(name: str, **kwargs: Any) -> AsyncIterator[httpx.AsyncClient]:
+    """``async with`` form of get_shared_client; leaves the client open on exit."""
+    yield get_shared_client(name, **kwargs)
+
+
+async def prewarm_connections(urls: Dict[str, str], timeout: float = 5.0) -> Dict[str, str]:
+    """Open a pooled connection to each upstream (name -> URL) with a HEAD request.
+
+    Returns the outcome per upstream. Only used for live traffic; any response,
+    even an error status, leaves a reusable connection in the pool.
+    """
+    if settings.HTTP_TRANSPORT_MODE != "live":
+        return {name: "skipped" for name in urls}
+
+    async def warm(name: str, url: str) -> str:
+        try:
+            response = await get_shared_client(name).head(url, timeout=timeout)
+            return str(response.status_code)
+        except httpx.HTTPError as e:
+            return type(e).__name__
+
+    outcomes = await asyncio.gather(*(warm(name, url) for name, url in urls.items()))
+    return dict(zip(urls, outcomes))
+
+
+async def close_shared_clients() -> None:
+    """Close the pooled clients owned by the running event loop."""
+    loop = asyncio.get_running_loop()
+    for name, (owner, client) in list(_shared_clients.items()):
+        if owner is loop:
+            await client.aclose()
+            del _shared_clients[name]
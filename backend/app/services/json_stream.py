@@ -0,0 +1,95 @@
+"""Incremental parser for JSON arrays arriving in chunks (streamed LLM replies)."""
+import logging
+from typing import Any, List
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = " \t\r\n"
+
+
+class JSONArrayStreamParser:
+    """Yield the elements of the first JSON array in a text stream as each completes.
+
+    Works for a bare array and for an object whose first array value is the
+    one wanted (e.g. ``{"claims": [...]}``). Text after the array is ignored.
+    """
+
+    def __init__(self):
+        """Initialize parser."""
+        self._in_array = False
+        self._done = False
+        self._in_string = False
+        self._escape = False
+        # Nesting depth inside the current element (0: between elements or in a scalar)
+        self._depth = 0
+        self._item: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        """Whether the array has been closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Consume a chunk; returns the elements completed by it."""
+        items: List[Any] = []
+        for ch in chunk:
+            if self._done:
+                break
+            if self._in_string:
+                if self._in_array:
+                    self._item.append(ch)
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._in_array and self._depth == 0:
+                        self._finish(items)
+                continue
+            if not self._in_array:
+                if ch == '"':
+                    self._in_string = True
+                elif ch == "[":
+                    self._in_array = True
+                continue
+            if not self._item:
+                # Between elements
+                if ch in _WHITESPACE or ch == ",":
+                    continue
+                if ch == "]":
+                    self._done = True
+                    continue
+                self._item.append(ch)
+                if ch in "{[":
+                    self._depth = 1
+                elif ch == '"':
+                    self._in_string = True
+                continue
+            if self._depth == 0:
+                # Number or literal element, ended by a delimiter
+                if ch == "," or ch == "]" or ch in _WHITESPACE:
+                    self._finish(items)
+                    self._done = ch == "]"
+                else:
+                    self._item.append(ch)
+                continue
+            self._item.append(ch)
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._finish(items)
+        return items
+
+    def _finish(self, items: List[Any]) -> None:
+        text = "".join(self._item)
+        self._item = []
+        try:
+            items.append(orjson.loads(text))
+        except orjson.JSONDecodeError:
+            logger.debug(f"Skipping unparseable streamed element: {text[:80]}")
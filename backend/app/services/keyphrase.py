@@ -0,0 +1,277 @@
+"""Local keyphrase extraction and search query generation, without an LLM call.
+
+Terms are weighted by inverse document frequency over past claims and
+evidence (titles and snippets), which the pipeline keeps adding to. Named
+entities (runs of capitalized words such as "Great Wall of China") and
+numbers with their unit ("1.4 billion", "6 percent") are kept intact, so a
+query never splits them. Generating the queries for a claim is a few regex
+passes and dictionary lookups.
+"""
+import logging
+import math
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+import orjson
+from ..config import settings
+from ..services.relevance import STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+# Words, keeping decimals, thousands separators, hyphenated names and percent signs ("COVID-19", "40,000", "6%")
+_WORD = re.compile(r"\w+(?:[.,'’-]\w+)*%?", re.UNICODE)
+_TERM = re.compile(r"\w+", re.UNICODE)
+_SENTENCE_END = re.compile(r"[.!?।:;]\s")
+_POSSESSIVE = re.compile(r"['’]s$", re.IGNORECASE)
+
+# Words that add nothing to a search query, on top of the relevance stopwords
+QUERY_STOPWORDS = STOPWORDS | frozenset("""
+about according after again against all also am any because before being between both can could did do
+does doing during each even ever few further here how if into just may might more most much must now
+off once only other over own same should since some such then through too under until up very where
+while why within without yet said says say claim claims claimed reportedly reports reported report
+people thing things new per cent made make makes took take takes got get gets went go goes came come comes
+""".split())
+
+# Words that belong to the number in front of them
+NUMBER_UNITS = frozenset("""
+percent percentage per cent thousand million billion trillion crore crores lakh lakhs people deaths cases
+years year months days hours degrees celsius fahrenheit metres meters kilometres kilometers miles feet km kg
+tonnes tons dollars euros rupees pounds times
+""".split())
+
+# Lowercase words allowed inside a named entity ("Statue of Liberty", "Bank of England")
+_ENTITY_CONNECTORS = frozenset({"of", "de", "la", "del", "von", "van", "and", "the", "for"})
+
+ENTITY_BOOST = 1.5
+NUMBER_BOOST = 1.2
+
+
+def _is_number(word: str) -> bool:
+    return word[:1].isdigit()
+
+
+def _is_capitalized(word: str) -> bool:
+    return word[:1].isupper() or (word.isupper() and len(word) > 1)
+
+
+class IDFTable:
+    """Document frequencies of terms over past claims and evidence texts.
+
+    Terms never seen get the highest weight, so an empty table degrades to
+    equal weights. When the vocabulary outgrows ``max_terms`` the rarest
+    quarter is dropped; those terms are then weighted as unseen, which is
+    close to their real weight anyway.
+    """
+
+    def __init__(self, max_terms: int = 200000):
+        """Initialize table."""
+        self.max_terms = max_terms
+        self.documents = 0
+        self.frequencies: Dict[str, int] = {}
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.frequencies)
+
+    def add_document(self, text: str) -> None:
+        """Count the distinct terms of one document."""
+        if not text:
+            return
+        terms = set(_TERM.findall(text.lower()))
+        if not terms:
+            return
+        frequencies = self.frequencies
+        for term in terms:
+            frequencies[term] = frequencies.get(term, 0) + 1
+        self.documents += 1
+        self.dirty = True
+        if len(frequencies) > self.max_terms:
+            self._prune()
+
+    def add_documents(self, texts: Iterable[str]) -> None:
+        """Count each text as a document."""
+        for text in texts:
+            self.add_document(text)
+
+    def idf(self, term: str) -> float:
+        """Smoothed inverse document frequency of a lowercase term (always positive)."""
+        return math.log((self.documents + 1) / (self.frequencies.get(term, 0) + 1)) + 1.0
+
+    def _prune(self) -> None:
+        keep = self.max_terms * 3 // 4
+        ranked = sorted(self.frequencies.items(), key=lambda item: item[1], reverse=True)
+        self.frequencies = dict(ranked[:keep])
+        logger.info(f"IDF table pruned to {keep} terms")
+
+    def load(self, path: str) -> None:
+        """Merge a table saved with ``save``."""
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+        self.documents += int(data.get("documents", 0))
+        for term, count in data.get("frequencies", {}).items():
+            self.frequencies[term] = self.frequencies.get(term, 0) + int(count)
+        if len(self.frequencies) > self.max_terms:
+            self._prune()
+
+    def save(self, path: str) -> None:
+        """Write the table as JSON (atomically, via a temporary file)."""
+        data = {"documents": self.documents, "frequencies": self.frequencies}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+
+class _Unit:
+    """A query building block: an entity, a number with its unit, or a single term."""
+
+    __slots__ = ("words", "position", "kind", "weight")
+
+    def __init__(self, words: List[str], position: int, kind: str, weight: float):
+        self.words = words
+        self.position = position
+        self.kind = kind
+        self.weight = weight
+
+
+class KeyphraseQueryGenerator:
+    """Build 3-7 word search queries from a claim's highest-IDF keyphrases."""
+
+    def __init__(self, idf_table: IDFTable):
+        """Initialize generator."""
+        self.idf_table = idf_table
+
+    def units(self, claim: str) -> List[_Unit]:
+        """Entities, numbers and content terms of a claim, in order, with weights."""
+        matches = list(_WORD.finditer(claim))
+        sentence_starts = {0} | {m.end() for m in _SENTENCE_END.finditer(claim)}
+        words = [_POSSESSIVE.sub("", m.group()) for m in matches]
+        lowered = [w.lower() for w in words]
+        units: List[_Unit] = []
+        i = 0
+        while i < len(words):
+            word, lower = words[i], lowered[i]
+            if _is_number(word):
+                # A number, plus the unit words after it
+                j = i + 1
+                while j < len(words) and lowered[j] in NUMBER_UNITS and j - i < 3:
+                    j += 1
+                if j == i + 1 and len(word) <= 2:
+                    # A bare small number ("phase 3") says little on its own
+                    units.append(_Unit([word], i, "term", self._weight([lower]) * 0.5))
+                else:
+                    units.append(_Unit(words[i:j], i, "number", self._weight(lowered[i:j]) * NUMBER_BOOST))
+                i = j
+                continue
+            sentence_initial = matches[i].start() in sentence_starts
+            if _is_capitalized(word) and lower not in QUERY_STOPWORDS:
+                # A run of capitalized words, possibly joined by connectors
+                j = i + 1
+                while j < len(words):
+                    if _is_capitalized(words[j]) and not _is_number(words[j]):
+                        j += 1
+                    elif words[j].isdigit() and len(words[j]) <= 2:
+                        # A short number closes a name ("Apollo 11", "Windows 10")
+                        j += 1
+                        break
+                    elif (lowered[j] in _ENTITY_CONNECTORS and j + 1 < len(words)
+                          and _is_capitalized(words[j + 1]) and j > i):
+                        j += 2
+                    else:
+                        break
+                # A lone capitalized word opening a sentence is usually not a name
+                kind = "term" if sentence_initial and j == i + 1 and not word.isupper() else "entity"
+                boost = ENTITY_BOOST if kind == "entity" else 1.0
+                terms = [t for t in lowered[i:j] if t not in _ENTITY_CONNECTORS]
+                units.append(_Unit(words[i:j], i, kind, self._weight(terms) * boost))
+                i = j
+                continue
+            if lower not in QUERY_STOPWORDS and (len(lower) > 2 or lower.isupper()):
+                units.append(_Unit([word], i, "term", self._weight([lower])))
+            i += 1
+        return units
+
+    def _weight(self, terms: List[str]) -> float:
+        idf = self.idf_table.idf
+        # Highest term IDF, nudged up for each extra word so longer names win ties
+        return max(idf(term) for term in terms) * (1.0 + 0.1 * (len(terms) - 1)) if terms else 0.0
+
+    def generate(self, claim: str, max_queries: int = 5) -> List[str]:
+        """Search queries for a claim, most specific first."""
+        units = self.units(claim)
+        if not units:
+            return []
+        by_weight = sorted(units, key=lambda unit: unit.weight, reverse=True)
+        named = [u for u in by_weight if u.kind != "term"]
+        terms = [u for u in by_weight if u.kind == "term"]
+        entities = [u for u in named if u.kind == "entity"]
+
+        candidates = [
+            # Every entity and number, filled up with the strongest terms
+            _assemble(named + terms, max_words=7),
+            # Names and the strongest terms, without figures that might be phrased differently
+            _assemble(entities + terms, max_words=5),
+            # The few most distinctive units
+            _assemble(by_weight, max_words=4),
+            # Subject and predicate: the best entity with the strongest terms
+            _assemble(entities[:1] + terms, max_words=3),
+            _assemble(terms, max_words=5),
+        ]
+        queries: List[str] = []
+        seen = set()
+        for query in candidates:
+            key = query.lower()
+            if query and key not in seen and (len(query.split()) >= 2 or not queries):
+                seen.add(key)
+                queries.append(query)
+        return queries[:max_queries]
+
+
+def _assemble(units: List[_Unit], max_words: int) -> str:
+    """Join units picked in the given order, within the word budget, in claim order."""
+    picked = []
+    words = 0
+    for unit in units:
+        if unit in picked:
+            continue
+        size = len(unit.words)
+        if words + size > max_words:
+            if words >= 3:
+                break
+            continue
+        picked.append(unit)
+        words += size
+    picked.sort(key=lambda unit: unit.position)
+    return " ".join(word for unit in picked for word in unit.words)
+
+
+_idf_table: Optional[IDFTable] = None
+
+
+def get_idf_table() -> IDFTable:
+    """Process-wide IDF table, loaded from QUERY_IDF_FILE on first use if it exists."""
+    global _idf_table
+    if _idf_table is None:
+        _idf_table = IDFTable(settings.QUERY_IDF_MAX_TERMS)
+        path = settings.QUERY_IDF_FILE
+        if path and os.path.exists(path):
+            try:
+                _idf_table.load(path)
+                logger.info(f"Loaded IDF table of {_idf_table.documents} documents from {path}")
+            except (OSError, ValueError) as e:
+                logger.error(f"Could not load IDF table: {e}")
+    return _idf_table
+
+
+def save_idf_table() -> None:
+    """Write the process-wide table back to QUERY_IDF_FILE, if set and changed."""
+    path = settings.QUERY_IDF_FILE
+    if not path or _idf_table is None or not _idf_table.dirty:
+        return
+    try:
+        _idf_table.save(path)
+        logger.info(f"Saved IDF table of {_idf_table.documents} documents to {path}")
+    except OSError as e:
+        logger.error(f"Could not save IDF table: {e}")
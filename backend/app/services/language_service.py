@@ -1,14 +1,30 @@
 """Service for language detection only."""
 from langdetect import detect
+from langdetect.detector_factory import init_factory
 from langdetect.lang_detect_exception import LangDetectException
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+_profiles_lock = threading.Lock()
+_profiles_loaded = False
+
 
 class LanguageService:
     """Service for detecting the language of text."""
     
+    @staticmethod
+    def warm_up() -> None:
+        """Load langdetect's language profiles, which the first detection would otherwise load."""
+        global _profiles_loaded
+        # langdetect publishes its factory before the profiles are loaded; a detection
+        # racing the warm-up thread would see a partial profile set
+        with _profiles_lock:
+            if not _profiles_loaded:
+                init_factory()
+                _profiles_loaded = True
+    
     @staticmethod
     def detect_language(text: str) -> str:
         """Detect the language of the given text.
@@ -22,6 +38,8 @@ class LanguageService:
         if not text or len(text.strip()) < 3:
             return "en"
         
+        if not _profiles_loaded:
+            LanguageService.warm_up()
         try:
             detected = detect(text)
             logger.debug(f"Detected language: {detected} for text: {text[:50]}")
@@ -1,8 +1,25 @@
 """Service for LLM-based analysis using Google Gemini."""
 import httpx
 import json
-from typing import Dict, Any, Optional, List
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, AsyncIterator, Optional, List, Tuple
+import orjson
 from ..config import settings
+from ..models import Evidence, FinalVerdict, Verdict
+from ..services.rate_limiter import get_rate_limiter, send_with_rate_limit, estimate_tokens
+from ..services.circuit_breaker import CircuitOpenError, get_breaker, is_failure_status
+from ..services.http_transport import shared_client
+from ..services.json_stream import JSONArrayStreamParser
+from ..services.deadline import check_deadline, stage_timeout
+from ..services.gemini_cache import get_context_cache
+from ..services.metrics import record_llm_call, record_llm_first_token, record_upstream_call, stage_timer
+
+logger = logging.getLogger(__name__)
+
+CODE_FENCE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
 
 
 SYSTEM_PROMPT = """You are a fact-checking assistant. Your task is to analyze claims and provide structured JSON responses only.
@@ -17,6 +34,110 @@ When fact-checking:
 
 Always return confidence scores between 0.0 and 1.0."""
 
+# Static instructions of the verdict tasks. They go in systemInstruction, ahead of the
+# per-claim evidence, so every call shares the same prefix (and a context cache handle)
+FACTCHECK_SYSTEM_PROMPT = SYSTEM_PROMPT + """
+
+You will be given a claim, optionally its original context, and evidence snippets ranked by relevance and source authority.
+
+Analyze the evidence considering:
+- Fact Check API sources are highest priority
+- Government, educational, and major news sources are authoritative
+- URL credibility and snippet relevance
+
+Provide a JSON object with:
+{
+    "verdict": "true|false|partially_true|unverified",
+    "confidence": 0.0-1.0,
+    "explanation": "A clear 2-3 sentence explanation of your verdict, referencing specific URLs and snippets",
+    "evidence": "Key supporting evidence from the snippets, include URL references where relevant"
+}
+
+Return ONLY valid JSON, no markdown, no code blocks."""
+
+FINAL_VERDICT_SYSTEM_PROMPT = SYSTEM_PROMPT + """
+
+You will be given a claim and an evidence summary of fact-check results, crawled article content and search result snippets.
+
+INSTRUCTIONS:
+1. Analyze supporting vs contradicting sources
+2. Weigh FactCheck API results HIGHEST (they are verified fact-checks)
+3. Evaluate domain authority: .gov, .edu, major news outlets (Reuters, BBC, etc.) are more credible
+4. Consider recency and source diversity
+5. Compute a TRUTH SCORE (0-100 integer) where:
+   - 90-100: TRUE (strong evidence from multiple authoritative sources)
+   - 70-89: LIKELY TRUE (good evidence, may have minor contradictions)
+   - 40-69: UNCERTAIN / MIXED (conflicting evidence or insufficient data)
+   - 20-39: LIKELY FALSE (evidence suggests falsehood, but not definitive)
+   - 0-19: FALSE (strong evidence contradicts the claim)
+
+6. Assign verdict label: TRUE, LIKELY_TRUE, UNCERTAIN, LIKELY_FALSE, or FALSE
+7. Provide confidence level: "high", "medium", or "low"
+8. Write 3-5 sentence reasoning explaining your score, mentioning specific sources
+9. List key citation URLs (up to 5 most important)
+
+Return JSON only:
+{
+  "score": 85,
+  "verdict": "LIKELY_TRUE",
+  "confidence": "high",
+  "reasoning": "Detailed reasoning here...",
+  "citations": ["https://example1.com", "https://example2.com"]
+}
+
+Return ONLY valid JSON, no markdown, no code blocks."""
+
+# Statuses Gemini answers a request with when its cachedContent handle is gone
+CACHE_REJECTED_STATUSES = frozenset({400, 403, 404})
+
+
+def parse_json_reply(content: str) -> Any:
+    """Parse a JSON reply; tolerates code fences and text around the JSON.
+    
+    Schema-constrained replies parse on the first try. Otherwise the first
+    complete JSON value in the reply is decoded (not a greedy regex match,
+    which breaks on trailing text containing braces).
+    """
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        pass
+    fenced = CODE_FENCE.search(content)
+    candidate = fenced.group(1) if fenced else content
+    decoder = json.JSONDecoder()
+    for match in re.finditer(r'[\[{]', candidate):
+        try:
+            return decoder.raw_decode(candidate, match.start())[0]
+        except json.JSONDecodeError:
+            continue
+    return {"error": "Could not parse JSON response", "raw": content}
+
+
+@dataclass(frozen=True)
+class TaskProfile:
+    """Model and generation limits of one kind of Gemini call."""
+
+    model: str
+    max_output_tokens: int = 8192
+    # None follows GEMINI_TEMPERATURE
+    temperature: Optional[float] = None
+    timeout_seconds: float = 30.0
+
+
+def estimate_cost(model: str, prompt_tokens: int, output_tokens: int, cached_tokens: int = 0) -> float:
+    """Estimated USD cost of a call from GEMINI_PRICING (0 for unpriced models).
+    
+    Versioned names ("gemini-2.0-flash-001") are priced as their longest
+    listed prefix. ``cached_tokens`` (part of ``prompt_tokens``) are billed
+    at GEMINI_CACHED_INPUT_DISCOUNT of the input price.
+    """
+    prices = [key for key in settings.GEMINI_PRICING if model.startswith(key)]
+    if not prices:
+        return 0.0
+    input_price, output_price = settings.GEMINI_PRICING[max(prices, key=len)]
+    input_tokens = prompt_tokens - cached_tokens + cached_tokens * settings.GEMINI_CACHED_INPUT_DISCOUNT
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
 
 class LLMAnalyzer:
     """Analyzer using Google Gemini API."""
@@ -27,63 +148,182 @@ class LLMAnalyzer:
         self.model = settings.SIFT_GEMINI_MODEL
         self.endpoint_base = settings.GEMINI_ENDPOINT
         self.temperature = settings.GEMINI_TEMPERATURE
+        self.rate_limiter = get_rate_limiter("gemini")
+        self.breaker = get_breaker("gemini")
+        self._profiles: Dict[str, TaskProfile] = {}
+    
+    def task_profile(self, task: str) -> TaskProfile:
+        """Generation profile of a task from GEMINI_TASK_PROFILES ("general" if it has none)."""
+        profile = self._profiles.get(task)
+        if profile is None:
+            profiles = settings.GEMINI_TASK_PROFILES
+            values = profiles.get(task) or profiles.get("general") or {}
+            model = values.get("model")
+            if model == "light":
+                model = settings.SIFT_GEMINI_LIGHT_MODEL
+            profile = TaskProfile(
+                model=model or self.model,
+                max_output_tokens=int(values.get("max_output_tokens") or 8192),
+                temperature=values.get("temperature"),
+                timeout_seconds=float(values.get("timeout_seconds") or 30.0),
+            )
+            self._profiles[task] = profile
+        return profile
     
-    def _get_endpoint_url(self) -> str:
+    def _get_endpoint_url(self, model: Optional[str] = None, action: str = "generateContent") -> str:
         """Get the Gemini API endpoint URL."""
-        return f"{self.endpoint_base}/{self.model}:generateContent"
+        return f"{self.endpoint_base}/{model or self.model}:{action}"
+    
+    def _record_call(self, task: str, model: str, started: float, usage: Dict[str, Any]) -> None:
+        """Record a finished call's latency, tokens and estimated cost under its task."""
+        prompt_tokens = usage.get("promptTokenCount", 0)
+        output_tokens = usage.get("candidatesTokenCount", 0)
+        cached_tokens = usage.get("cachedContentTokenCount", 0)
+        record_llm_call(
+            task, model, time.perf_counter() - started, prompt_tokens, output_tokens,
+            estimate_cost(model, prompt_tokens, output_tokens, cached_tokens), cached_tokens
+        )
+    
+    async def _cached_content(self, model: str, system_message: str) -> Optional[str]:
+        """Context cache handle of the system instruction, or None to send it inline."""
+        cache = get_context_cache()
+        return await cache.handle(model, system_message) if cache else None
+    
+    def _drop_cached_content(self, model: str, system_message: str) -> None:
+        """Forget a handle Gemini rejected."""
+        logger.info(f"Gemini rejected the cached system instruction for {model}; sending it inline")
+        cache = get_context_cache()
+        if cache:
+            cache.invalidate(model, system_message)
     
     async def analyze(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         response_format: str = "text",
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        task: str = "general",
+        response_schema: Optional[Dict[str, Any]] = None
     ) -> Any:
-        """Analyze text using Gemini API."""
+        """Analyze text using Gemini API.
+        
+        ``task`` names the caller (claim_extraction, query_generation, ...),
+        selects its generation profile (model, output-token cap, temperature,
+        timeout) and labels the call's latency, tokens and cost in the
+        metrics. An explicit ``temperature`` overrides the profile's. With
+        ``response_format="json"``, ``response_schema`` constrains the reply to
+        that schema (Gemini responseSchema).
+        """
+        with stage_timer(f"llm_{task}"):
+            return await self._generate(prompt, system_prompt, response_format, temperature, response_schema, task)
+    
+    def _check_available(self) -> None:
+        """Raise unless a Gemini call may be made now."""
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY not configured")
         
-        system_message = system_prompt or SYSTEM_PROMPT
+        # Fail fast to the caller's fallback while Gemini is degraded or time is up
+        if not self.breaker.allow_request():
+            record_upstream_call("gemini", "circuit_open")
+            raise CircuitOpenError("Circuit breaker 'gemini' is open")
+        check_deadline("Gemini call")
+    
+    def _build_payload(
+        self,
+        prompt: str,
+        system_message: str,
+        response_format: str,
+        temperature: Optional[float],
+        response_schema: Optional[Dict[str, Any]],
+        profile: TaskProfile,
+        cached_content: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """Request body and estimated input tokens of a Gemini call.
         
+        The static system message goes in systemInstruction, or is referenced
+        by its ``cached_content`` handle; only the prompt is in the user turn.
+        """
         # Gemini API structure
         contents = [
             {
                 "role": "user",
                 "parts": [
-                    {"text": system_message},
                     {"text": prompt}
                 ]
             }
         ]
         
+        if temperature is None:
+            temperature = self.temperature if profile.temperature is None else profile.temperature
         generation_config = {
-            "temperature": temperature or self.temperature,
+            "temperature": temperature,
             "topK": 40,
             "topP": 0.95,
-            "maxOutputTokens": 8192,
+            "maxOutputTokens": profile.max_output_tokens,
         }
         
         if response_format == "json":
             generation_config["responseMimeType"] = "application/json"
+            if response_schema:
+                generation_config["responseSchema"] = response_schema
         
         payload = {
             "contents": contents,
             "generationConfig": generation_config
         }
+        if cached_content:
+            # Gemini rejects a systemInstruction next to a cachedContent that holds it
+            payload["cachedContent"] = cached_content
+        else:
+            payload["systemInstruction"] = {"parts": [{"text": system_message}]}
+        return payload, estimate_tokens(system_message, prompt)
+    
+    async def _generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        response_format: str,
+        temperature: Optional[float],
+        response_schema: Optional[Dict[str, Any]] = None,
+        task: str = "general"
+    ) -> Any:
+        """Send one generateContent request and parse the reply."""
+        self._check_available()
+        profile = self.task_profile(task)
+        system_message = system_prompt or SYSTEM_PROMPT
+        cached_content = await self._cached_content(profile.model, system_message)
+        payload, estimated_tokens = self._build_payload(
+            prompt, system_message, response_format, temperature, response_schema, profile, cached_content
+        )
+        started = time.perf_counter()
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                url = self._get_endpoint_url()
+            async with shared_client("gemini") as client:
+                url = self._get_endpoint_url(profile.model)
                 params = {"key": self.api_key}
                 
-                response = await client.post(
-                    url,
-                    json=payload,
-                    params=params
-                )
+                def send() -> Any:
+                    return client.post(url, json=payload, params=params, timeout=stage_timeout(profile.timeout_seconds))
+                
+                response = await send_with_rate_limit(self.rate_limiter, send, tokens=estimated_tokens)
+                if cached_content and response.status_code in CACHE_REJECTED_STATUSES:
+                    # The handle expired or was deleted early: resend with the instruction inline
+                    self._drop_cached_content(profile.model, system_message)
+                    payload, estimated_tokens = self._build_payload(
+                        prompt, system_message, response_format, temperature, response_schema, profile
+                    )
+                    response = await send_with_rate_limit(self.rate_limiter, send, tokens=estimated_tokens)
+                if is_failure_status(response.status_code):
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
                 response.raise_for_status()
                 
-                data = response.json()
+                data = orjson.loads(response.content)
+                
+                usage = data.get("usageMetadata", {})
+                self.rate_limiter.record_usage(estimated_tokens, usage.get("promptTokenCount", 0))
+                self._record_call(task, profile.model, started, usage)
                 
                 # Extract text from Gemini response
                 if "candidates" in data and len(data["candidates"]) > 0:
@@ -95,19 +335,7 @@ class LLMAnalyzer:
                             
                             # Parse JSON if requested
                             if response_format == "json":
-                                try:
-                                    return json.loads(content)
-                                except json.JSONDecodeError:
-                                    # Try to extract JSON from markdown code blocks
-                                    import re
-                                    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-                                    if json_match:
-                                        return json.loads(json_match.group(1))
-                                    # Try bare JSON
-                                    json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                                    if json_match:
-                                        return json.loads(json_match.group())
-                                    return {"error": "Could not parse JSON response", "raw": content}
+                                return parse_json_reply(content)
                             
                             return content
                 
@@ -117,18 +345,119 @@ class LLMAnalyzer:
             error_msg = f"HTTP error in Gemini API: {e.response.status_code}"
             if e.response.text:
                 error_msg += f" - {e.response.text}"
-            print(error_msg)
+            logger.error(error_msg)
+            raise
+        except httpx.TransportError as e:
+            self.breaker.record_failure()
+            logger.error(f"Gemini API unreachable: {type(e).__name__}: {e}")
             raise
         except Exception as e:
-            print(f"Error in LLM analysis: {e}")
+            logger.error(f"Error in LLM analysis: {e}")
+            raise
+    
+    async def stream_json_items(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        task: str = "general",
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Any]:
+        """Stream a JSON reply and yield each element of its first array as soon as it is complete.
+        
+        Uses streamGenerateContent (server-sent events), so callers can start
+        working on the first elements while Gemini is still generating the rest.
+        Raises like analyze if the call fails; elements already yielded stand.
+        """
+        with stage_timer(f"llm_{task}"):
+            async for item in self._stream(prompt, system_prompt, temperature, response_schema, task):
+                yield item
+    
+    async def _stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        response_schema: Optional[Dict[str, Any]],
+        task: str = "general"
+    ) -> AsyncIterator[Any]:
+        """Send one streamGenerateContent request and parse array elements from it."""
+        self._check_available()
+        profile = self.task_profile(task)
+        system_message = system_prompt or SYSTEM_PROMPT
+        cached_content = await self._cached_content(profile.model, system_message)
+        payload, estimated_tokens = self._build_payload(
+            prompt, system_message, "json", temperature, response_schema, profile, cached_content
+        )
+        started = time.perf_counter()
+        first_token = True
+        parser = JSONArrayStreamParser()
+        usage: Dict[str, Any] = {}
+        
+        try:
+            async with shared_client("gemini") as client:
+                async def send() -> httpx.Response:
+                    request = client.build_request(
+                        "POST",
+                        self._get_endpoint_url(profile.model, "streamGenerateContent"),
+                        json=payload,
+                        params={"key": self.api_key, "alt": "sse"},
+                        timeout=stage_timeout(profile.timeout_seconds)
+                    )
+                    response = await client.send(request, stream=True)
+                    if response.status_code >= 400:
+                        # Error bodies are small; reading them releases the connection before a retry
+                        await response.aread()
+                    return response
+                
+                response = await send_with_rate_limit(self.rate_limiter, send, tokens=estimated_tokens)
+                if cached_content and response.status_code in CACHE_REJECTED_STATUSES:
+                    # The handle expired or was deleted early: resend with the instruction inline
+                    await response.aclose()
+                    self._drop_cached_content(profile.model, system_message)
+                    payload, estimated_tokens = self._build_payload(
+                        prompt, system_message, "json", temperature, response_schema, profile
+                    )
+                    response = await send_with_rate_limit(self.rate_limiter, send, tokens=estimated_tokens)
+                try:
+                    if is_failure_status(response.status_code):
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                    response.raise_for_status()
+                    
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        chunk = orjson.loads(line[5:])
+                        usage = chunk.get("usageMetadata", usage)
+                        if first_token:
+                            first_token = False
+                            record_llm_first_token(task, profile.model, time.perf_counter() - started)
+                        for candidate in chunk.get("candidates", [])[:1]:
+                            for part in candidate.get("content", {}).get("parts", []):
+                                for item in parser.feed(part.get("text", "")):
+                                    yield item
+                finally:
+                    await response.aclose()
+            
+            self.rate_limiter.record_usage(estimated_tokens, usage.get("promptTokenCount", 0))
+            self._record_call(task, profile.model, started, usage)
+        
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error in Gemini API stream: {e.response.status_code} - {e.response.text}")
+            raise
+        except httpx.TransportError as e:
+            self.breaker.record_failure()
+            logger.error(f"Gemini API stream unreachable: {type(e).__name__}: {e}")
             raise
     
     async def factcheck_claim(
         self,
         claim: str,
         context: Optional[str] = None,
-        evidence_snippets: Optional[List[Dict[str, Any]]] = None
-    ) -> Dict[str, Any]:
+        evidence_snippets: Optional[List[Evidence]] = None
+    ) -> Verdict:
         """Fact-check a claim using Gemini with evidence snippets.
         
         Includes URL + snippet for each evidence piece in the prompt.
@@ -137,73 +466,44 @@ class LLMAnalyzer:
         if evidence_snippets:
             evidence_text = "\n\nEvidence Snippets (ranked by relevance and source authority):\n"
             for i, snippet in enumerate(evidence_snippets[:10], 1):
-                source = snippet.get("source", "Unknown")
-                text = snippet.get("text", "") or snippet.get("snippet", "")
-                url = snippet.get("url", "")
-                relevance_score = snippet.get("relevance_score", 0.0)
-                source_priority = snippet.get("source_priority", 1.0)
-                is_authoritative = snippet.get("is_authoritative", False)
-                
                 # Priority indicator
                 priority_label = ""
-                if source_priority >= 3.0:
+                if snippet.source_priority >= 3.0:
                     priority_label = " [FACT-CHECK API - Highest Priority]"
-                elif source_priority >= 2.0:
+                elif snippet.source_priority >= 2.0:
                     priority_label = " [Authoritative Source - Gov/Edu/News]"
                 
-                evidence_text += f"{i}. Source: {source}{priority_label}\n"
-                evidence_text += f"   URL: {url}\n"
-                evidence_text += f"   Snippet: {text[:400]}\n"
-                evidence_text += f"   Relevance Score: {relevance_score:.2f}\n\n"
+                evidence_text += f"{i}. Source: {snippet.source or 'Unknown'}{priority_label}\n"
+                evidence_text += f"   URL: {snippet.url}\n"
+                evidence_text += f"   Snippet: {snippet.snippet[:400]}\n"
+                evidence_text += f"   Relevance Score: {snippet.relevance_score:.2f}\n\n"
         
         context_text = f"\nOriginal Context: {context[:500]}" if context else ""
         
         prompt = f"""Fact-check the following claim based on the provided evidence snippets.
 
-Claim: "{claim}"{context_text}{evidence_text}
-
-Analyze the evidence considering:
-- Fact Check API sources are highest priority
-- Government, educational, and major news sources are authoritative
-- URL credibility and snippet relevance
-
-Provide a JSON object with:
-{{
-    "verdict": "true|false|partially_true|unverified",
-    "confidence": 0.0-1.0,
-    "explanation": "A clear 2-3 sentence explanation of your verdict, referencing specific URLs and snippets",
-    "evidence": "Key supporting evidence from the snippets, include URL references where relevant"
-}}
-
-Return ONLY valid JSON, no markdown, no code blocks."""
+Claim: "{claim}"{context_text}{evidence_text}"""
         
         try:
-            response = await self.analyze(prompt, response_format="json", temperature=self.temperature)
-            if isinstance(response, dict):
-                return {
-                    "verdict": response.get("verdict", "unverified"),
-                    "confidence": float(response.get("confidence", 0.0)),
-                    "explanation": response.get("explanation", ""),
-                    "evidence": response.get("evidence", "")
-                }
+            response = await self.analyze(
+                prompt, system_prompt=FACTCHECK_SYSTEM_PROMPT, response_format="json",
+                task="factcheck_verdict", response_schema=Verdict.RESPONSE_SCHEMA
+            )
+            if isinstance(response, dict) and "error" not in response:
+                return Verdict.from_json(response)
         except Exception as e:
-            print(f"Error in fact-checking: {e}")
+            logger.warning(f"Error in fact-checking: {e}")
         
         # Fallback response
-        return {
-            "verdict": "unverified",
-            "confidence": 0.0,
-            "explanation": "Could not verify claim due to analysis error.",
-            "evidence": ""
-        }
+        return Verdict(explanation="Could not verify claim due to analysis error.")
     
     async def generate_final_verdict(
         self,
         claim: str,
-        factcheck_results: List[Dict[str, Any]],
-        crawled_content: List[Dict[str, Any]],
-        search_snippets: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+        factcheck_results: List[Evidence],
+        crawled_content: List[Evidence],
+        search_snippets: List[Evidence]
+    ) -> FinalVerdict:
         """Generate final AI-verified verdict by analyzing all evidence sources.
         
         Weighs FactCheck API results highest, evaluates domain authority,
@@ -216,11 +516,8 @@ Return ONLY valid JSON, no markdown, no code blocks."""
             search_snippets: List of search result snippets
             
         Returns:
-            Dict with score (0-100), verdict, confidence, reasoning, and citations
+            FinalVerdict with score (0-100), verdict, confidence, reasoning, and citations
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # Build comprehensive evidence summary
         evidence_text = "=== EVIDENCE SUMMARY ===\n\n"
         
@@ -228,36 +525,28 @@ Return ONLY valid JSON, no markdown, no code blocks."""
         if factcheck_results:
             evidence_text += "FACT-CHECK API RESULTS (Highest Priority):\n"
             for i, result in enumerate(factcheck_results[:5], 1):
-                url = result.get("url", "")
-                snippet = result.get("snippet", "")
-                title = result.get("title", "")
-                evidence_text += f"{i}. {title}\n"
-                evidence_text += f"   URL: {url}\n"
-                evidence_text += f"   Content: {snippet[:300]}\n\n"
+                evidence_text += f"{i}. {result.title}\n"
+                evidence_text += f"   URL: {result.url}\n"
+                evidence_text += f"   Content: {result.snippet[:300]}\n\n"
         
         # Crawled content (authoritative sources)
         if crawled_content:
             evidence_text += "\nCRAWLED ARTICLE CONTENT:\n"
             for i, content in enumerate(crawled_content[:5], 1):
-                url = content.get("url", "")
-                text = content.get("crawled_text", "") or content.get("text", "")
-                title = content.get("title", "")
-                domain = url.split("/")[2] if url else "unknown"
-                evidence_text += f"{i}. {title} ({domain})\n"
-                evidence_text += f"   URL: {url}\n"
+                text = content.crawled_text or content.snippet
+                domain = content.url.split("/")[2] if content.url else "unknown"
+                evidence_text += f"{i}. {content.title} ({domain})\n"
+                evidence_text += f"   URL: {content.url}\n"
                 evidence_text += f"   Excerpt: {text[:400]}\n\n"
         
         # Search snippets
         if search_snippets:
             evidence_text += "\nSEARCH RESULT SNIPPETS:\n"
             for i, snippet in enumerate(search_snippets[:5], 1):
-                url = snippet.get("url", "")
-                text = snippet.get("snippet", "")
-                title = snippet.get("title", "")
-                domain = url.split("/")[2] if url else "unknown"
-                evidence_text += f"{i}. {title} ({domain})\n"
-                evidence_text += f"   URL: {url}\n"
-                evidence_text += f"   Snippet: {text[:300]}\n\n"
+                domain = snippet.url.split("/")[2] if snippet.url else "unknown"
+                evidence_text += f"{i}. {snippet.title} ({domain})\n"
+                evidence_text += f"   URL: {snippet.url}\n"
+                evidence_text += f"   Snippet: {snippet.snippet[:300]}\n\n"
         
         if not evidence_text or evidence_text == "=== EVIDENCE SUMMARY ===\n\n":
             evidence_text = "No evidence found from any sources."
@@ -266,88 +555,31 @@ Return ONLY valid JSON, no markdown, no code blocks."""
 
 CLAIM: "{claim}"
 
-{evidence_text}
-
-INSTRUCTIONS:
-1. Analyze supporting vs contradicting sources
-2. Weigh FactCheck API results HIGHEST (they are verified fact-checks)
-3. Evaluate domain authority: .gov, .edu, major news outlets (Reuters, BBC, etc.) are more credible
-4. Consider recency and source diversity
-5. Compute a TRUTH SCORE (0-100 integer) where:
-   - 90-100: TRUE (strong evidence from multiple authoritative sources)
-   - 70-89: LIKELY TRUE (good evidence, may have minor contradictions)
-   - 40-69: UNCERTAIN / MIXED (conflicting evidence or insufficient data)
-   - 20-39: LIKELY FALSE (evidence suggests falsehood, but not definitive)
-   - 0-19: FALSE (strong evidence contradicts the claim)
-
-6. Assign verdict label: TRUE, LIKELY_TRUE, UNCERTAIN, LIKELY_FALSE, or FALSE
-7. Provide confidence level: "high", "medium", or "low"
-8. Write 3-5 sentence reasoning explaining your score, mentioning specific sources
-9. List key citation URLs (up to 5 most important)
-
-Return JSON only:
-{{
-  "score": 85,
-  "verdict": "LIKELY_TRUE",
-  "confidence": "high",
-  "reasoning": "Detailed reasoning here...",
-  "citations": ["https://example1.com", "https://example2.com"]
-}}
-
-Return ONLY valid JSON, no markdown, no code blocks."""
+{evidence_text}"""
         
+        model = self.task_profile("final_verdict").model
         try:
-            logger.info(f"Generating final verdict using {self.model} for claim: {claim[:50]}...")
-            response = await self.analyze(prompt, response_format="json", temperature=0.1)
+            logger.info(f"Generating final verdict using {model} for claim: {claim[:50]}...")
+            response = await self.analyze(
+                prompt, system_prompt=FINAL_VERDICT_SYSTEM_PROMPT, response_format="json",
+                task="final_verdict", response_schema=FinalVerdict.RESPONSE_SCHEMA
+            )
             
-            if isinstance(response, dict):
+            if isinstance(response, dict) and "error" not in response:
                 # Validate and normalize response
-                score = int(response.get("score", 50))
-                score = max(0, min(100, score))  # Clamp to 0-100
-                
-                verdict_raw = response.get("verdict", "UNCERTAIN").upper()
-                verdict_map = {
-                    "TRUE": "TRUE",
-                    "LIKELY_TRUE": "LIKELY_TRUE",
-                    "UNCERTAIN": "UNCERTAIN",
-                    "MIXED": "UNCERTAIN",
-                    "LIKELY_FALSE": "LIKELY_FALSE",
-                    "FALSE": "FALSE"
-                }
-                verdict = verdict_map.get(verdict_raw, "UNCERTAIN")
-                
-                confidence_raw = response.get("confidence", "medium").lower()
-                confidence_map = {"high": "high", "medium": "medium", "low": "low"}
-                confidence = confidence_map.get(confidence_raw, "medium")
-                
-                reasoning = response.get("reasoning", "")
-                citations = response.get("citations", [])
-                if not isinstance(citations, list):
-                    citations = []
-                
-                logger.info(f"Final verdict generated: {verdict} (score: {score}, confidence: {confidence})")
-                
-                return {
-                    "score": score,
-                    "verdict": verdict,
-                    "confidence": confidence,
-                    "reasoning": reasoning,
-                    "citations": citations[:5]  # Limit to 5 citations
-                }
+                final_verdict = FinalVerdict.from_json(response)
+                logger.info(f"Final verdict generated: {final_verdict.verdict} (score: {final_verdict.score}, confidence: {final_verdict.confidence})")
+                return final_verdict
             else:
                 logger.warning(f"Unexpected response format from final verdict generation")
                 return self._get_fallback_final_verdict()
                 
         except Exception as e:
-            logger.error(f"Error generating final verdict using {self.model}: {e}")
+            logger.error(f"Error generating final verdict using {model}: {e}")
             return self._get_fallback_final_verdict()
     
-    def _get_fallback_final_verdict(self) -> Dict[str, Any]:
+    def _get_fallback_final_verdict(self) -> FinalVerdict:
         """Fallback final verdict when Gemini scoring fails."""
-        return {
-            "score": 50,
-            "verdict": "UNCERTAIN",
-            "confidence": "low",
-            "reasoning": "Could not generate AI-verified final verdict. Showing evidence-only result.",
-            "citations": []
-        }
+        return FinalVerdict(
+            reasoning="Could not generate AI-verified final verdict. Showing evidence-only result."
+        )
@@ -0,0 +1,83 @@
+"""Per-request ceiling on the response bodies held in memory at once."""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class MemoryBudget:
+    """Bytes a request may hold in fetched response bodies at the same time."""
+
+    def __init__(self, limit_bytes: int):
+        """Initialize budget."""
+        self.limit_bytes = limit_bytes
+        self.used = 0
+        self.peak = 0
+
+    def try_reserve(self, size: int) -> bool:
+        """Take ``size`` bytes from the budget; False (taking nothing) if they do not fit."""
+        if self.used + size > self.limit_bytes:
+            return False
+        self.used += size
+        self.peak = max(self.peak, self.used)
+        return True
+
+    def release(self, size: int) -> None:
+        """Give bytes back once the body they held has been dropped."""
+        self.used = max(0, self.used - size)
+
+
+class Reservation:
+    """Bytes one fetch holds against the current request's budget."""
+
+    def __init__(self, budget: Optional[MemoryBudget]):
+        self.budget = budget
+        self.size = 0
+
+    def add(self, size: int) -> bool:
+        """Reserve ``size`` more bytes; False once the request's budget is spent."""
+        if self.budget is not None and not self.budget.try_reserve(size):
+            return False
+        self.size += size
+        return True
+
+    def release(self) -> None:
+        if self.budget is not None:
+            self.budget.release(self.size)
+        self.size = 0
+
+
+_current_budget: ContextVar[Optional[MemoryBudget]] = ContextVar("sift_memory_budget", default=None)
+
+
+def get_memory_budget() -> Optional[MemoryBudget]:
+    """Memory budget of the request being processed, if any."""
+    return _current_budget.get()
+
+
+@contextmanager
+def memory_scope(limit_bytes: int) -> Iterator[Optional[MemoryBudget]]:
+    """Apply a memory budget to the enclosed block and the tasks it spawns.
+
+    An enclosing budget is kept (a URL analysis and the text analysis it runs
+    share one); a non-positive limit adds none.
+    """
+    current = _current_budget.get()
+    if current is not None or limit_bytes <= 0:
+        yield current
+        return
+
+    token = _current_budget.set(MemoryBudget(limit_bytes))
+    try:
+        yield _current_budget.get()
+    finally:
+        _current_budget.reset(token)
+
+
+@contextmanager
+def reservation() -> Iterator[Reservation]:
+    """Reserve bytes against the current request's budget for the enclosed block."""
+    held = Reservation(get_memory_budget())
+    try:
+        yield held
+    finally:
+        held.release()
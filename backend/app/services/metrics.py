@@ -0,0 +1,192 @@
+"""Prometheus metrics for pipeline stages, upstream calls and caches."""
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from prometheus_client import Counter, Gauge, Histogram, CONTENT_TYPE_LATEST, generate_latest
+
+
+# Stage latencies span sub-millisecond ranking up to multi-second LLM calls
+_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+STAGE_LATENCY = Histogram(
+    "sift_stage_duration_seconds",
+    "Latency of analysis pipeline stages",
+    ["stage"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+UPSTREAM_REQUESTS = Counter(
+    "sift_upstream_requests_total",
+    "Outbound calls by upstream and outcome (HTTP status, timeout, error, circuit_open)",
+    ["upstream", "status"],
+)
+
+UPSTREAM_LATENCY = Histogram(
+    "sift_upstream_request_duration_seconds",
+    "Latency of outbound calls by upstream",
+    ["upstream"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+CACHE_REQUESTS = Counter(
+    "sift_cache_requests_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ["cache", "result"],
+)
+
+CACHE_HIT_RATIO = Gauge(
+    "sift_cache_hit_ratio",
+    "Hit ratio of each cache since process start",
+    ["cache"],
+)
+
+REQUESTS_IN_FLIGHT = Gauge(
+    "sift_requests_in_flight",
+    "API requests currently being processed",
+    ["endpoint"],
+)
+
+PIPELINES_IN_FLIGHT = Gauge(
+    "sift_pipelines_in_flight",
+    "Analysis pipeline executions currently running (after request coalescing)",
+)
+
+ADMISSION_DECISIONS = Counter(
+    "sift_admission_decisions_total",
+    "Pipeline admission outcomes (admitted, queued, rejected_queue_full, rejected_timeout)",
+    ["outcome"],
+)
+
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "sift_admission_queue_depth",
+    "Pipelines waiting for an admission slot",
+)
+
+ADMISSION_WAIT = Histogram(
+    "sift_admission_wait_seconds",
+    "Time queued pipelines waited for an admission slot",
+    buckets=_LATENCY_BUCKETS,
+)
+
+CHECKWORTHINESS_DECISIONS = Counter(
+    "sift_checkworthiness_decisions_total",
+    "Check-worthiness pre-filter outcomes before claim extraction (skipped, trimmed, passed)",
+    ["outcome"],
+)
+
+LLM_CALL_LATENCY = Histogram(
+    "sift_llm_call_duration_seconds",
+    "Latency of Gemini calls by task and model",
+    ["task", "model"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+LLM_TOKENS = Counter(
+    "sift_llm_tokens_total",
+    "Gemini tokens by task, model and kind (prompt, output, cached: prompt tokens served from a context cache)",
+    ["task", "model", "kind"],
+)
+
+LLM_FIRST_TOKEN = Histogram(
+    "sift_llm_first_token_seconds",
+    "Time to the first streamed chunk of Gemini calls by task and model",
+    ["task", "model"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+LLM_COST = Counter(
+    "sift_llm_cost_usd_total",
+    "Estimated Gemini cost in USD by task and model",
+    ["task", "model"],
+)
+
+# Plain counters behind the hit-ratio gauge, so recording stays a couple of dict ops
+_cache_counts: Dict[str, List[int]] = {}
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Record the duration of the enclosed block under ``stage``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_LATENCY.labels(stage).observe(time.perf_counter() - start)
+
+
+def record_upstream_call(upstream: str, status: str, seconds: Optional[float] = None) -> None:
+    """Count one outbound call and, when it was sent, its latency."""
+    UPSTREAM_REQUESTS.labels(upstream, status).inc()
+    if seconds is not None:
+        UPSTREAM_LATENCY.labels(upstream).observe(seconds)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache lookup and refresh the cache's hit ratio."""
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+    counts = _cache_counts.setdefault(cache, [0, 0])
+    counts[0 if hit else 1] += 1
+    CACHE_HIT_RATIO.labels(cache).set(counts[0] / (counts[0] + counts[1]))
+
+
+def record_admission(outcome: str) -> None:
+    """Count one pipeline admission decision."""
+    ADMISSION_DECISIONS.labels(outcome).inc()
+
+
+def record_llm_call(
+    task: str, model: str, seconds: float, prompt_tokens: int, output_tokens: int, cost: float,
+    cached_tokens: int = 0
+) -> None:
+    """Count one Gemini call's latency, tokens and estimated cost."""
+    LLM_CALL_LATENCY.labels(task, model).observe(seconds)
+    LLM_TOKENS.labels(task, model, "prompt").inc(prompt_tokens)
+    LLM_TOKENS.labels(task, model, "output").inc(output_tokens)
+    LLM_TOKENS.labels(task, model, "cached").inc(cached_tokens)
+    LLM_COST.labels(task, model).inc(cost)
+
+
+def record_llm_first_token(task: str, model: str, seconds: float) -> None:
+    """Record the time to the first chunk of a streamed Gemini call."""
+    LLM_FIRST_TOKEN.labels(task, model).observe(seconds)
+
+
+def llm_usage_report() -> Dict[str, Dict[str, Any]]:
+    """Gemini calls, latency, tokens and cost per task since process start."""
+    report: Dict[str, Dict[str, Any]] = {}
+
+    def task_entry(labels: Dict[str, str]) -> Dict[str, Any]:
+        return report.setdefault(labels["task"], {
+            "models": [], "calls": 0, "seconds": 0.0, "prompt_tokens": 0, "output_tokens": 0, "cached_tokens": 0,
+            "cost_usd": 0.0
+        })
+
+    for metric in LLM_CALL_LATENCY.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_count") and sample.value:
+                entry = task_entry(sample.labels)
+                entry["calls"] += int(sample.value)
+                entry["models"].append(sample.labels["model"])
+            elif sample.name.endswith("_sum"):
+                task_entry(sample.labels)["seconds"] += sample.value
+    for metric in LLM_TOKENS.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total"):
+                task_entry(sample.labels)[f"{sample.labels['kind']}_tokens"] += int(sample.value)
+    for metric in LLM_COST.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total"):
+                task_entry(sample.labels)["cost_usd"] += sample.value
+
+    for entry in report.values():
+        entry["mean_seconds"] = entry["seconds"] / entry["calls"] if entry["calls"] else 0.0
+        entry["cost_usd"] = round(entry["cost_usd"], 6)
+    return report
+
+
+def render_metrics() -> bytes:
+    """Metrics in the Prometheus text exposition format."""
+    return generate_latest()
+
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
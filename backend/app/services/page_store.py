@@ -0,0 +1,106 @@
+"""Per-URL store of paragraph fingerprints and claim results for incremental re-analysis."""
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
+from ..services.relevance import query_terms
+from ..services.utils import generate_hash
+
+_SENTENCE_END = re.compile(r'(?<=[.!?।])\s+')
+_BLANK_LINES = re.compile(r'\n\s*\n')
+
+
+def paragraph_fingerprint(paragraph: str) -> str:
+    """Fingerprint of a paragraph, insensitive to case and whitespace."""
+    return generate_hash(" ".join(paragraph.split()).casefold())
+
+
+def split_paragraphs(text: str, target_chars: int = 500) -> List[str]:
+    """Split text without markup (PDF, fallback text) into paragraphs.
+
+    Uses blank lines when present; otherwise groups sentences into chunks of
+    about ``target_chars``.
+    """
+    blocks = [b.strip() for b in _BLANK_LINES.split(text) if b.strip()]
+    if len(blocks) > 1:
+        return blocks
+    paragraphs = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        current = f"{current} {sentence}".strip()
+        if len(current) >= target_chars:
+            paragraphs.append(current)
+            current = ""
+    if current:
+        paragraphs.append(current)
+    return paragraphs
+
+
+def source_paragraphs(claim: str, paragraphs: Dict[str, str], min_overlap: float = 0.5) -> FrozenSet[str]:
+    """Fingerprints of the paragraph a claim most likely came from.
+
+    Matches on the share of the claim's content words found in each
+    paragraph. When no paragraph matches well (e.g. the claim was translated),
+    the claim is tied to all ``paragraphs`` so it is re-checked if any changes.
+    """
+    terms = set(query_terms(claim))
+    best, best_overlap = None, 0.0
+    if terms:
+        for fingerprint, paragraph in paragraphs.items():
+            overlap = len(terms.intersection(query_terms(paragraph))) / len(terms)
+            if overlap > best_overlap:
+                best, best_overlap = fingerprint, overlap
+    if best is not None and best_overlap >= min_overlap:
+        return frozenset([best])
+    return frozenset(paragraphs)
+
+
+class PageRecord:
+    """Paragraphs seen on a page and the claims checked from them."""
+
+    __slots__ = ("fingerprints", "claims", "template", "stored_at")
+
+    def __init__(self, fingerprints: Set[str], template: Dict[str, Any]):
+        """Initialize page record."""
+        self.fingerprints = fingerprints
+        # (source paragraph fingerprints, claim result)
+        self.claims: List[tuple] = []
+        # Top-level result fields other than the claims
+        self.template = template
+        self.stored_at = time.monotonic()
+
+
+class PageAnalysisStore:
+    """LRU of PageRecords keyed by normalized URL, with expiry."""
+
+    def __init__(self, max_pages: int = 500, ttl_seconds: float = 86400):
+        """Initialize page store."""
+        self.max_pages = max_pages
+        self.ttl_seconds = ttl_seconds
+        self._pages: "OrderedDict[str, PageRecord]" = OrderedDict()
+
+    def get(self, url: str) -> Optional[PageRecord]:
+        """Record for a URL, if stored and not expired."""
+        record = self._pages.get(url)
+        if record is None:
+            return None
+        if time.monotonic() - record.stored_at > self.ttl_seconds:
+            del self._pages[url]
+            return None
+        self._pages.move_to_end(url)
+        return record
+
+    def put(
+        self,
+        url: str,
+        fingerprints: Iterable[str],
+        claims: List[tuple],
+        template: Dict[str, Any]
+    ) -> None:
+        """Store the paragraphs of a page and its (source paragraphs, claim result) pairs."""
+        record = PageRecord(set(fingerprints), template)
+        record.claims = claims
+        self._pages[url] = record
+        self._pages.move_to_end(url)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
@@ -1,7 +1,19 @@
 """Service for generating search queries from claims."""
-from typing import List, Dict, Any
+import logging
+from typing import Iterable, List, Optional
+from ..config import settings
+from ..services.keyphrase import KeyphraseQueryGenerator, get_idf_table
 from ..services.llm_analyzer import LLMAnalyzer
 
+logger = logging.getLogger(__name__)
+
+# Gemini responseSchema of the query list
+QUERIES_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {"queries": {"type": "ARRAY", "items": {"type": "STRING"}}},
+    "required": ["queries"],
+}
+
 
 class QueryGenerator:
     """Generate search queries for fact-checking."""
@@ -9,12 +21,17 @@ class QueryGenerator:
     def __init__(self, llm_analyzer: LLMAnalyzer):
         """Initialize query generator."""
         self.llm_analyzer = llm_analyzer
+        self.idf_table = get_idf_table()
+        self.keyphrases = KeyphraseQueryGenerator(self.idf_table)
     
-    async def generate_queries(self, claim: str, claim_type: str = None) -> List[str]:
-        """Generate search queries for fact-checking a claim."""
+    async def generate_queries(self, claim: str, claim_type: str = None, strategy: Optional[str] = None) -> List[str]:
+        """Generate search queries for fact-checking a claim ("llm" or "local"; QUERY_STRATEGY by default)."""
         if not claim or len(claim.strip()) < 5:
             return []
         
+        if (strategy or settings.QUERY_STRATEGY) == "local":
+            return self._generate_queries_fallback(claim)
+        
         prompt = f"""Generate 3-5 simple, concise search queries to fact-check the following claim.
         
         Claim: "{claim}"
@@ -36,7 +53,9 @@ class QueryGenerator:
         Format: {{"queries": ["query1", "query2", ...]}}"""
         
         try:
-            response = await self.llm_analyzer.analyze(prompt, response_format="json")
+            response = await self.llm_analyzer.analyze(
+                prompt, response_format="json", task="query_generation", response_schema=QUERIES_SCHEMA
+            )
             if isinstance(response, dict) and "queries" in response:
                 queries = response["queries"]
                 # Ensure we return a list of strings
@@ -45,42 +64,17 @@ class QueryGenerator:
             elif isinstance(response, list):
                 return [str(q) for q in response if q][:5]
         except Exception as e:
-            print(f"Error generating queries: {e}")
+            logger.warning(f"Error generating queries, using keyword fallback: {e}")
         
         # Fallback: simple query generation
         return self._generate_queries_fallback(claim)
     
     def _generate_queries_fallback(self, claim: str) -> List[str]:
-        """Fallback query generation - simple keyword extraction."""
-        import re
-        
-        # Remove common stop words and extract keywords
-        stop_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", 
-                     "of", "with", "is", "was", "are", "were", "been", "be", "have", "has", "had",
-                     "do", "does", "did", "will", "would", "could", "should", "may", "might"}
-        
-        # Extract words (alphanumeric sequences)
-        words = re.findall(r'\b\w+\b', claim.lower())
-        
-        # Filter out stop words and keep meaningful keywords
-        keywords = [w for w in words if w not in stop_words and len(w) > 2][:8]
-        
-        # Create simple queries with 3-7 keywords
-        queries = []
-        if len(keywords) >= 3:
-            # Different combinations of keywords
-            queries.append(" ".join(keywords[:4]))  # First 4 keywords
-            queries.append(" ".join(keywords[:6]))  # First 6 keywords
-            queries.append(" ".join(keywords[:7]))  # First 7 keywords
-            if len(keywords) > 4:
-                queries.append(" ".join(keywords[2:6]))  # Middle keywords
-        else:
-            # If too few keywords, use what we have
-            queries.append(" ".join(keywords))
-        
-        # Always include the simplest version
-        if keywords:
-            queries.append(" ".join(keywords[:3]))
-        
-        return queries[:5] if queries else [claim[:50]]  # Fallback to first 50 chars
-
+        """Local query generation - IDF-weighted keyphrases, entities and numbers kept intact."""
+        queries = self.keyphrases.generate(claim, max_queries=5)
+        return queries if queries else [claim[:50]]  # Fallback to first 50 chars
+    
+    def observe(self, claim: str, evidence_texts: Iterable[str]) -> None:
+        """Add a checked claim and its evidence texts to the IDF table."""
+        self.idf_table.add_document(claim)
+        self.idf_table.add_documents(evidence_texts)
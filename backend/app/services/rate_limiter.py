@@ -0,0 +1,251 @@
+"""Client-side rate limiting for outbound Gemini and Google API calls."""
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+import httpx
+from ..config import settings
+from ..services.deadline import DeadlineExceeded, get_deadline
+from ..services.metrics import record_upstream_call
+
+logger = logging.getLogger(__name__)
+
+
+# Lower value = served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+PRIORITIES = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "batch": PRIORITY_BATCH,
+}
+
+_request_priority: ContextVar[int] = ContextVar("sift_request_priority", default=PRIORITY_INTERACTIVE)
+
+
+def get_request_priority() -> int:
+    """Priority of the request being processed in the current context."""
+    return _request_priority.get()
+
+
+@contextmanager
+def request_priority(priority: str) -> Iterator[None]:
+    """Run the enclosed block (and tasks it spawns) at the given priority."""
+    token = _request_priority.set(PRIORITIES.get(priority, PRIORITY_INTERACTIVE))
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate_per_minute``."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """Initialize token bucket (starts full)."""
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else float(rate_per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        """Take tokens; the balance may go negative to record debt."""
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """Async rate limiter for one upstream with a priority wait queue.
+
+    Every call takes one token from the requests-per-minute bucket and, when a
+    tokens-per-minute budget is configured, ``tokens`` from the TPM bucket.
+    Waiters are served lowest priority value first, FIFO within a priority.
+    """
+
+    def __init__(self, name: str, requests_per_minute: int, tokens_per_minute: int = 0):
+        """Initialize rate limiter. A limit of 0 disables that bucket."""
+        self.name = name
+        self._request_bucket = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._waiters: List[list] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for capacity."""
+        return sum(1 for entry in self._waiters if not entry[3].done())
+
+    def _time_until(self, tokens: int) -> float:
+        wait = 0.0
+        if self._request_bucket:
+            wait = max(wait, self._request_bucket.time_until(1))
+        if self._token_bucket and tokens:
+            wait = max(wait, self._token_bucket.time_until(tokens))
+        return wait
+
+    def _consume(self, tokens: int) -> None:
+        if self._request_bucket:
+            self._request_bucket.consume(1)
+        if self._token_bucket and tokens:
+            self._token_bucket.consume(tokens)
+
+    async def acquire(self, tokens: int = 0, priority: Optional[int] = None) -> None:
+        """Wait until one request (and ``tokens`` tokens) may be sent."""
+        if self._request_bucket is None and self._token_bucket is None:
+            return
+
+        if not self._waiters and self._time_until(tokens) == 0:
+            self._consume(tokens)
+            return
+
+        priority = get_request_priority() if priority is None else priority
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, [priority, next(self._seq), tokens, future])
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        else:
+            self._wakeup.set()
+        await future
+
+    def record_usage(self, estimated: int, actual: int) -> None:
+        """Correct the TPM bucket once the real token usage is known."""
+        if self._token_bucket and actual > estimated:
+            self._token_bucket.consume(actual - estimated)
+
+    async def _dispatch(self) -> None:
+        """Grant waiters in priority order as capacity becomes available."""
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():  # caller was cancelled
+                heapq.heappop(self._waiters)
+                continue
+
+            wait = self._time_until(tokens)
+            if wait > 0:
+                # Wake early if a higher-priority caller queues up meanwhile
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._waiters)
+            self._consume(tokens)
+            future.set_result(None)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Jittered backoff; honours the server's Retry-After when it is given."""
+    base = settings.RATE_LIMIT_BACKOFF_BASE
+    if retry_after is not None:
+        return retry_after + random.uniform(0, base)
+    return random.uniform(0, min(settings.RATE_LIMIT_BACKOFF_MAX, base * (2 ** attempt)))
+
+
+async def send_with_rate_limit(
+    limiter: RateLimiter,
+    send: Callable[[], Awaitable[httpx.Response]],
+    tokens: int = 0,
+    max_retries: Optional[int] = None
+) -> httpx.Response:
+    """Send a request through ``limiter``, retrying 429 responses.
+
+    Returns the last response; callers keep their own handling of non-429
+    errors and of a 429 that outlived every retry. Queueing and retries never
+    run past the request deadline.
+    """
+    if max_retries is None:
+        max_retries = settings.RATE_LIMIT_MAX_RETRIES
+    deadline = get_deadline()
+
+    for attempt in range(max_retries + 1):
+        if deadline is None:
+            await limiter.acquire(tokens)
+        else:
+            try:
+                await asyncio.wait_for(limiter.acquire(tokens), timeout=deadline.remaining())
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded(f"Request deadline reached while queued for {limiter.name}")
+        start = time.perf_counter()
+        try:
+            response = await send()
+        except httpx.TimeoutException:
+            record_upstream_call(limiter.name, "timeout", time.perf_counter() - start)
+            raise
+        except httpx.TransportError:
+            record_upstream_call(limiter.name, "error", time.perf_counter() - start)
+            raise
+        record_upstream_call(limiter.name, str(response.status_code), time.perf_counter() - start)
+        if response.status_code != 429 or attempt == max_retries:
+            return response
+
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+        delay = backoff_delay(attempt, retry_after)
+        if deadline is not None and delay >= deadline.remaining():
+            return response
+        logger.warning(f"{limiter.name} returned 429, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
+        await asyncio.sleep(delay)
+
+    return response
+
+
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(name: str) -> RateLimiter:
+    """Return the shared limiter for an upstream ("gemini", "factcheck", ...)."""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limits = {
+            "gemini": (settings.GEMINI_RPM, settings.GEMINI_TPM),
+            "factcheck": (settings.FACTCHECK_RPM, 0),
+            "custom_search": (settings.CUSTOM_SEARCH_RPM, 0),
+            "translation": (settings.TRANSLATION_RPM, 0),
+        }
+        rpm, tpm = limits.get(name, (0, 0))
+        limiter = RateLimiter(name, rpm, tpm)
+        _limiters[name] = limiter
+    return limiter
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough Gemini token estimate (~4 characters per token)."""
+    return sum(len(t) for t in texts if t) // 4 + 1
@@ -0,0 +1,81 @@
+"""BM25 relevance scoring of evidence text against a claim."""
+import re
+from typing import List, Sequence, Tuple
+import numpy as np
+
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Function words that carry no evidence of relevance
+STOPWORDS = frozenset("""
+a an and are as at be been but by for from had has have he her his i in is it its of on or our
+she so than that the their them there these they this to was we were what when which who will
+with would you your not no
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def query_terms(text: str) -> List[str]:
+    """Distinct content terms of a query, in order of first appearance."""
+    return list(dict.fromkeys(t for t in tokenize(text) if t not in STOPWORDS))
+
+
+class BM25Scorer:
+    """Okapi BM25 over a batch of documents, scored for one query at a time.
+
+    Documents are reduced to a (documents x query terms) term-frequency
+    matrix, so scoring is a handful of NumPy operations whatever the batch
+    size. Scores are relative to a document of average length that contains
+    every query term once, and capped at 1.0, so like the set overlap they
+    replace they lie in [0, 1].
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """Initialize scorer."""
+        self.k1 = k1
+        self.b = b
+
+    def term_matrix(self, terms: Sequence[str], documents: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Frequencies of ``terms`` in each document, and document lengths in words.
+
+        The documents are joined with newlines and scanned by one regex that
+        matches the query terms and the separators, so no per-token Python
+        objects are created; the running count of separators gives each
+        match's document.
+        """
+        documents = [document.replace("\n", " ") if document else "" for document in documents]
+        lengths = np.array([document.count(" ") + 1 if document else 0 for document in documents], dtype=np.float64)
+        tf = np.zeros((len(documents), len(terms)), dtype=np.float64)
+        if not documents or not terms:
+            return tf, lengths
+
+        alternatives = "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+        pattern = re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)|\n")
+        column = {term: i for i, term in enumerate(terms)}
+        column["\n"] = -1
+        found = pattern.findall("\n".join(documents).lower())
+        codes = np.fromiter(map(column.__getitem__, found), dtype=np.int64, count=len(found))
+        rows = np.cumsum(codes == -1)
+        hits = codes >= 0
+        np.add.at(tf, (rows[hits], codes[hits]), 1.0)
+        return tf, lengths
+
+    def score(self, terms: Sequence[str], documents: Sequence[str]) -> np.ndarray:
+        """Normalized BM25 score of every document for ``terms``."""
+        tf, lengths = self.term_matrix(terms, documents)
+        n_docs = len(lengths)
+        if n_docs == 0 or not terms:
+            return np.zeros(n_docs)
+
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        avg_length = lengths.mean() or 1.0
+        norm = self.k1 * (1.0 - self.b + self.b * lengths / avg_length)
+        weights = tf * (self.k1 + 1.0) / (tf + norm[:, None])
+        scores = weights @ idf
+        # A document of average length containing every term once scores 1.0
+        return np.minimum(scores / idf.sum(), 1.0)
@@ -0,0 +1,83 @@
+"""Service for coalescing identical concurrent requests into one execution."""
+import asyncio
+import logging
+import re
+from typing import Any, Awaitable, Callable, Dict, Optional
+from ..services.utils import generate_hash
+from ..services.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+
+def make_coalescing_key(*parts: Optional[str]) -> str:
+    """Build a coalescing key from a hash of the normalized request inputs.
+
+    Whitespace is collapsed and case is folded so that selections which only
+    differ in formatting share one pipeline execution.
+    """
+    normalized = "\x1f".join(
+        re.sub(r'\s+', ' ', part).strip().casefold() if part else ""
+        for part in parts
+    )
+    return generate_hash(normalized)
+
+
+class _InFlight:
+    """A shared pipeline execution and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """Single-flight execution of identical concurrent requests.
+
+    The first caller for a key starts the work in a background task; callers
+    that arrive while it is running await the same task. A caller that is
+    cancelled (e.g. the client disconnected) only stops waiting - the shared
+    task keeps running for the others and is cancelled only when its last
+    waiter goes away.
+    """
+
+    def __init__(self):
+        """Initialize request coalescer."""
+        self._in_flight: Dict[str, _InFlight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct executions currently running."""
+        return len(self._in_flight)
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``factory()`` once for all concurrent callers sharing ``key``."""
+        entry = self._in_flight.get(key)
+        record_cache_lookup("request_coalescing", entry is not None)
+        if entry is None:
+            task = asyncio.ensure_future(factory())
+            entry = _InFlight(task)
+            self._in_flight[key] = entry
+            task.add_done_callback(lambda _t, k=key, e=entry: self._forget(k, e))
+        else:
+            logger.debug(f"Coalescing request onto in-flight execution {key[:12]}")
+
+        entry.waiters += 1
+        try:
+            # shield() keeps one caller's cancellation from cancelling the shared task
+            return await asyncio.shield(entry.task)
+        except asyncio.CancelledError:
+            if entry.waiters == 1 and not entry.task.done():
+                logger.debug(f"Last waiter left, cancelling execution {key[:12]}")
+                # Forget it first: a caller arriving before the task finishes must not join it
+                self._forget(key, entry)
+                entry.task.cancel()
+            raise
+        finally:
+            entry.waiters -= 1
+
+    def _forget(self, key: str, entry: _InFlight) -> None:
+        """Drop a finished or abandoned execution so later requests start fresh."""
+        if self._in_flight.get(key) is entry:
+            del self._in_flight[key]
@@ -0,0 +1,67 @@
+"""Shared response texts and the compact response format."""
+import hashlib
+from typing import Any, Dict
+
+METHODOLOGY = "SIFT uses Gemini 2.0 Flash to extract factual claims from text, searches verified fact-checking sources via Fact Check Tools API and Google Custom Search, crawls source content, ranks evidence by relevance, and uses Gemini to provide verdicts with confidence scores. Citations link to original fact-check articles and sources."
+LIMITATIONS = "Fact-checking accuracy depends on: (1) availability of relevant sources in Fact Check Tools API and search results, (2) recency of information (new claims may lack verification), (3) AI interpretation quality (Gemini model limitations), and (4) source reliability. Always review citations for complete context. Some claims may require expert review."
+METHODOLOGY_SHORT = "SIFT uses AI-powered claim extraction and fact-checking against verified sources."
+LIMITATIONS_SHORT = "Analysis quality depends on available sources and may not cover all claims."
+METHODOLOGY_NO_CLAIMS = "SIFT analyzes text for verifiable factual claims using AI."
+LIMITATIONS_NO_CLAIMS = "Opinions, questions, and subjective statements may not be detected."
+
+# Static texts served by GET /boilerplate and referenced by id from compact responses
+BOILERPLATE: Dict[str, str] = {
+    "methodology": METHODOLOGY,
+    "limitations": LIMITATIONS,
+    "methodology_short": METHODOLOGY_SHORT,
+    "limitations_short": LIMITATIONS_SHORT,
+    "methodology_no_claims": METHODOLOGY_NO_CLAIMS,
+    "limitations_no_claims": LIMITATIONS_NO_CLAIMS,
+}
+_BOILERPLATE_IDS = {text: key for key, text in BOILERPLATE.items()}
+# Changes whenever a text changes, so clients can cache the texts by version
+BOILERPLATE_VERSION = hashlib.sha256("\n".join(sorted(BOILERPLATE.values())).encode("utf-8")).hexdigest()[:12]
+
+# Claim fields that often repeat the claim itself or the top-level original text
+_REFERABLE_CLAIM_FIELDS = ("original_claim", "claim_translated")
+
+
+def compact_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact form of an analysis result, in which shared text appears once.
+
+    - "methodology"/"limitations" become "methodology_ref"/"limitations_ref",
+      ids into GET /boilerplate (texts not in the table stay inline)
+    - a claim's "original_claim"/"claim_translated" equal to the claim, or to
+      the top-level "original_text", become "<field>_ref": "claim" or
+      "original_text"
+
+    The result itself is not modified.
+    """
+    compact = dict(result)
+    for field in ("methodology", "limitations"):
+        text = compact.get(field)
+        if text in _BOILERPLATE_IDS:
+            del compact[field]
+            compact[f"{field}_ref"] = _BOILERPLATE_IDS[text]
+
+    original_text = compact.get("original_text")
+    claims = []
+    for claim in compact.get("claims", []):
+        claim = dict(claim)
+        for field in _REFERABLE_CLAIM_FIELDS:
+            value = claim.get(field)
+            if value is None:
+                continue
+            if value == claim.get("claim"):
+                ref = "claim"
+            elif original_text is not None and value == original_text:
+                ref = "original_text"
+            else:
+                continue
+            del claim[field]
+            claim[f"{field}_ref"] = ref
+        claims.append(claim)
+    compact["claims"] = claims
+    compact["boilerplate_version"] = BOILERPLATE_VERSION
+    compact["compact"] = True
+    return compact
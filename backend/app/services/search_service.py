@@ -1,9 +1,16 @@
 """Service for searching the web using Fact Check Tools API and Google Custom Search."""
 import httpx
 import logging
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Optional
 from ..config import settings
+from ..models import CUSTOM_SEARCH, FACT_CHECK_API, Evidence
 from ..services.utils import is_valid_url, normalize_url
+from ..services.rate_limiter import get_rate_limiter, send_with_rate_limit
+from ..services.circuit_breaker import get_breaker, is_failure_status
+from ..services.http_transport import shared_client
+from ..services.deadline import deadline_expired, stage_timeout
+from ..services.metrics import record_cache_lookup, record_upstream_call
+from ..services.claimreview_index import get_claimreview_index
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +34,11 @@ class SearchService:
         self.fact_check_api_key = settings.FACT_CHECK_API_KEY
         self.google_search_api_key = settings.GOOGLE_SEARCH_API_KEY
         self.google_search_cx = settings.GOOGLE_SEARCH_CX
+        self.factcheck_limiter = get_rate_limiter("factcheck")
+        self.custom_search_limiter = get_rate_limiter("custom_search")
+        self.factcheck_breaker = get_breaker("factcheck")
+        self.custom_search_breaker = get_breaker("custom_search")
+        self.claimreview_index = get_claimreview_index()
     
     def _simplify_claim(self, text: str) -> str:
         """Remove stopwords to create a simpler query."""
@@ -40,16 +52,93 @@ class SearchService:
         simplified = " ".join(w for w in words if w.lower() not in STOPWORDS)
         return simplified if simplified else text  # Fallback to original if empty
     
-    async def search_factcheck_api(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-        """Search using Google Fact Check Tools API with fallback retries.
+    async def search_factcheck_api(self, query: str, max_results: int = 10) -> List[Evidence]:
+        """Search ClaimReview records: the local index first, then Google Fact Check Tools API.
+        
+        Fresh local matches are returned without calling the API, as is an
+        empty result for a query the API recently had nothing for (queries
+        the API answered with records are not remembered: its matches are
+        semantic and may not pass the index's own match threshold). Otherwise
+        the API is called and its records are added to the index; if the API
+        cannot be reached, stale local matches are returned instead.
         
         Returns empty list if no results found, but logs as debug.
         This allows the system to continue with other evidence sources.
         """
+        index = self.claimreview_index
+        local_claims: List[Dict[str, Any]] = []
+        if index is not None:
+            local_claims, fresh = index.search(query, max_results)
+            if (local_claims and fresh) or (not local_claims and index.recently_searched(query)):
+                record_cache_lookup("claimreview_index", True)
+                return self._claims_to_evidence(local_claims, max_results)
+            record_cache_lookup("claimreview_index", False)
+        
+        claims = await self._fetch_factcheck_claims(query)
+        if claims is None:
+            return self._claims_to_evidence(local_claims, max_results)
+        if index is not None:
+            index.add_claims(claims)
+            if not claims:
+                index.mark_searched(query)
+        return self._claims_to_evidence(claims or local_claims, max_results)
+    
+    def _claims_to_evidence(self, claims: List[Dict[str, Any]], max_results: int) -> List[Evidence]:
+        """Evidence from Fact Check Tools API claim records, whitelisted sources first."""
+        results = []
+        for claim in claims[:max_results]:
+            # Extract claim review information
+            review_urls = []
+            review_texts = []
+            ratings = []
+            
+            for review in claim.get("claimReview", []):
+                publisher = review.get("publisher", {})
+                review_urls.append(review.get("url", ""))
+                
+                # Extract review text
+                if review.get("textualRating"):
+                    ratings.append(review["textualRating"])
+                text = review.get("textualRating", "") or publisher.get("name", "")
+                if text:
+                    review_texts.append(text)
+            
+            # Get the first URL or use claim URL
+            url = claim.get("claimant", "") or ""
+            if review_urls:
+                url = review_urls[0]
+            
+            results.append(Evidence(
+                url=url,
+                title=claim.get("text", "")[:100] or "Fact Check",
+                snippet=" ".join(review_texts[:2])[:300] if review_texts else claim.get("text", "")[:300],
+                source=FACT_CHECK_API,
+                claim_original=claim.get("text", ""),
+                textual_rating=ratings[0] if ratings else "",
+                fact_check_reviews=review_urls
+            ))
+        
+        # Prioritize whitelisted sources
+        return self.prioritize_whitelisted_sources(results)
+    
+    async def _fetch_factcheck_claims(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """Claim records from Google Fact Check Tools API, with fallback retries.
+        
+        Returns an empty list when the API answered without records, and None
+        when it could not be asked (no key, deadline, open circuit) or no
+        attempt got an answer.
+        """
         if not self.fact_check_api_key:
-            return []
+            return None
+        
+        if deadline_expired():
+            return None
+        if not self.factcheck_breaker.allow_request():
+            record_upstream_call("factcheck", "circuit_open")
+            logger.debug(f"FactCheck API circuit open, skipping query: {query[:50]}")
+            return None
         
-        FACTCHECK_URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+        FACTCHECK_URL = settings.FACT_CHECK_API_URL
         
         # Prepare base parameters
         base_params = {
@@ -82,8 +171,16 @@ class SearchService:
         ]
         
         # Filter out None values from params and try each attempt
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        answered = False
+        async with shared_client("factcheck") as client:
             for attempt_idx, attempt in enumerate(attempts):
+                # Stop retrying as soon as the upstream is known to be down or time is up
+                if attempt_idx > 0 and (self.factcheck_breaker.is_open or deadline_expired()):
+                    logger.debug(f"FactCheck API circuit opened or deadline reached, abandoning remaining attempts")
+                    break
+                # Each attempt gets whatever budget is left
+                timeout = stage_timeout(10.0)
+                
                 # Filter out None values from params
                 params = {k: v for k, v in attempt["params"].items() if v is not None}
                 description = attempt["description"]
@@ -91,10 +188,18 @@ class SearchService:
                 logger.debug(f"FactCheck API attempt {attempt_idx + 1}: {description} | Query: {params.get('query', '')[:50]}")
                 
                 try:
-                    response = await client.get(FACTCHECK_URL, params=params)
+                    response = await send_with_rate_limit(
+                        self.factcheck_limiter,
+                        lambda: client.get(FACTCHECK_URL, params=params, timeout=timeout)
+                    )
+                    if is_failure_status(response.status_code):
+                        self.factcheck_breaker.record_failure()
+                    else:
+                        self.factcheck_breaker.record_success()
                     
                     # Handle 403 gracefully - treat as "no facts found", not a failure
                     if response.status_code == 403:
+                        answered = True
                         logger.debug(f"Fact Check API returned 403 (no facts found) for attempt {attempt_idx + 1}: {description}")
                         continue  # Try next attempt
                     
@@ -104,43 +209,10 @@ class SearchService:
                             data = response.json()
                             claims = data.get("claims", [])
                             
+                            answered = True
                             if claims:
                                 logger.debug(f"FactCheck API success on attempt {attempt_idx + 1} ({description}): found {len(claims)} claims")
-                                # Parse and return results (same format as before)
-                                results = []
-                                for claim in claims[:max_results]:
-                                    # Extract claim review information
-                                    review_urls = []
-                                    review_texts = []
-                                    
-                                    for review in claim.get("claimReview", []):
-                                        publisher = review.get("publisher", {})
-                                        review_urls.append(review.get("url", ""))
-                                        
-                                        # Extract review text
-                                        text = review.get("textualRating", "") or publisher.get("name", "")
-                                        if text:
-                                            review_texts.append(text)
-                                    
-                                    # Get the first URL or use claim URL
-                                    url = claim.get("claimant", "") or ""
-                                    if review_urls:
-                                        url = review_urls[0]
-                                    
-                                results.append({
-                                    "title": claim.get("text", "")[:100] or "Fact Check",
-                                    "url": url,
-                                    "link": url,  # Add 'link' key for consistency with prioritize_whitelisted_sources
-                                    "snippet": " ".join(review_texts[:2])[:300] if review_texts else claim.get("text", "")[:300],
-                                    "source": "fact_check_api",
-                                    "claim_original": claim.get("text", ""),
-                                    "fact_check_reviews": review_urls
-                                })
-                                
-                                # Prioritize whitelisted sources
-                                results = self.prioritize_whitelisted_sources(results)
-                                
-                                return results
+                                return claims
                             else:
                                 logger.debug(f"FactCheck API attempt {attempt_idx + 1} ({description}): 0 claims in response")
                                 continue  # Try next attempt
@@ -164,8 +236,13 @@ class SearchService:
                         continue  # Try next attempt
                         
                 except httpx.TimeoutException as e:
+                    self.factcheck_breaker.record_failure()
                     logger.warning(f"FactCheck API timeout on attempt {attempt_idx + 1} ({description}): {e}")
                     continue
+                except httpx.TransportError as e:
+                    self.factcheck_breaker.record_failure()
+                    logger.warning(f"FactCheck API connection error on attempt {attempt_idx + 1} ({description}): {e}")
+                    continue
                 except httpx.HTTPStatusError as e:
                     status_code = e.response.status_code
                     error_text = ""
@@ -188,16 +265,23 @@ class SearchService:
         
         # All attempts exhausted
         logger.debug(f"FactCheck API: No results found after {len(attempts)} attempts for query: {query[:50]}")
-        return []
+        return [] if answered else None
     
-    async def search_google_custom(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
+    async def search_google_custom(self, query: str, num_results: int = 10) -> List[Evidence]:
         """Search using Google Custom Search API."""
         if not self.google_search_api_key or not self.google_search_cx:
             return []
         
+        if deadline_expired():
+            return []
+        if not self.custom_search_breaker.allow_request():
+            record_upstream_call("custom_search", "circuit_open")
+            logger.debug(f"Custom Search circuit open, skipping query: {query[:50]}")
+            return []
+        
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                url = "https://www.googleapis.com/customsearch/v1"
+            async with shared_client("custom_search") as client:
+                url = settings.CUSTOM_SEARCH_URL
                 params = {
                     "key": self.google_search_api_key,
                     "cx": self.google_search_cx,
@@ -205,39 +289,50 @@ class SearchService:
                     "num": min(num_results, 10)  # Google API limit
                 }
                 
-                response = await client.get(url, params=params)
+                response = await send_with_rate_limit(
+                    self.custom_search_limiter,
+                    lambda: client.get(url, params=params, timeout=stage_timeout(10.0))
+                )
+                if is_failure_status(response.status_code):
+                    self.custom_search_breaker.record_failure()
+                else:
+                    self.custom_search_breaker.record_success()
                 response.raise_for_status()
                 data = response.json()
                 
                 results = []
                 for item in data.get("items", [])[:num_results]:
-                    results.append({
-                        "title": item.get("title", ""),
-                        "url": item.get("link", ""),
-                        "snippet": item.get("snippet", ""),
-                        "source": "google_custom_search"
-                    })
+                    results.append(Evidence(
+                        url=item.get("link", ""),
+                        title=item.get("title", ""),
+                        snippet=item.get("snippet", ""),
+                        source=CUSTOM_SEARCH
+                    ))
                 
                 # Prioritize whitelisted sources
                 results = self.prioritize_whitelisted_sources(results)
                 
                 return results
+        except httpx.TransportError as e:
+            self.custom_search_breaker.record_failure()
+            logger.warning(f"Google Custom Search error: {e}")
+            return []
         except Exception as e:
-            print(f"Google Custom Search error: {e}")
+            logger.warning(f"Google Custom Search error: {e}")
             return []
     
-    def prioritize_whitelisted_sources(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def prioritize_whitelisted_sources(self, results: List[Evidence]) -> List[Evidence]:
         """Prioritize results from whitelisted Indian fact-checking domains.
         
         Args:
-            results: List of search results with 'link' or 'url' keys
+            results: List of search results
             
         Returns:
             Sorted list with whitelisted sources first
         """
-        def is_whitelisted(result: Dict[str, Any]) -> bool:
+        def is_whitelisted(result: Evidence) -> bool:
             """Check if result URL matches whitelist."""
-            url = result.get('link') or result.get('url', '').lower()
+            url = result.url.lower()
             return any(domain in url for domain in self.INDIAN_FACTCHECK_WHITELIST)
         
         # Separate whitelisted and non-whitelisted results
@@ -247,7 +342,7 @@ class SearchService:
         # Return whitelisted first, then others
         return whitelisted + others
     
-    async def search(self, query: str, num_results: int = 10) -> List[Dict[str, Any]]:
+    async def search(self, query: str, num_results: int = 10) -> List[Evidence]:
         """Search using all available APIs."""
         all_results = []
         
@@ -264,7 +359,7 @@ class SearchService:
         
         # Ensure whitelisted sources appear in top 3 if available
         whitelisted_all = [r for r in all_results 
-                          if any(domain in (r.get('link') or r.get('url', '').lower()) 
+                          if any(domain in r.url.lower()
                                 for domain in self.INDIAN_FACTCHECK_WHITELIST)]
         others_all = [r for r in all_results if r not in whitelisted_all]
         
@@ -296,7 +391,7 @@ class SearchService:
         url_lower = url.lower()
         return any(domain in url_lower for domain in self.INDIAN_FACTCHECK_WHITELIST)
     
-    async def search_factcheck_sources(self, query: str) -> List[Dict[str, Any]]:
+    async def search_factcheck_sources(self, query: str) -> List[Evidence]:
         """Search specifically in fact-checking sources."""
         # First try Fact Check API
         results = await self.search_factcheck_api(query, 5)
@@ -310,7 +405,7 @@ class SearchService:
         seen_urls = set()
         unique_results = []
         for result in results:
-            url = result.get("url", "")
+            url = result.url
             if url and url not in seen_urls:
                 seen_urls.add(url)
                 unique_results.append(result)
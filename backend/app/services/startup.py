@@ -0,0 +1,91 @@
+"""Startup warm-up and startup timing report."""
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    """Durations of the startup phases, in the order they ran."""
+
+    def __init__(self):
+        """Initialize startup report."""
+        self.phases: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.details: Dict[str, Any] = {}
+        self.completed = False
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a phase measured elsewhere."""
+        self.phases[name] = round(seconds, 4)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase; a failure is logged and recorded instead of raised."""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.errors[name] = f"{type(e).__name__}: {e}"
+            logger.warning(f"Startup phase {name} failed: {e}")
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Report for /health and logs."""
+        report = {
+            "completed": self.completed,
+            "total_seconds": round(sum(self.phases.values()), 4),
+            "phases": dict(self.phases),
+        }
+        if self.details:
+            report["details"] = dict(self.details)
+        if self.errors:
+            report["errors"] = dict(self.errors)
+        return report
+
+    def log(self) -> None:
+        """Log a one-line breakdown."""
+        breakdown = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.phases.items())
+        logger.info(f"Startup took {sum(self.phases.values()):.2f}s: {breakdown}")
+
+
+startup_report = StartupReport()
+
+
+def upstream_urls() -> Dict[str, str]:
+    """Upstream hosts worth a pooled connection before the first request."""
+    urls = {}
+    if settings.GOOGLE_API_KEY:
+        urls["gemini"] = settings.GEMINI_ENDPOINT
+    if settings.FACT_CHECK_API_KEY:
+        urls["factcheck"] = settings.FACT_CHECK_API_URL
+    if settings.GOOGLE_SEARCH_API_KEY and settings.GOOGLE_SEARCH_CX:
+        urls["custom_search"] = settings.CUSTOM_SEARCH_URL
+    return urls
+
+
+async def warm_up(get_service: Callable[[], Any], report: Optional[StartupReport] = None) -> None:
+    """Build the pipeline and load everything the first request would otherwise load.
+
+    Phases: construct the services, load langdetect profiles, create the
+    Google Translate client, open pooled connections to the upstream APIs.
+    Blocking work runs in worker threads so requests can be served meanwhile.
+    """
+    from ..services.http_transport import prewarm_connections
+
+    report = report or startup_report
+    with report.phase("services"):
+        service = get_service()
+    with report.phase("langdetect"):
+        await asyncio.to_thread(service.language_service.warm_up)
+    with report.phase("translation_client"):
+        await asyncio.to_thread(service.translation_service.initialize)
+    with report.phase("connections"):
+        report.details["connections"] = await prewarm_connections(upstream_urls())
+    report.completed = True
+    report.log()
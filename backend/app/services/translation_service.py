@@ -1,10 +1,16 @@
 """Service for translation using Google Cloud Translation API."""
-from google.cloud import translate_v2 as translate
-from google.oauth2 import service_account
+import asyncio
 import logging
 import hashlib
 import json
 import os
+import threading
+import time
+from ..config import settings
+from ..services.rate_limiter import get_rate_limiter, backoff_delay
+from ..services.circuit_breaker import get_breaker
+from ..services.deadline import deadline_expired, stage_timeout
+from ..services.metrics import record_upstream_call, record_cache_lookup
 
 logger = logging.getLogger(__name__)
 
@@ -19,39 +25,64 @@ class TranslationService:
     def __init__(self):
         """Initialize translation service.
         
+        The Google client (and the google.cloud import behind it) is created on
+        first use or by initialize(), which the startup warm-up calls, so that
+        constructing the service stays cheap.
+        """
+        self.client = None
+        self.enabled = False
+        self.initialized = False
+        self._init_lock = threading.Lock()
+        self.rate_limiter = get_rate_limiter("translation")
+        self.breaker = get_breaker("translation")
+    
+    def initialize(self) -> bool:
+        """Create the Translation client; blocking, safe to call repeatedly.
+        
         Supports both file-based credentials (GOOGLE_APPLICATION_CREDENTIALS)
         and JSON string credentials (GOOGLE_CREDENTIALS_JSON) for Render deployment.
+        Returns whether translation is available.
         """
-        try:
-            # Try to initialize credentials from JSON string first (Render-compatible)
-            credentials_json = os.getenv("GOOGLE_CREDENTIALS_JSON")
-            if credentials_json:
-                try:
-                    credentials_dict = json.loads(credentials_json)
-                    credentials = service_account.Credentials.from_service_account_info(
-                        credentials_dict
-                    )
-                    self.client = translate.Client(credentials=credentials)
+        with self._init_lock:
+            if self.initialized:
+                return self.enabled
+            try:
+                from google.cloud import translate_v2 as translate
+                from google.oauth2 import service_account
+                
+                # Try to initialize credentials from JSON string first (Render-compatible)
+                credentials_json = os.getenv("GOOGLE_CREDENTIALS_JSON")
+                if credentials_json:
+                    try:
+                        credentials_dict = json.loads(credentials_json)
+                        credentials = service_account.Credentials.from_service_account_info(
+                            credentials_dict
+                        )
+                        self.client = translate.Client(credentials=credentials)
+                        self.enabled = True
+                        logger.info("Translation Service initialized with JSON credentials (Render-compatible)")
+                    except (json.JSONDecodeError, ValueError) as e:
+                        logger.error(f"Failed to parse GOOGLE_CREDENTIALS_JSON: {e}")
+                        raise
+                else:
+                    # Fallback to file-based credentials (local development)
+                    self.client = translate.Client()
                     self.enabled = True
-                    logger.info("Translation Service initialized with JSON credentials (Render-compatible)")
-                except (json.JSONDecodeError, ValueError) as e:
-                    logger.error(f"Failed to parse GOOGLE_CREDENTIALS_JSON: {e}")
-                    raise
-            else:
-                # Fallback to file-based credentials (local development)
-                self.client = translate.Client()
-                self.enabled = True
-                logger.info("Translation Service initialized with file-based credentials")
-        except Exception as e:
-            logger.error(f"Translation Service init error: {e}")
-            logger.warning("Translation will fallback to original text if translation is unavailable")
-            self.client = None
-            self.enabled = False
+                    logger.info("Translation Service initialized with file-based credentials")
+            except Exception as e:
+                logger.error(f"Translation Service init error: {e}")
+                logger.warning("Translation will fallback to original text if translation is unavailable")
+                self.client = None
+                self.enabled = False
+            self.initialized = True
+            return self.enabled
     
-    def translate_to_english(self, text: str) -> str:
+    async def translate_to_english(self, text: str) -> str:
         """Translate text (detected language) → English using Google Cloud Translation API.
         
         Uses in-memory cache to avoid translating the same text multiple times.
+        API calls go through the shared translation rate limiter and run in a
+        worker thread so the blocking client does not stall the event loop.
         
         Args:
             text: Text to translate to English
@@ -59,17 +90,31 @@ class TranslationService:
         Returns:
             Translated text in English, or original text if translation fails
         """
-        if not self.enabled or not text or len(text.strip()) < 3:
+        if not text or len(text.strip()) < 3:
             return text  # Fallback: return original
+        if not self.initialized:
+            await asyncio.to_thread(self.initialize)
+        if not self.enabled:
+            return text
         
         # Check cache first (use hash for key to handle long texts)
         cache_key = hashlib.md5(text.encode('utf-8')).hexdigest()
-        if cache_key in _translation_cache:
+        cached = cache_key in _translation_cache
+        record_cache_lookup("translation", cached)
+        if cached:
             logger.debug(f"Translation cache hit for text: {text[:50]}...")
             return _translation_cache[cache_key]
         
+        if deadline_expired():
+            return text
+        if not self.breaker.allow_request():
+            record_upstream_call("translation", "circuit_open")
+            logger.debug("Translation circuit open, using original text")
+            return text
+        
         try:
-            result = self.client.translate(text, target_language="en")
+            result = await self._translate_with_retry(text)
+            self.breaker.record_success()
             translated_text = result.get("translatedText", text)
             
             # Validate translation
@@ -86,7 +131,46 @@ class TranslationService:
                 logger.warning(f"Translation returned empty text, using original")
                 return text
                 
+        except asyncio.TimeoutError:
+            self.breaker.record_failure()
+            logger.warning("Translation timed out, using original text")
+            return text
         except Exception as e:
+            from google.api_core import exceptions as google_exceptions
+            
+            upstream_failure = (
+                google_exceptions.TooManyRequests, google_exceptions.ServerError,
+                google_exceptions.RetryError, ConnectionError, TimeoutError
+            )
+            if isinstance(e, upstream_failure):
+                self.breaker.record_failure()
             logger.error(f"Translation API error: {e}")
             return text  # Fail gracefully - return original text
-
+    
+    async def _translate_with_retry(self, text: str) -> dict:
+        """Call the Translation API, retrying 429s with jittered backoff."""
+        from google.api_core import exceptions as google_exceptions
+        
+        max_retries = settings.RATE_LIMIT_MAX_RETRIES
+        for attempt in range(max_retries + 1):
+            await self.rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(
+                    asyncio.to_thread(self.client.translate, text, target_language="en"),
+                    timeout=stage_timeout(10.0)
+                )
+                record_upstream_call("translation", "200", time.perf_counter() - start)
+                return result
+            except asyncio.TimeoutError:
+                record_upstream_call("translation", "timeout")
+                raise
+            except google_exceptions.GoogleAPICallError as e:
+                record_upstream_call("translation", str(e.code or "error"), time.perf_counter() - start)
+                if not isinstance(e, google_exceptions.TooManyRequests):
+                    raise
+                if attempt == max_retries:
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning(f"Translation API returned 429, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(delay)
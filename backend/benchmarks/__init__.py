@@ -0,0 +1 @@
+"""Offline benchmarks for the SIFT backend (no real Gemini/Google quota used)."""
@@ -0,0 +1,109 @@
+"""Cold-start benchmark: import time, time to ready and first-request latency.
+
+Starts the API under uvicorn in a fresh process for each STARTUP_WARMUP mode,
+with local stub upstreams, and measures:
+
+- import: seconds to ``import app.main`` in a fresh interpreter (median of runs)
+- ready: process spawn until /health answers
+- first: latency of the first /analyze request, issued as soon as ready
+- warm: latency of a second /analyze request
+
+Usage (from backend/):
+    python -m benchmarks.bench_cold_start --modes off,background,blocking --runs 3
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+import httpx
+from .fixtures import make_texts
+from .stub_upstreams import StubConfig, StubServer, UpstreamProfile, _free_port
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+
+
+def measure_import(runs: int) -> List[float]:
+    """Seconds to import app.main in fresh interpreters."""
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        times.append(float(output.strip().splitlines()[-1]))
+    return times
+
+
+def measure_server(mode: str, stubs: StubServer, texts: List[str]) -> Dict[str, Any]:
+    """Start uvicorn with STARTUP_WARMUP=mode and time readiness and two requests."""
+    port = _free_port()
+    env = dict(os.environ, **stubs.env(), STARTUP_WARMUP=mode, GEMINI_RPM="0", GEMINI_TPM="0",
+               FACTCHECK_RPM="0", CUSTOM_SEARCH_RPM="0", COALESCE_REQUESTS="false")
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=base_url, timeout=120) as client:
+            while True:
+                try:
+                    client.get("/health")
+                    break
+                except httpx.TransportError:
+                    if process.poll() is not None or time.perf_counter() - started > 60:
+                        raise RuntimeError(f"API did not start in mode {mode}")
+                    time.sleep(0.02)
+            ready = time.perf_counter() - started
+
+            latencies = []
+            for text in texts[:2]:
+                start = time.perf_counter()
+                client.post("/api/v1/analyze", json={"text": text}).raise_for_status()
+                latencies.append(time.perf_counter() - start)
+            startup = client.get("/health").json().get("startup", {})
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return {"mode": mode, "ready_s": ready, "first_s": latencies[0], "warm_s": latencies[1], "startup": startup}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", default="off,background,blocking", help="STARTUP_WARMUP modes to compare")
+    parser.add_argument("--runs", type=int, default=3, help="runs per measurement")
+    parser.add_argument("--json", dest="json_path", help="also write results to this JSON file")
+    args = parser.parse_args()
+
+    imports = measure_import(args.runs)
+    print(f"import app.main: median {statistics.median(imports):.2f}s (runs: {', '.join(f'{t:.2f}' for t in imports)})")
+
+    # Fast stubs: we are measuring our own startup, not upstream latency
+    fast = UpstreamProfile(20, 0.0)
+    config = StubConfig(gemini=fast, factcheck=fast, custom_search=fast, translation=fast, pages=fast)
+    results: List[Dict[str, Any]] = []
+    with StubServer(config) as stubs:
+        for mode in [m for m in args.modes.split(",") if m]:
+            for run in range(args.runs):
+                # English texts: Translation is not stubbed in the server process
+                texts = make_texts(2, seed=100 + run, non_english_share=0.0)
+                result = measure_server(mode, stubs, texts)
+                results.append(result)
+            runs = [r for r in results if r["mode"] == mode]
+            print(f"{mode:<10} ready={statistics.median(r['ready_s'] for r in runs):.2f}s "
+                  f"first={statistics.median(r['first_s'] for r in runs):.2f}s "
+                  f"warm={statistics.median(r['warm_s'] for r in runs):.2f}s "
+                  f"phases={runs[-1]['startup'].get('phases', {})}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"import_s": imports, "servers": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Throughput and agreement of the single-pass HTML extractor against BeautifulSoup.
+
+Parses a saved page corpus with Crawler._parse_html under both
+HTML_EXTRACTOR settings and reports, per layout, pages and MB per second,
+then how closely the single-pass output matches the soup output: exact
+title and description matches, word-token F1 of the main text, and F1 of
+the paragraph lists (paragraphs compared whole, as word sequences). Words
+are compared rather than whitespace-split tokens because the soup extractor
+glues the paragraphs of its <p> cluster together without a space.
+
+The corpus is a directory of .html files (``--corpus``; the layout is the
+part of the file name before the first "-"), or by default pages generated
+in every fixtures.HTML_LAYOUTS layout, which ``--save`` writes out for reuse.
+
+Usage (from backend/):
+    python -m benchmarks.bench_extraction --pages 20 --paragraphs 40
+    python -m benchmarks.bench_extraction --save /tmp/corpus
+    python -m benchmarks.bench_extraction --corpus /tmp/corpus --repeat 5
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+from .fixtures import HTML_LAYOUTS, make_layout_page
+
+MB = 1024 * 1024
+WORD = re.compile(r"\w+")
+EXTRACTORS = ["soup", "single_pass"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="directory of saved .html pages (default: generated pages)")
+    parser.add_argument("--save", help="write the generated pages to this directory")
+    parser.add_argument("--pages", type=int, default=20, help="generated pages per layout")
+    parser.add_argument("--paragraphs", type=int, default=40, help="paragraphs per generated page")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes over the corpus (best is kept)")
+    parser.add_argument("--json", dest="json_path", help="also write results to this JSON file")
+    return parser.parse_args()
+
+
+def load_corpus(args: argparse.Namespace) -> List[Tuple[str, str, str]]:
+    """(layout, name, html) for every page."""
+    if args.corpus:
+        pages = []
+        for name in sorted(os.listdir(args.corpus)):
+            if name.endswith(".html"):
+                with open(os.path.join(args.corpus, name), encoding="utf-8", errors="replace") as f:
+                    pages.append((name.split("-")[0], name, f.read()))
+        return pages
+    pages = [
+        (layout, f"{layout}-{i}.html", make_layout_page(i, layout, args.paragraphs))
+        for layout in HTML_LAYOUTS for i in range(args.pages)
+    ]
+    if args.save:
+        os.makedirs(args.save, exist_ok=True)
+        for _, name, html in pages:
+            with open(os.path.join(args.save, name), "w", encoding="utf-8") as f:
+                f.write(html)
+    return pages
+
+
+def token_f1(expected: List[str], actual: List[str]) -> float:
+    """F1 of two token multisets (1.0 when both are empty)."""
+    if not expected and not actual:
+        return 1.0
+    common = sum((Counter(expected) & Counter(actual)).values())
+    if not common:
+        return 0.0
+    precision, recall = common / len(actual), common / len(expected)
+    return 2 * precision * recall / (precision + recall)
+
+
+def words(text: str) -> List[str]:
+    return WORD.findall(text.lower())
+
+
+def extract_all(pages: List[Tuple[str, str, str]], extractor: str, repeat: int) -> Tuple[List[Any], float]:
+    """Parsed pages and the best wall time of ``repeat`` passes."""
+    from app.config import settings
+    from app.services.crawler import Crawler
+
+    settings.HTML_EXTRACTOR = extractor
+    crawler = Crawler()
+    best = float("inf")
+    parsed: List[Any] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parsed = [crawler._parse_html(f"https://example.com/{name}", html, 200) for _, name, html in pages]
+        best = min(best, time.perf_counter() - started)
+    return parsed, best
+
+
+def run_benchmark(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    pages = load_corpus(args)
+    layouts = sorted({layout for layout, _, _ in pages}, key=lambda l: (HTML_LAYOUTS.index(l) if l in HTML_LAYOUTS else len(HTML_LAYOUTS), l))
+    outputs: Dict[str, List[Any]] = {}
+    results = []
+    for layout in layouts + ["all"]:
+        subset = [p for p in pages if layout in ("all", p[0])]
+        size = sum(len(html.encode("utf-8")) for _, _, html in subset)
+        result: Dict[str, Any] = {"layout": layout, "pages": len(subset), "mb": size / MB}
+        for extractor in EXTRACTORS:
+            outputs[extractor], elapsed = extract_all(subset, extractor, args.repeat)
+            result[f"{extractor}_pages_per_s"] = len(subset) / elapsed
+            result[f"{extractor}_mb_per_s"] = size / MB / elapsed
+        pairs = list(zip(outputs["soup"], outputs["single_pass"]))
+        result["title_match"] = sum(a.title == b.title for a, b in pairs) / len(pairs)
+        result["description_match"] = sum(a.description == b.description for a, b in pairs) / len(pairs)
+        result["text_f1"] = sum(token_f1(words(a.text), words(b.text)) for a, b in pairs) / len(pairs)
+        result["paragraphs_f1"] = sum(
+            token_f1([" ".join(words(p)) for p in a.paragraphs], [" ".join(words(p)) for p in b.paragraphs])
+            for a, b in pairs
+        ) / len(pairs)
+        result["speedup"] = result["single_pass_pages_per_s"] / result["soup_pages_per_s"]
+        results.append(result)
+        print(
+            f"{layout:<9} n={result['pages']:<4} {result['mb']:.1f}MB | "
+            f"soup {result['soup_pages_per_s']:.0f} pages/s {result['soup_mb_per_s']:.1f}MB/s | "
+            f"single_pass {result['single_pass_pages_per_s']:.0f} pages/s {result['single_pass_mb_per_s']:.1f}MB/s "
+            f"(x{result['speedup']:.2f}) | title={result['title_match']:.2f} "
+            f"description={result['description_match']:.2f} text_f1={result['text_f1']:.3f} "
+            f"paragraphs_f1={result['paragraphs_f1']:.3f}"
+        )
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    # Stub pages take the title/description fallback, which logs a warning per page
+    logging.getLogger("app.services.crawler").setLevel(logging.ERROR)
+    results = run_benchmark(args)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Peak Python heap per request (tracemalloc) for HTML-heavy, PDF-heavy and text inputs.
+
+Runs requests through FactCheckService against the stub upstreams, with
+corpus pages enlarged to realistic sizes (``--html-paragraphs``,
+``--pdf-lines``), and reports for each workload the peak traced memory
+above the idle baseline per request, and what is still allocated after the
+request (caches such as the page store; a steady rise would be a leak).
+With ``--concurrency`` above 1, requests run in batches and the batch peak
+is divided by the batch size.
+
+Workloads:
+    html  factcheck_url on HTML pages (page fetch plus evidence crawls)
+    pdf   factcheck_url on PDF reports
+    text  analyze_text (evidence crawls only)
+
+Usage (from backend/):
+    python -m benchmarks.bench_memory --requests 8
+    python -m benchmarks.bench_memory --kinds html --html-paragraphs 1500 --concurrency 4
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import statistics
+import tempfile
+import tracemalloc
+from typing import Any, Dict, List
+from .bench_pipeline import attach_stub_translation
+from .fixtures import make_texts
+from .stub_upstreams import StubConfig, StubServer, UpstreamProfile
+
+MB = 1024 * 1024
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kinds", default="html,pdf,text", help="workloads: html, pdf and/or text")
+    parser.add_argument("--requests", type=int, default=8, help="requests per workload")
+    parser.add_argument("--concurrency", type=int, default=1, help="requests traced together")
+    parser.add_argument("--html-paragraphs", type=int, default=600, help="paragraphs per stub HTML page")
+    parser.add_argument("--pdf-lines", type=int, default=4000, help="text lines per stub PDF")
+    parser.add_argument("--json", dest="json_path", help="also write results to this JSON file")
+    return parser.parse_args()
+
+
+async def measure(call: Any, items: List[Any], concurrency: int) -> Dict[str, Any]:
+    """Peak and retained traced memory per request, in MB."""
+    peaks: List[float] = []
+    retained: List[float] = []
+    errors = 0
+    for start in range(0, len(items), concurrency):
+        batch = items[start:start + concurrency]
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        results = await asyncio.gather(*(call(item) for item in batch), return_exceptions=True)
+        errors += sum(isinstance(r, Exception) for r in results)
+        peak = tracemalloc.get_traced_memory()[1]
+        del results
+        gc.collect()
+        current = tracemalloc.get_traced_memory()[0]
+        peaks.append((peak - baseline) / len(batch) / MB)
+        retained.append((current - baseline) / len(batch) / MB)
+    return {
+        "requests": len(items),
+        "errors": errors,
+        "peak_mb_p50": statistics.median(peaks),
+        "peak_mb_max": max(peaks),
+        "retained_mb_mean": statistics.mean(retained),
+    }
+
+
+async def run_benchmark(args: argparse.Namespace, server: StubServer) -> List[Dict[str, Any]]:
+    from app.services.factcheck_service import FactCheckService
+
+    html_urls = [server.page_url(name) for name in server.page_names if name.endswith(".html")]
+    pdf_urls = [server.page_url(name) for name in server.page_names if name.endswith(".pdf")]
+    results = []
+    for kind in [k for k in args.kinds.split(",") if k]:
+        # A fresh service per workload, so page-store entries of one do not count against the next
+        service = FactCheckService()
+        attach_stub_translation(service, server.base_url)
+        if kind == "text":
+            items, call = make_texts(args.requests), service.analyze_text
+        else:
+            urls = html_urls if kind == "html" else pdf_urls
+            items, call = [urls[i % len(urls)] for i in range(args.requests)], service.factcheck_url
+        # One untraced request first, so imports and lazily built tables are not counted
+        await call(items[0])
+        tracemalloc.start()
+        result = await measure(call, items, args.concurrency)
+        tracemalloc.stop()
+        result["kind"] = kind
+        results.append(result)
+        print(
+            f"{kind:<5} n={result['requests']:<4} err={result['errors']:<3} c={args.concurrency:<3} "
+            f"peak/request p50={result['peak_mb_p50']:.2f}MB max={result['peak_mb_max']:.2f}MB "
+            f"retained/request={result['retained_mb_mean']:.2f}MB"
+        )
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    fast = UpstreamProfile(30, 0.2)
+    config = StubConfig(
+        gemini=fast, factcheck=fast, custom_search=fast, translation=fast, pages=fast,
+        html_paragraphs=args.html_paragraphs, pdf_lines=args.pdf_lines,
+    )
+    with StubServer(config) as server:
+        os.environ.update(server.env())
+        os.environ.update({
+            "GEMINI_RPM": "0", "GEMINI_TPM": "0", "FACTCHECK_RPM": "0",
+            "CUSTOM_SEARCH_RPM": "0", "TRANSLATION_RPM": "0", "ADMISSION_MAX_IN_FLIGHT": "0",
+            "REQUEST_DEADLINE_SECONDS": "0",
+            "CLAIMREVIEW_INDEX_PATH": os.path.join(tempfile.mkdtemp(prefix="sift-bench-"), "claimreview.sqlite3"),
+        })
+        results = asyncio.run(run_benchmark(args, server))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Open-loop overload benchmark of analyze_text with and without admission control.
+
+Requests arrive at a fixed rate regardless of how fast they complete, as
+bursts of browser-extension traffic do. Gemini is throttled to
+``--gemini-rpm`` on the client side, which makes it the shared bottleneck a
+saturated worker has in production. Each configuration reports how many
+requests were admitted, rejected (503 in the API) and completed with every
+claim checked, the latency of admitted requests, and how quickly rejections
+came back.
+
+Usage (from backend/):
+    python -m benchmarks.bench_overload --rate 3 --duration 20
+    python -m benchmarks.bench_overload --configs off,4:4:3,8:16:10
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+from .bench_pipeline import attach_stub_translation, percentile
+from .fixtures import make_texts
+from .stub_upstreams import StubConfig, StubServer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=3.0, help="arrivals per second")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of arrivals")
+    parser.add_argument("--gemini-rpm", type=int, default=600, help="client-side Gemini requests per minute")
+    parser.add_argument("--deadline", type=float, default=20.0, help="REQUEST_DEADLINE_SECONDS")
+    parser.add_argument(
+        "--configs", default="off,4:4:3",
+        help="comma-separated admission settings: off, or max_in_flight:max_queue:queue_timeout"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", dest="json_path", help="also write results to this JSON file")
+    return parser.parse_args()
+
+
+def parse_config(spec: str) -> Tuple[int, int, float]:
+    if spec == "off":
+        return 0, 0, 0.0
+    max_in_flight, max_queue, queue_timeout = spec.split(":")
+    return int(max_in_flight), int(max_queue), float(queue_timeout)
+
+
+async def run_config(service: Any, spec: str, texts: List[str], rate: float) -> Dict[str, Any]:
+    """Send ``texts`` at ``rate`` per second through a fresh admission controller."""
+    from app.services import admission
+    from app.services.admission import AdmissionController, ServiceOverloaded
+    from app.services.rate_limiter import get_rate_limiter
+
+    admission._controller = AdmissionController(*parse_config(spec))
+    # Start from an empty Gemini bucket: steady-state throughput, no minute of burst allowance
+    bucket = get_rate_limiter("gemini")._request_bucket
+    if bucket:
+        bucket.tokens, bucket.updated = 0.0, time.monotonic()
+    admitted: List[float] = []
+    rejected: List[float] = []
+    retry_after: List[int] = []
+    complete = errors = 0
+
+    async def one(text: str) -> None:
+        nonlocal complete, errors
+        started = time.perf_counter()
+        try:
+            result = await service.analyze_text(text)
+        except ServiceOverloaded as e:
+            rejected.append(time.perf_counter() - started)
+            retry_after.append(e.retry_after)
+            return
+        except Exception:
+            errors += 1
+            return
+        admitted.append(time.perf_counter() - started)
+        if not any(c.get("status") == "deadline_exceeded" for c in result.get("claims", [])):
+            complete += 1
+
+    started = time.perf_counter()
+    tasks = []
+    for i, text in enumerate(texts):
+        await asyncio.sleep(max(0.0, started + i / rate - time.perf_counter()))
+        tasks.append(asyncio.create_task(one(text)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "config": spec,
+        "requests": len(texts),
+        "admitted": len(admitted),
+        "rejected": len(rejected),
+        "errors": errors,
+        "complete": complete,
+        "goodput_rps": complete / elapsed if elapsed else 0.0,
+        "admitted_p50_s": percentile(admitted, 50),
+        "admitted_p95_s": percentile(admitted, 95),
+        "admitted_p99_s": percentile(admitted, 99),
+        "rejected_p50_s": percentile(rejected, 50),
+        "rejected_p95_s": percentile(rejected, 95),
+        "retry_after_p50_s": percentile(retry_after, 50),
+    }
+
+
+def print_result(result: Dict[str, Any]) -> None:
+    print(
+        f"{result['config']:<10} n={result['requests']:<4} admitted={result['admitted']:<4} "
+        f"rejected={result['rejected']:<4} err={result['errors']:<3} complete={result['complete']:<4} "
+        f"goodput={result['goodput_rps']:.2f}/s | admitted p50={result['admitted_p50_s']:.2f}s "
+        f"p95={result['admitted_p95_s']:.2f}s p99={result['admitted_p99_s']:.2f}s | "
+        f"rejected p50={result['rejected_p50_s'] * 1000:.0f}ms p95={result['rejected_p95_s'] * 1000:.0f}ms "
+        f"retry-after~{result['retry_after_p50_s']:.0f}s"
+    )
+
+
+async def run_benchmark(args: argparse.Namespace, server: StubServer) -> List[Dict[str, Any]]:
+    from app.services.factcheck_service import FactCheckService
+
+    count = int(args.rate * args.duration)
+    results = []
+    for index, spec in enumerate(s for s in args.configs.split(",") if s):
+        # A fresh service per configuration: no page store or coalescing carries over
+        service = FactCheckService()
+        attach_stub_translation(service, server.base_url)
+        result = await run_config(service, spec, make_texts(count, seed=args.seed + index), args.rate)
+        print_result(result)
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    with StubServer(StubConfig(seed=args.seed)) as server:
+        os.environ.update(server.env())
+        os.environ.update({
+            "GEMINI_RPM": str(args.gemini_rpm), "GEMINI_TPM": "0", "FACTCHECK_RPM": "0",
+            "CUSTOM_SEARCH_RPM": "0", "TRANSLATION_RPM": "0",
+            "REQUEST_DEADLINE_SECONDS": str(args.deadline),
+            "COALESCE_REQUESTS": "false",
+            "CLAIMREVIEW_INDEX_PATH": os.path.join(tempfile.mkdtemp(prefix="sift-bench-"), "claimreview.sqlite3"),
+        })
+        results = asyncio.run(run_benchmark(args, server))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
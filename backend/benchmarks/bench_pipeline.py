@@ -0,0 +1,202 @@
+"""End-to-end benchmark of FactCheckService against local stub upstreams.
+
+Drives analyze_text and factcheck_url at several concurrency levels and
+reports p50/p95/p99 latency, throughput and outbound calls per request.
+No real Gemini or Google quota is used.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pipeline --concurrency 1,4,16 --requests 32
+    python -m benchmarks.bench_pipeline --gemini 1500,0.5,0.05 --pages 400,0.8
+    python -m benchmarks.bench_pipeline --record /tmp/stub.jsonl
+    python -m benchmarks.bench_pipeline --analysis-mode fast --modes text
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+from .fixtures import make_texts
+from .stub_upstreams import StubConfig, StubServer, UpstreamProfile
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values``."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=24, help="requests per concurrency level")
+    parser.add_argument("--modes", default="text,url", help="text (analyze_text) and/or url (factcheck_url)")
+    parser.add_argument("--analysis-mode", default="balanced", help="ANALYSIS_MODE: fast, balanced or thorough")
+    parser.add_argument("--deadline", type=float, default=0, help="REQUEST_DEADLINE_SECONDS (0 disables)")
+    profile_help = "latency profile median_ms[,sigma[,error_rate[,error_status]]]"
+    parser.add_argument("--gemini", default="800,0.35", help=profile_help)
+    parser.add_argument("--factcheck", default="150,0.3", help=profile_help)
+    parser.add_argument("--custom-search", default="200,0.3", help=profile_help)
+    parser.add_argument("--translation", default="120,0.3", help=profile_help)
+    parser.add_argument("--pages", default="250,0.5", help=profile_help)
+    parser.add_argument("--html-pages", type=int, default=40)
+    parser.add_argument("--pdf-pages", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", dest="json_path", help="also write results to this JSON file")
+    parser.add_argument("--record", dest="cassette", help="record all outbound calls and inputs to this cassette")
+    return parser.parse_args()
+
+
+def build_config(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        gemini=UpstreamProfile.parse(args.gemini),
+        factcheck=UpstreamProfile.parse(args.factcheck),
+        custom_search=UpstreamProfile.parse(args.custom_search),
+        translation=UpstreamProfile.parse(args.translation),
+        pages=UpstreamProfile.parse(args.pages),
+        html_pages=args.html_pages,
+        pdf_pages=args.pdf_pages,
+        seed=args.seed,
+    )
+
+
+def configure_environment(server: StubServer, args: argparse.Namespace) -> None:
+    """Point the backend at the stubs; must run before app modules are imported."""
+    os.environ.update(server.env())
+    os.environ.update({
+        # Measure the pipeline, not our own client-side throttling
+        "GEMINI_RPM": "0", "GEMINI_TPM": "0", "FACTCHECK_RPM": "0",
+        "CUSTOM_SEARCH_RPM": "0", "TRANSLATION_RPM": "0", "ADMISSION_MAX_IN_FLIGHT": "0",
+        "REQUEST_DEADLINE_SECONDS": str(args.deadline),
+        "ANALYSIS_MODE": args.analysis_mode,
+        # A fresh ClaimReview index per run, so runs do not answer each other's fact-check queries
+        "CLAIMREVIEW_INDEX_PATH": os.path.join(tempfile.mkdtemp(prefix="sift-bench-"), "claimreview.sqlite3"),
+    })
+    if args.cassette:
+        os.environ.update({"HTTP_TRANSPORT_MODE": "record", "HTTP_CASSETTE_PATH": args.cassette})
+
+
+def attach_stub_translation(service: Any, base_url: str) -> None:
+    """Give the translation service an anonymous client aimed at the stub."""
+    from google.auth.credentials import AnonymousCredentials
+    from google.cloud import translate_v2 as translate
+
+    service.translation_service.client = translate.Client(
+        credentials=AnonymousCredentials(), client_options={"api_endpoint": base_url}
+    )
+    service.translation_service.enabled = True
+    service.translation_service.initialized = True
+
+
+async def run_level(call, workload: List[Any], concurrency: int,
+                    reset_counts: Callable[[], Dict[str, int]]) -> Dict[str, Any]:
+    """Run ``workload`` through ``call`` with at most ``concurrency`` in flight.
+
+    ``reset_counts`` returns outbound calls per upstream since its last call.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one(item: Any) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call(item)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    reset_counts()
+    started = time.perf_counter()
+    await asyncio.gather(*(one(item) for item in workload))
+    elapsed = time.perf_counter() - started
+    calls = reset_counts()
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(workload),
+        "errors": errors,
+        "p50_s": percentile(latencies, 50),
+        "p95_s": percentile(latencies, 95),
+        "p99_s": percentile(latencies, 99),
+        "throughput_rps": len(workload) / elapsed if elapsed else 0.0,
+        "calls_per_request": {name: count / len(workload) for name, count in sorted(calls.items())},
+    }
+
+
+def print_result(mode: str, result: Dict[str, Any]) -> None:
+    calls = " ".join(f"{name}={count:.1f}" for name, count in result["calls_per_request"].items())
+    print(
+        f"{mode:<5} c={result['concurrency']:<3} n={result['requests']:<4} err={result['errors']:<3} "
+        f"p50={result['p50_s']:.2f}s p95={result['p95_s']:.2f}s p99={result['p99_s']:.2f}s "
+        f"thr={result['throughput_rps']:.2f}/s | calls/req: {calls}"
+    )
+
+
+def print_llm_usage() -> None:
+    """Gemini calls, latency, tokens and estimated cost per task over the whole run."""
+    from app.services.metrics import llm_usage_report
+
+    report = llm_usage_report()
+    if not report:
+        return
+    total_cost = sum(entry["cost_usd"] for entry in report.values()) or 1.0
+    print("\nGemini usage by task:")
+    for task, entry in sorted(report.items()):
+        print(
+            f"  {task:<18} {','.join(entry['models']):<24} calls={entry['calls']:<5} "
+            f"mean={entry['mean_seconds']:.2f}s in={entry['prompt_tokens']:<8} cached={entry['cached_tokens']:<7} "
+            f"out={entry['output_tokens']:<7} "
+            f"cost=${entry['cost_usd']:.4f} ({entry['cost_usd'] / total_cost:.0%})"
+        )
+
+
+async def run_benchmark(args: argparse.Namespace, server: StubServer) -> List[Dict[str, Any]]:
+    from app.services.factcheck_service import FactCheckService
+    from app.services.http_transport import record_workload_input
+
+    service = FactCheckService()
+    attach_stub_translation(service, server.base_url)
+    page_urls = [server.page_url(name) for name in server.page_names]
+    levels = [int(c) for c in args.concurrency.split(",") if c]
+
+    results = []
+    for mode in [m for m in args.modes.split(",") if m]:
+        for level_index, concurrency in enumerate(levels):
+            if mode == "text":
+                workload = make_texts(args.requests, seed=args.seed + level_index)
+                call = service.analyze_text
+                kind = "text"
+            else:
+                offset = level_index * args.requests
+                workload = [page_urls[(offset + i) % len(page_urls)] for i in range(args.requests)]
+                call = service.factcheck_url
+                kind = "url"
+            for item in workload:
+                record_workload_input(kind, {kind: item})
+            result = await run_level(call, workload, concurrency, server.reset_counts)
+            result["mode"] = mode
+            print_result(mode, result)
+            results.append(result)
+    print_llm_usage()
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    with StubServer(build_config(args)) as server:
+        configure_environment(server, args)
+        results = asyncio.run(run_benchmark(args, server))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
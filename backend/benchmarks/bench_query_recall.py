@@ -0,0 +1,187 @@
+"""Search recall of local keyphrase queries against Gemini-generated queries.
+
+For each claim, generates queries with both strategies (QUERY_STRATEGY=llm
+and local), runs the top 3 of each through Fact Check Tools and Custom
+Search as the pipeline does, and reports how many of the URLs found with the
+LLM queries the local queries also find, whether fact-check hits are kept,
+and what generating the queries costs.
+
+Recall is only meaningful against the real APIs, so by default this uses the
+keys in the environment (GOOGLE_API_KEY, FACT_CHECK_API_KEY,
+GOOGLE_SEARCH_API_KEY, GOOGLE_SEARCH_CX) and spends quota: about 6 search
+calls and one Gemini call per claim. ``--stub`` runs it against the stub
+upstreams instead, which only checks the harness (stub search results depend
+on a hash of the query).
+
+The IDF table starts from ``--idf`` (a QUERY_IDF_FILE), from the Fact Check
+and Custom Search responses in a recorded cassette (``--idf-cassette``), or
+else from the fixture texts.
+
+Usage (from backend/):
+    python -m benchmarks.bench_query_recall --claims claims.txt --idf-cassette prod.jsonl
+    python -m benchmarks.bench_query_recall --stub
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import statistics
+import time
+from typing import Any, Dict, Iterator, List
+from .fixtures import TOPICS, make_texts
+from .stub_upstreams import StubServer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--claims", help="file with one claim per line (default: the fixture claims)")
+    parser.add_argument("--idf", help="IDF table (QUERY_IDF_FILE format) to start from")
+    parser.add_argument("--idf-cassette", help="build the IDF table from the search responses in this cassette")
+    parser.add_argument("--save-idf", help="write the IDF table used to this file")
+    parser.add_argument("--queries", type=int, default=3, help="queries searched per strategy, as in the pipeline")
+    parser.add_argument("--stub", action="store_true", help="use stub upstreams (harness check, no real recall)")
+    parser.add_argument("--json", dest="json_path", help="also write results to this JSON file")
+    return parser.parse_args()
+
+
+def load_claims(path: str) -> List[str]:
+    if not path:
+        return [f"{subject} {predicate}." for subject, predicate in TOPICS]
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def cassette_documents(path: str) -> Iterator[str]:
+    """Claim texts and result titles/snippets of the search responses in a cassette."""
+    from app.services.http_transport import load_cassette
+
+    for entry in load_cassette(path):
+        if entry.get("type") != "http" or entry.get("status") != 200:
+            continue
+        url = entry.get("url", "")
+        if "claims:search" not in url and "customsearch" not in url:
+            continue
+        try:
+            data = json.loads(base64.b64decode(entry["body_b64"]))
+        except (ValueError, KeyError):
+            continue
+        for claim in data.get("claims", []):
+            yield claim.get("text", "")
+        for item in data.get("items", []):
+            yield f"{item.get('title', '')} {item.get('snippet', '')}"
+
+
+def build_idf_table(args: argparse.Namespace) -> Any:
+    from app.services.keyphrase import get_idf_table
+
+    table = get_idf_table()
+    if args.idf:
+        table.load(args.idf)
+    if args.idf_cassette:
+        table.add_documents(cassette_documents(args.idf_cassette))
+    if not table.documents:
+        table.add_documents(sentence for text in make_texts(200) for sentence in text.split(". "))
+    if args.save_idf:
+        table.save(args.save_idf)
+    return table
+
+
+async def search_urls(search_service: Any, queries: List[str]) -> Dict[str, set]:
+    """URLs found by the queries, split into fact-check hits and all hits."""
+    fact_checks, found = set(), set()
+    for query in queries:
+        fact_check_results = await search_service.search_factcheck_api(query, 5)
+        fact_checks.update(e.url for e in fact_check_results if e.url)
+        found.update(e.url for e in fact_check_results if e.url)
+        found.update(e.url for e in await search_service.search_google_custom(query, 5) if e.url)
+    return {"fact_checks": fact_checks, "all": found}
+
+
+def term_recall(reference: List[str], queries: List[str]) -> float:
+    """Share of the reference queries' content terms that appear in the queries."""
+    from app.services.relevance import query_terms
+
+    wanted = set(query_terms(" ".join(reference)))
+    if not wanted:
+        return 1.0
+    return len(wanted & set(query_terms(" ".join(queries)))) / len(wanted)
+
+
+async def run_benchmark(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from app.config import settings
+    from app.services.llm_analyzer import LLMAnalyzer
+    from app.services.query_generator import QueryGenerator
+    from app.services.search_service import SearchService
+
+    build_idf_table(args)
+    generator = QueryGenerator(LLMAnalyzer())
+    search_service = SearchService()
+    rows = []
+    for claim in load_claims(args.claims):
+        settings.QUERY_STRATEGY = "llm"
+        started = time.perf_counter()
+        llm_queries = await generator.generate_queries(claim)
+        llm_ms = (time.perf_counter() - started) * 1000
+        settings.QUERY_STRATEGY = "local"
+        started = time.perf_counter()
+        local_queries = await generator.generate_queries(claim)
+        local_ms = (time.perf_counter() - started) * 1000
+
+        llm_hits = await search_urls(search_service, llm_queries[:args.queries])
+        local_hits = await search_urls(search_service, local_queries[:args.queries])
+        reference = llm_hits["all"]
+        rows.append({
+            "claim": claim,
+            "llm_queries": llm_queries,
+            "local_queries": local_queries,
+            "llm_ms": llm_ms,
+            "local_ms": local_ms,
+            "llm_urls": len(reference),
+            "local_urls": len(local_hits["all"]),
+            "url_recall": len(reference & local_hits["all"]) / len(reference) if reference else None,
+            "llm_fact_check": bool(llm_hits["fact_checks"]),
+            "local_fact_check": bool(local_hits["fact_checks"]),
+            "term_recall": term_recall(llm_queries, local_queries),
+        })
+    return rows
+
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    for row in rows:
+        recall = "-" if row["url_recall"] is None else f"{row['url_recall']:.2f}"
+        print(f"\n{row['claim'][:90]}")
+        print(f"  llm   {row['llm_ms']:8.1f} ms  {row['llm_urls']:3d} urls  {row['llm_queries']}")
+        print(f"  local {row['local_ms']:8.3f} ms  {row['local_urls']:3d} urls  {row['local_queries']}")
+        print(f"  url recall {recall}  term recall {row['term_recall']:.2f}  "
+              f"fact-check hit llm={row['llm_fact_check']} local={row['local_fact_check']}")
+
+    recalls = [row["url_recall"] for row in rows if row["url_recall"] is not None]
+    with_fact_checks = [row for row in rows if row["llm_fact_check"]]
+    print(f"\n{len(rows)} claims")
+    print(f"  mean url recall      {statistics.mean(recalls):.2f}" if recalls else "  mean url recall      -")
+    print(f"  mean term recall     {statistics.mean(row['term_recall'] for row in rows):.2f}")
+    if with_fact_checks:
+        kept = sum(row["local_fact_check"] for row in with_fact_checks)
+        print(f"  fact-check hits kept {kept}/{len(with_fact_checks)}")
+    print(f"  median generation    llm {statistics.median(row['llm_ms'] for row in rows):.1f} ms, "
+          f"local {statistics.median(row['local_ms'] for row in rows):.3f} ms")
+
+
+def main() -> None:
+    args = parse_args()
+    if args.stub:
+        with StubServer() as server:
+            os.environ.update(server.env())
+            os.environ.update({"GEMINI_RPM": "0", "GEMINI_TPM": "0", "FACTCHECK_RPM": "0", "CUSTOM_SEARCH_RPM": "0"})
+            rows = asyncio.run(run_benchmark(args))
+    else:
+        rows = asyncio.run(run_benchmark(args))
+    print_report(rows)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Microbenchmark of evidence ranking and top-K selection on large snippet batches.
+
+Compares EvidenceRanker (BM25 + heap selection) with the previous set-overlap
+scorer, which copied every snippet and fully sorted before selecting. Note
+that BM25 also scores crawled text, which the old scorer ignored; about 30%
+of the generated snippets carry some, roughly tripling the text scanned.
+
+Usage (from backend/):
+    python -m benchmarks.bench_ranking --sizes 1000,10000,100000
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Callable, Dict, List
+from .fixtures import FILLER, TOPICS
+
+DOMAINS = ["snopes.com", "www.cdc.gov", "reuters.com", "example.com", "blog.example.org", "news.example.in"]
+
+
+def make_snippets(count: int, seed: int = 5, records: bool = False) -> List[Any]:
+    """Search-result-like snippets, some with crawled text; Evidence records or (legacy) dicts."""
+    from app.models import Evidence
+    rng = random.Random(seed)
+    snippets = []
+    for i in range(count):
+        subject, predicate = rng.choice(TOPICS)
+        text = f"{subject} {predicate}. " + " ".join(rng.choice(FILLER) for _ in range(rng.randint(1, 3)))
+        snippet = {
+            "title": f"{subject} - report {i}",
+            "url": f"https://{rng.choice(DOMAINS)}/article/{i}",
+            "snippet": text,
+            "source": "fact_check_api" if rng.random() < 0.05 else "google_custom_search",
+        }
+        if rng.random() < 0.3:
+            snippet["crawled_text"] = " ".join(rng.choice(FILLER) for _ in range(8))
+        snippets.append(Evidence(**snippet) if records else snippet)
+    return snippets
+
+
+def legacy_rank(ranker: Any, claim: str, evidence_snippets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """The previous rank_by_relevance + summarize_evidence (set overlap, copy, sort, three passes)."""
+    claim_words = set(claim.lower().split())
+    scored = []
+    for snippet in evidence_snippets:
+        text = (snippet.get("snippet", "") or snippet.get("text", "") or "").lower()
+        title = (snippet.get("title", "") or "").lower()
+        relevance = 0.0
+        if title:
+            relevance += len(claim_words & set(title.split())) / max(len(claim_words), 1) * 0.4
+        if text:
+            relevance += len(claim_words & set(text.split())) / max(len(claim_words), 1) * 0.3
+        priority = ranker._get_source_priority(snippet.get("url", ""), snippet.get("source", ""))
+        final = relevance * priority + (0.5 if priority == ranker.PRIORITY_FACT_CHECK_API else 0.0)
+        scored.append({**snippet, "relevance_score": relevance, "source_priority": priority, "final_score": final,
+                       "is_authoritative": ranker._get_source_priority(snippet.get("url", "")) >= ranker.PRIORITY_GOV_EDU_NEWS})
+    scored.sort(key=lambda x: x.get("final_score", 0.0), reverse=True)
+    top = [s for s in scored if s["source_priority"] == ranker.PRIORITY_FACT_CHECK_API][:5]
+    top.extend([s for s in scored if s["source_priority"] == ranker.PRIORITY_GOV_EDU_NEWS][:10 - len(top)])
+    top.extend([s for s in scored if s["source_priority"] == ranker.PRIORITY_OTHERS][:10 - len(top)])
+    return top[:10]
+
+
+def current_rank(ranker: Any, claim: str, evidence_snippets: List[Any]) -> List[Any]:
+    ranked = ranker.rank_by_relevance(claim, evidence_snippets, sort=False)
+    return asyncio.run(ranker.summarize_evidence(claim, ranked, max_snippets=10))
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from app.services.evidence_ranker import EvidenceRanker
+
+    ranker = EvidenceRanker(llm_analyzer=None)
+    claim = "India's population passed 1.4 billion people in 2023 according to UN estimates"
+    for size in [int(s) for s in args.sizes.split(",") if s]:
+        legacy = best_of(lambda: legacy_rank(ranker, claim, make_snippets(size)), args.repeat)
+        current = best_of(lambda: current_rank(ranker, claim, make_snippets(size, records=True)), args.repeat)
+        legacy -= best_of(lambda: make_snippets(size), args.repeat)
+        current -= best_of(lambda: make_snippets(size, records=True), args.repeat)
+        print(f"n={size:<7} legacy={legacy * 1000:9.1f}ms  bm25+heap={current * 1000:9.1f}ms  "
+              f"({size / current:,.0f} snippets/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Replay a recorded workload through FactCheckService without any network access.
+
+Record a cassette from production (HTTP_TRANSPORT_MODE=record on the server)
+or from the stub harness (bench_pipeline --record), then replay the same
+inputs and upstream responses to compare pipeline changes deterministically.
+Replay uses either the recorded upstream latencies or none, which isolates
+local CPU cost.
+
+Translation goes through the google-cloud client rather than httpx and is not
+recorded, so it is disabled during replay.
+
+Usage (from backend/):
+    python -m benchmarks.bench_replay /tmp/stub.jsonl --concurrency 1,8
+    python -m benchmarks.bench_replay prod.jsonl --timing zero --match url
+"""
+import argparse
+import asyncio
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, List
+from .bench_pipeline import print_llm_usage, print_result, run_level
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cassette", help="cassette written in record mode")
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated concurrency levels")
+    parser.add_argument("--timing", choices=["original", "zero"], default="original")
+    parser.add_argument("--match", choices=["strict", "url"], default="strict",
+                        help="strict also matches request bodies; url survives prompt changes")
+    parser.add_argument("--json", dest="json_path", help="also write results to this JSON file")
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace) -> None:
+    """Replay settings; must run before app modules are imported."""
+    os.environ.update({
+        "HTTP_TRANSPORT_MODE": "replay",
+        "HTTP_CASSETTE_PATH": args.cassette,
+        "HTTP_REPLAY_TIMING": args.timing,
+        "HTTP_REPLAY_MATCH": args.match,
+        "GEMINI_RPM": "0", "GEMINI_TPM": "0", "FACTCHECK_RPM": "0", "CUSTOM_SEARCH_RPM": "0",
+        "ADMISSION_MAX_IN_FLIGHT": "0",
+        "REQUEST_DEADLINE_SECONDS": "0",
+        # Keys are redacted from cassettes; any value lets the services make the calls
+        "GOOGLE_API_KEY": "replay", "FACT_CHECK_API_KEY": "replay",
+        "GOOGLE_SEARCH_API_KEY": "replay", "GOOGLE_SEARCH_CX": "replay",
+    })
+    # Aim API calls at the endpoints that were recorded (app modules read settings at import)
+    with open(args.cassette, encoding="utf-8") as f:
+        for line in f:
+            if '"type": "config"' in line:
+                os.environ.update(json.loads(line)["endpoints"])
+
+
+async def run_replay(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from app.services.factcheck_service import FactCheckService
+    from app.services.http_transport import get_transport, load_cassette
+
+    inputs = [entry for entry in load_cassette(args.cassette) if entry.get("type") == "input"]
+    if not inputs:
+        raise SystemExit(f"{args.cassette} contains no recorded inputs")
+
+    transport = get_transport()
+    last = Counter()
+
+    def reset_counts() -> Dict[str, int]:
+        current = Counter({"replayed": transport.calls - transport.misses, "missing": transport.misses})
+        delta = current - last
+        last.clear()
+        last.update(current)
+        return dict(delta)
+
+    async def call(entry: Dict[str, Any]) -> Any:
+        payload = entry["payload"]
+        if entry["kind"] == "url":
+            return await service.factcheck_url(payload["url"], mode=payload.get("mode"))
+        return await service.analyze_text(payload["text"], payload.get("url"), mode=payload.get("mode"))
+
+    results = []
+    for concurrency in [int(c) for c in args.concurrency.split(",") if c]:
+        # Fresh service and cursor per level so every level sees the same responses
+        transport.rewind()
+        last.clear()
+        service = FactCheckService()
+        service.translation_service.enabled = False
+        service.translation_service.initialized = True
+        result = await run_level(call, inputs, concurrency, reset_counts)
+        result["mode"] = "replay"
+        print_result("replay", result)
+        results.append(result)
+    print_llm_usage()
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    configure_environment(args)
+    results = asyncio.run(run_replay(args))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
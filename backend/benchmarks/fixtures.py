@@ -0,0 +1,186 @@
+"""Deterministic fixture corpus: input texts, crawlable HTML pages and PDFs."""
+import random
+from typing import Dict, List, Tuple
+
+
+TOPICS = [
+    ("The Eiffel Tower", "was completed in 1889 and is 330 metres tall"),
+    ("India's population", "passed 1.4 billion people in 2023 according to UN estimates"),
+    ("The COVID-19 vaccine", "was tested on more than 40,000 participants in phase 3 trials"),
+    ("Global average temperature", "has risen by about 1.1 degrees Celsius since 1900"),
+    ("The Great Wall of China", "is not visible to the naked eye from low Earth orbit"),
+    ("Mount Everest", "grew by 86 centimetres after a 2020 survey remeasured it"),
+    ("Delhi's air quality index", "exceeded 450 on several days in November 2023"),
+    ("The moon landing", "took place on 20 July 1969 during the Apollo 11 mission"),
+    ("Electric vehicle sales", "made up 14 percent of new car sales worldwide in 2022"),
+    ("The Amazon rainforest", "produces roughly 6 percent of the world's oxygen"),
+]
+
+FILLER = [
+    "Officials said the figures were consistent with earlier reports.",
+    "Researchers cautioned that further study is needed before drawing conclusions.",
+    "The announcement was widely shared on social media within hours.",
+    "Critics argued that the numbers were taken out of context.",
+    "Several outlets republished the statement without independent verification.",
+    "Local residents expressed mixed reactions to the news.",
+]
+
+HINDI_TEXTS = [
+    "दिल्ली में वायु प्रदूषण बहुत खतरनाक स्तर पर है और AQI 450 से ऊपर पहुंच गया है।",
+    "भारत की जनसंख्या 2023 में 140 करोड़ से अधिक हो गई है।",
+]
+
+
+def make_texts(count: int, seed: int = 7, non_english_share: float = 0.1) -> List[str]:
+    """Input texts of 2-4 claims mixed with filler; a share is non-English."""
+    rng = random.Random(seed)
+    texts = []
+    for i in range(count):
+        if rng.random() < non_english_share:
+            texts.append(f"{rng.choice(HINDI_TEXTS)} ({i})")
+            continue
+        sentences = []
+        for subject, predicate in rng.sample(TOPICS, rng.randint(2, 4)):
+            sentences.append(f"{subject} {predicate}.")
+            sentences.append(rng.choice(FILLER))
+        # Unique suffix so request coalescing does not hide the work being measured
+        sentences.append(f"Report number {i}.")
+        texts.append(" ".join(sentences))
+    return texts
+
+
+def make_html_page(index: int, paragraphs: int = 12, seed: int = 11) -> str:
+    """A news-article-like HTML page with navigation, an <article> and a footer."""
+    rng = random.Random(seed + index)
+    subject, predicate = TOPICS[index % len(TOPICS)]
+    body = []
+    for _ in range(paragraphs):
+        sentences = [rng.choice(FILLER) for _ in range(rng.randint(3, 6))]
+        if rng.random() < 0.4:
+            sentences.insert(0, f"{subject} {predicate}.")
+        body.append(f"<p>{' '.join(sentences)}</p>")
+    nav = "".join(f'<li><a href="/section/{n}">Section {n}</a></li>' for n in range(30))
+    return f"""<!DOCTYPE html>
+<html><head>
+<title>{subject}: what the evidence says (#{index})</title>
+<meta name="description" content="Fact check of the claim that {subject.lower()} {predicate}.">
+<meta property="og:title" content="{subject} fact check">
+<script>window.dataLayer = [];{' var x = 1;' * 200}</script>
+<style>body {{ font-family: sans-serif; }}{' .c {{ color: red; }}' * 100}</style>
+</head><body>
+<header><nav><ul>{nav}</ul></nav></header>
+<main><article>
+<h1>{subject} fact check</h1>
+{''.join(body)}
+<aside>Related: {' '.join(rng.choice(FILLER) for _ in range(3))}</aside>
+</article></main>
+<footer><p>Copyright {2000 + index % 25} Example News. All rights reserved.</p></footer>
+</body></html>"""
+
+
+HTML_LAYOUTS = ["article", "teasers", "blog", "tagsoup", "listicle", "stub"]
+
+
+def make_layout_page(index: int, layout: str, paragraphs: int = 12, seed: int = 17) -> str:
+    """An HTML page in one of HTML_LAYOUTS, for extraction benchmarks.
+
+    article: make_html_page; teasers: related-story cards (short <article>s of
+    links) before the story; blog: no <article>/<main>, a link sidebar and
+    og:description only; tagsoup: blog with unclosed <p>s; listicle: headings,
+    nested lists and a blockquote with entities; stub: og:title and a few
+    short lines only.
+    """
+    if layout == "article":
+        return make_html_page(index, paragraphs, seed)
+    rng = random.Random(seed + index)
+    subject, predicate = TOPICS[index % len(TOPICS)]
+
+    def sentences(low: int = 3, high: int = 6) -> str:
+        return " ".join(rng.choice(FILLER) for _ in range(rng.randint(low, high)))
+
+    if layout == "teasers":
+        cards = "".join(
+            f'<article class="card"><a href="/story/{n}"><h3>{TOPICS[n % len(TOPICS)][0]}</h3></a></article>'
+            for n in range(index % 4 + 2)
+        )
+        body = "".join(f"<p>{subject} {predicate}. {sentences()}</p>" for _ in range(paragraphs))
+        return f"""<html><head><title>{subject} &ndash; live updates</title>
+<meta name="description" content="Latest on {subject.lower()}."></head><body>
+<nav><a href="/">Home</a> <a href="/world">World</a></nav>
+<main><section class="related">{cards}</section>
+<article><h1>{subject}</h1>{body}<footer><p>Filed by staff reporters.</p></footer></article></main>
+</body></html>"""
+    if layout in ("blog", "tagsoup"):
+        end = "" if layout == "tagsoup" else "</p>"
+        links = "".join(f'<li><a href="/tag/{n}">Tag number {n}</a></li>' for n in range(20))
+        body = "\n".join(f"<p>{sentences()}{end}" for _ in range(paragraphs))
+        return f"""<html><head><title>Notes on {subject.lower()}</title>
+<meta property="og:description" content="{subject} {predicate}, explained.">
+<script>var tracking = "{'x' * 500}";</script></head><body>
+<div id="sidebar"><ul>{links}</ul></div>
+<div class="content"><h2>{subject} {predicate}</h2>
+{body}
+<div class="share">Share this</div></div>
+</body></html>"""
+    if layout == "listicle":
+        items = "".join(
+            f"<li><h2>Point {n + 1}</h2><p>{sentences(2, 4)}</p><ul><li>{sentences(1, 2)}</li></ul></li>"
+            for n in range(max(paragraphs // 2, 2))
+        )
+        return f"""<html><head><title>{subject}: {paragraphs // 2} things to know</title>
+<meta name="description" content="What we know &amp; what we don't."></head><body>
+<header><h1>Example&nbsp;News</h1></header>
+<article><h1>{subject}: the facts</h1>
+<blockquote>&ldquo;{subject} {predicate}.&rdquo; &mdash; a viral post</blockquote>
+<ol>{items}</ol>
+<aside><p>Advertisement</p></aside></article>
+</body></html>"""
+    return f"""<html><head><meta property="og:title" content="{subject}"></head><body>
+<p>Short note.</p><p>{subject}.</p></body></html>"""
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(index: int, lines: int = 60, seed: int = 13) -> bytes:
+    """A minimal single-page text PDF that PyPDF2/pdfplumber can extract."""
+    rng = random.Random(seed + index)
+    subject, predicate = TOPICS[index % len(TOPICS)]
+    text_lines = [f"Report {index}: {subject} {predicate}."]
+    text_lines += [rng.choice(FILLER) for _ in range(lines)]
+
+    stream = "BT /F1 9 Tf 40 800 Td 11 TL\n"
+    stream += "".join(f"({_pdf_escape(line)}) Tj T*\n" for line in text_lines)
+    stream += "ET"
+    stream_bytes = stream.encode("latin-1")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length " + str(len(stream_bytes)).encode() + b" >>\nstream\n" + stream_bytes + b"\nendstream",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def make_page_corpus(html_pages: int = 40, pdf_pages: int = 10,
+                     html_paragraphs: int = 12, pdf_lines: int = 60) -> Dict[str, Tuple[bytes, str]]:
+    """Map of page path -> (body, content type) served by the stub upstreams."""
+    corpus = {}
+    for i in range(html_pages):
+        corpus[f"page-{i}.html"] = (make_html_page(i, html_paragraphs).encode("utf-8"), "text/html; charset=utf-8")
+    for i in range(pdf_pages):
+        corpus[f"report-{i}.pdf"] = (make_pdf(i, pdf_lines), "application/pdf")
+    return corpus
@@ -0,0 +1,334 @@
+"""Local stand-ins for Gemini, Fact Check Tools, Custom Search, Translation and crawled pages.
+
+Each upstream has a latency distribution (log-normal around a median) and an
+error rate, and every call is counted so the harness can report outbound
+calls per request.
+"""
+import asyncio
+import json
+import multiprocessing
+import random
+import re
+import socket
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from .fixtures import make_page_corpus
+
+
+@dataclass
+class UpstreamProfile:
+    """Latency distribution and failure behaviour of one stub upstream."""
+
+    median_ms: float = 100.0
+    sigma: float = 0.3  # log-normal shape; 0 gives a fixed latency
+    error_rate: float = 0.0  # share of calls answered with error_status
+    error_status: int = 503
+
+    @classmethod
+    def parse(cls, spec: str) -> "UpstreamProfile":
+        """Parse ``median_ms[,sigma[,error_rate[,error_status]]]``."""
+        parts = [p for p in spec.split(",") if p]
+        profile = cls(median_ms=float(parts[0]))
+        if len(parts) > 1:
+            profile.sigma = float(parts[1])
+        if len(parts) > 2:
+            profile.error_rate = float(parts[2])
+        if len(parts) > 3:
+            profile.error_status = int(parts[3])
+        return profile
+
+    def sample_delay(self, rng: random.Random) -> float:
+        """Seconds to wait before answering."""
+        if self.sigma <= 0:
+            return self.median_ms / 1000.0
+        return rng.lognormvariate(0.0, self.sigma) * self.median_ms / 1000.0
+
+
+@dataclass
+class StubConfig:
+    """Profiles for every stub upstream plus the page corpus shape."""
+
+    gemini: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(800, 0.35))
+    factcheck: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(150, 0.3))
+    custom_search: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(200, 0.3))
+    translation: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(120, 0.3))
+    pages: UpstreamProfile = field(default_factory=lambda: UpstreamProfile(250, 0.5))
+    html_pages: int = 40
+    pdf_pages: int = 10
+    html_paragraphs: int = 12
+    pdf_lines: int = 60
+    seed: int = 42
+
+
+# Characters of reply text per streamed Gemini chunk
+STREAM_CHUNK_CHARS = 60
+
+
+def _prompt_text(payload: dict) -> str:
+    """All text the client sent (system instruction and user turns)."""
+    texts = []
+    for block in [payload.get("systemInstruction")] + list(payload.get("contents", [])):
+        if block:
+            texts.extend(part.get("text", "") for part in block.get("parts", []))
+    return "\n".join(texts)
+
+
+def _sentences(text: str) -> List[str]:
+    return [s.strip() for s in re.split(r'(?<=[.!?।])\s+', text) if len(s.strip()) > 20]
+
+
+class StubUpstreams:
+    """FastAPI app emulating every upstream the backend talks to."""
+
+    def __init__(self, config: StubConfig, base_url: str):
+        """Initialize stub upstreams."""
+        self.config = config
+        self.rng = random.Random(self.config.seed)
+        self.calls: Counter = Counter()
+        self.base_url = base_url
+        self.corpus = make_page_corpus(
+            self.config.html_pages, self.config.pdf_pages,
+            self.config.html_paragraphs, self.config.pdf_lines
+        )
+        self.page_names = sorted(self.corpus)
+        # Context cache handle -> system instruction text
+        self.cached_contents: Dict[str, str] = {}
+        self.app = self._build_app()
+
+    async def _simulate(self, name: str, profile: UpstreamProfile, delay: Optional[float] = None) -> Optional[Response]:
+        """Count the call, sleep for a sampled latency (or ``delay``), maybe fail."""
+        self.calls[name] += 1
+        await asyncio.sleep(profile.sample_delay(self.rng) if delay is None else delay)
+        if profile.error_rate and self.rng.random() < profile.error_rate:
+            return JSONResponse({"error": {"code": profile.error_status, "message": "stub failure"}},
+                                status_code=profile.error_status)
+        return None
+
+    def _page_urls(self, query: str, count: int) -> List[str]:
+        start = sum(map(ord, query)) % len(self.page_names)
+        names = [self.page_names[(start + i) % len(self.page_names)] for i in range(count)]
+        return [f"{self.base_url}/pages/{name}" for name in names]
+
+    def _gemini_request(self, payload: dict) -> Optional[Tuple[str, int]]:
+        """Full prompt of a request and its cached token count; None for an unknown cache handle."""
+        name = payload.get("cachedContent")
+        if not name:
+            return _prompt_text(payload), 0
+        if name not in self.cached_contents:
+            return None
+        cached = self.cached_contents[name]
+        return cached + "\n" + _prompt_text(payload), len(cached) // 4
+
+    def _gemini_reply(self, prompt: str) -> dict:
+        """Plausible JSON for each prompt the backend sends."""
+        if "extract all factual claims" in prompt:
+            match = re.search(r'Text to analyze:\s*(.*?)\s*Return a JSON', prompt, re.DOTALL)
+            text = match.group(1) if match else prompt
+            claims = [s for s in _sentences(text) if re.search(r'\d', s)][:5]
+            return {"claims": [{"claim": c, "type": "statistical", "confidence": 0.8} for c in claims]}
+        if "search queries to fact-check" in prompt:
+            match = re.search(r'Claim: "(.*?)"', prompt)
+            words = [w for w in re.findall(r'\w+', match.group(1) if match else "") if len(w) > 3]
+            return {"queries": [" ".join(words[:4]), " ".join(words[1:6]), " ".join(words[:3])]}
+        if "FINAL VERDICT" in prompt:
+            score = self.rng.randint(10, 95)
+            return {"score": score, "verdict": "LIKELY_TRUE" if score >= 70 else "UNCERTAIN",
+                    "confidence": "medium", "reasoning": "Stub reasoning based on the provided sources.",
+                    "citations": re.findall(r'URL: (\S+)', prompt)[:3]}
+        return {"verdict": self.rng.choice(["true", "false", "partially_true", "unverified"]),
+                "confidence": round(self.rng.uniform(0.4, 0.95), 2),
+                "explanation": "Stub explanation referencing the evidence.", "evidence": ""}
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+        config = self.config
+
+        @app.post("/v1beta/models/{model_action}")
+        async def gemini(model_action: str, request: Request):
+            if model_action.endswith(":streamGenerateContent"):
+                return await gemini_stream(request)
+            failure = await self._simulate("gemini", config.gemini)
+            if failure:
+                return failure
+            resolved = self._gemini_request(await request.json())
+            if resolved is None:
+                return JSONResponse({"error": {"code": 403, "message": "CachedContent not found"}}, status_code=403)
+            prompt, cached_tokens = resolved
+            text = json.dumps(self._gemini_reply(prompt))
+            return {
+                "candidates": [{"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP"}],
+                "usageMetadata": {"promptTokenCount": len(prompt) // 4, "candidatesTokenCount": len(text) // 4,
+                                  "cachedContentTokenCount": cached_tokens,
+                                  "totalTokenCount": (len(prompt) + len(text)) // 4},
+            }
+
+        async def gemini_stream(request: Request):
+            # A third of the latency before the first chunk, the rest spread over the chunks
+            latency = config.gemini.sample_delay(self.rng)
+            failure = await self._simulate("gemini", config.gemini, delay=latency / 3)
+            if failure:
+                return failure
+            resolved = self._gemini_request(await request.json())
+            if resolved is None:
+                return JSONResponse({"error": {"code": 403, "message": "CachedContent not found"}}, status_code=403)
+            prompt, cached_tokens = resolved
+            text = json.dumps(self._gemini_reply(prompt))
+            chunks = [text[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(text), STREAM_CHUNK_CHARS)]
+
+            async def events():
+                for i, chunk in enumerate(chunks):
+                    if i:
+                        await asyncio.sleep(latency * 2 / 3 / len(chunks))
+                    event = {"candidates": [{"content": {"role": "model", "parts": [{"text": chunk}]}}]}
+                    if i == len(chunks) - 1:
+                        event["usageMetadata"] = {"promptTokenCount": len(prompt) // 4,
+                                                  "candidatesTokenCount": len(text) // 4,
+                                                  "cachedContentTokenCount": cached_tokens}
+                    yield f"data: {json.dumps(event)}\r\n\r\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        @app.post("/v1beta/cachedContents")
+        async def create_cached_content(request: Request):
+            self.calls["gemini_cache"] += 1
+            payload = await request.json()
+            name = f"cachedContents/stub{len(self.cached_contents) + 1}"
+            self.cached_contents[name] = _prompt_text(payload)
+            return {"name": name, "model": payload.get("model"), "ttl": payload.get("ttl"),
+                    "usageMetadata": {"totalTokenCount": len(self.cached_contents[name]) // 4}}
+
+        @app.delete("/v1beta/cachedContents/{handle}")
+        async def delete_cached_content(handle: str):
+            self.cached_contents.pop(f"cachedContents/{handle}", None)
+            return {}
+
+        @app.get("/v1alpha1/claims:search")
+        async def factcheck(query: str = ""):
+            failure = await self._simulate("factcheck", config.factcheck)
+            if failure:
+                return failure
+            # Most queries have no ClaimReview, like the real API
+            if self.rng.random() < 0.6:
+                return {}
+            url = self._page_urls(query, 1)[0]
+            return {"claims": [{
+                "text": query, "claimant": "Social media",
+                "claimReview": [{"publisher": {"name": "Stub Fact Check"}, "url": url,
+                                 "textualRating": self.rng.choice(["False", "Misleading", "True"])}],
+            }]}
+
+        @app.get("/customsearch/v1")
+        async def custom_search(q: str = "", num: int = 10):
+            failure = await self._simulate("custom_search", config.custom_search)
+            if failure:
+                return failure
+            items = [{"title": f"Result {i} for {q}", "link": url, "snippet": f"{q} ... reported figures ..."}
+                     for i, url in enumerate(self._page_urls(q, num))]
+            return {"items": items}
+
+        @app.post("/language/translate/v2")
+        async def translate(request: Request):
+            failure = await self._simulate("translation", config.translation)
+            if failure:
+                return failure
+            payload = await request.json()
+            texts = payload.get("q", [])
+            texts = texts if isinstance(texts, list) else [texts]
+            return {"data": {"translations": [
+                {"translatedText": "Delhi air pollution is at a dangerous level with AQI above 450 in 2023.",
+                 "detectedSourceLanguage": "hi"} for _ in texts
+            ]}}
+
+        @app.post("/__calls/reset")
+        async def reset_calls():
+            counts = dict(self.calls)
+            self.calls.clear()
+            return counts
+
+        @app.get("/pages/{name}")
+        async def page(name: str):
+            failure = await self._simulate("pages", config.pages)
+            if failure:
+                return failure
+            if name not in self.corpus:
+                return Response(status_code=404)
+            body, content_type = self.corpus[name]
+            return Response(content=body, media_type=content_type)
+
+        return app
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(config: StubConfig, port: int) -> None:
+    stubs = StubUpstreams(config, f"http://127.0.0.1:{port}")
+    # Keep-alive long enough that pooled client connections are reused
+    uvicorn.run(stubs.app, host="127.0.0.1", port=port, log_level="warning", timeout_keep_alive=60)
+
+
+class StubServer:
+    """Run StubUpstreams in a child process.
+
+    A separate process keeps the stubs from competing for the GIL with the
+    pipeline being measured.
+    """
+
+    def __init__(self, config: Optional[StubConfig] = None, port: Optional[int] = None):
+        """Initialize stub server."""
+        self.config = config or StubConfig()
+        self.port = port or _free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def page_names(self) -> List[str]:
+        """Names of the corpus pages served under /pages/."""
+        return sorted(make_page_corpus(self.config.html_pages, self.config.pdf_pages, 1, 1))
+
+    def page_url(self, name: str) -> str:
+        """URL of a corpus page."""
+        return f"{self.base_url}/pages/{name}"
+
+    def reset_counts(self) -> Dict[str, int]:
+        """Calls per upstream since the last reset."""
+        return httpx.post(f"{self.base_url}/__calls/reset").json()
+
+    def env(self) -> Dict[str, str]:
+        """Environment that points the backend at this server."""
+        return {
+            "GEMINI_ENDPOINT": f"{self.base_url}/v1beta/models",
+            "FACT_CHECK_API_URL": f"{self.base_url}/v1alpha1/claims:search",
+            "CUSTOM_SEARCH_URL": f"{self.base_url}/customsearch/v1",
+            "GOOGLE_API_KEY": "stub-key",
+            "FACT_CHECK_API_KEY": "stub-key",
+            "GOOGLE_SEARCH_API_KEY": "stub-key",
+            "GOOGLE_SEARCH_CX": "stub-cx",
+        }
+
+    def __enter__(self) -> "StubServer":
+        self._process = multiprocessing.Process(target=_serve, args=(self.config, self.port), daemon=True)
+        self._process.start()
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                self.reset_counts()
+                return self
+            except httpx.TransportError:
+                if time.monotonic() > deadline or not self._process.is_alive():
+                    raise RuntimeError("Stub upstream server did not start")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc_info) -> None:
+        if self._process:
+            self._process.terminate()
+            self._process.join(timeout=5)
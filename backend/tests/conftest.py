@@ -0,0 +1,10 @@
+"""Shared test setup: settings are read from the environment when app.config is imported."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# No ClaimReview database in the working directory, no real upstream keys
+os.environ.setdefault("CLAIMREVIEW_INDEX", "false")
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+os.environ.setdefault("FACT_CHECK_API_KEY", "test-key")
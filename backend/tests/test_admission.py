@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from app.models import CrawledPage
+from app.services import admission
+from app.services.admission import AdmissionController, ServiceOverloaded
+from app.services.factcheck_service import FactCheckService
+
+
+async def hold(controller, release, entered=None):
+    async with controller.admit():
+        if entered is not None:
+            entered.append(True)
+        await release.wait()
+
+
+def test_admits_up_to_limit_then_queues_then_rejects():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=1, queue_timeout=5)
+        release = asyncio.Event()
+        entered = []
+        first = asyncio.create_task(hold(controller, release, entered))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(hold(controller, release, entered))
+        await asyncio.sleep(0)
+        assert (controller.in_flight, controller.queue_depth) == (1, 1)
+
+        with pytest.raises(ServiceOverloaded) as rejected:
+            async with controller.admit():
+                pass
+        assert rejected.value.reason == "queue full"
+        assert rejected.value.retry_after >= 1
+
+        release.set()
+        await asyncio.gather(first, queued)
+        assert entered == [True, True]
+        assert (controller.in_flight, controller.queue_depth) == (0, 0)
+
+    asyncio.run(scenario())
+
+
+def test_queue_timeout_rejects_and_leaves_no_waiter():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=4, queue_timeout=0.05)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(controller, release))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceOverloaded) as rejected:
+            async with controller.admit():
+                pass
+        assert rejected.value.reason == "queue timeout"
+        assert controller.queue_depth == 0
+        release.set()
+        await holder
+        assert controller.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_freed_slot_goes_to_oldest_waiter():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=4, queue_timeout=5)
+        order = []
+
+        async def job(name, release):
+            async with controller.admit():
+                order.append(name)
+                await release.wait()
+
+        gates = [asyncio.Event() for _ in range(3)]
+        tasks = [asyncio.create_task(job(i, gate)) for i, gate in enumerate(gates)]
+        await asyncio.sleep(0)
+        for gate in gates:
+            gate.set()
+        await asyncio.gather(*tasks)
+        assert order == [0, 1, 2]
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_leak_the_slot():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=4, queue_timeout=5)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(controller, release))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold(controller, release))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        release.set()
+        await holder
+        assert (controller.in_flight, controller.queue_depth) == (0, 0)
+
+    asyncio.run(scenario())
+
+
+def test_nested_admission_reuses_the_held_slot():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=1)
+        async with controller.admit():
+            async with controller.admit():
+                assert controller.in_flight == 1
+        assert controller.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_url_request_is_rejected_before_fetching(monkeypatch):
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=1)
+        monkeypatch.setattr(admission, "_controller", controller)
+        service = FactCheckService()
+        fetched = []
+
+        async def fetch_url(url, max_text_chars=None):
+            fetched.append(url)
+            return None
+
+        service.crawler.fetch_url = fetch_url
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(controller, release))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceOverloaded):
+            await service.factcheck_url("https://example.com/article")
+        assert fetched == []
+
+        release.set()
+        await holder
+        result = await service.factcheck_url("https://example.com/article")
+        assert fetched == ["https://example.com/article"]
+        assert result["claims"] == []
+        assert controller.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_url_analysis_runs_in_the_slot_taken_for_the_fetch(monkeypatch):
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=0, queue_timeout=1)
+        monkeypatch.setattr(admission, "_controller", controller)
+        service = FactCheckService()
+        page_text = "The Eiffel Tower was completed in 1889 and is 330 metres tall."
+
+        async def fetch_url(url, max_text_chars=None):
+            return CrawledPage(url=url, title="Eiffel Tower", text=page_text, paragraphs=[page_text])
+
+        async def analyze(text, url, profile):
+            assert controller.in_flight == 1
+            return {"claims": [{"claim": text, "verdict": "true"}], "summary": "", "methodology": "", "limitations": ""}
+
+        service.crawler.fetch_url = fetch_url
+        service._analyze_text = analyze
+        result = await service.factcheck_url("https://example.com/eiffel")
+        assert result["claims"][0]["claim"] == page_text
+        assert result["source_title"] == "Eiffel Tower"
+        assert controller.in_flight == 0
+
+    asyncio.run(scenario())
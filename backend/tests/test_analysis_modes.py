@@ -0,0 +1,12 @@
+import pytest
+
+from app.config import settings
+from app.services.analysis_modes import get_analysis_profile
+
+
+def test_balanced_mode_follows_crawl_max_sources(monkeypatch):
+    monkeypatch.setattr(settings, "CRAWL_MAX_SOURCES", 4)
+    assert get_analysis_profile("balanced").max_crawl_sources == 4
+    assert get_analysis_profile("fast").max_crawl_sources == 0
+    with pytest.raises(ValueError):
+        get_analysis_profile("turbo")
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.services.analysis_modes import get_analysis_profile
+from app.services.checkworthiness import CheckWorthinessFilter, score_sentence
+from app.services.claim_extractor import ClaimExtractor
+from app.services.factcheck_service import FactCheckService
+
+HINDI = "प्रधानमंत्री ने कहा कि देश की जनसंख्या एक सौ चालीस करोड़ से अधिक हो गई है।"
+SPANISH = "La población de la India superó los mil cuatrocientos millones de personas."
+
+
+@pytest.mark.parametrize("sentence", [
+    "India's population passed 1.4 billion people in 2023.",
+    "Studies show that the vaccine reduces hospital admissions by 90%.",
+    "The Eiffel Tower was completed in 1889.",
+])
+def test_factual_sentences_pass(sentence):
+    assert score_sentence(sentence) >= 0.2
+
+
+@pytest.mark.parametrize("sentence", [
+    "Is this true?",
+    "I think this is so cool lol",
+    "wow amazing",
+    "You should try it.",
+])
+def test_questions_opinions_and_fragments_fail(sentence):
+    assert score_sentence(sentence) < 0.2
+
+
+def test_filter_selects_check_worthy_sentences():
+    selected = CheckWorthinessFilter(0.2).select("Wow, so cool! The Eiffel Tower was completed in 1889. Love it.")
+    assert selected == ["The Eiffel Tower was completed in 1889."]
+
+
+class RecordingLLM:
+    """LLMAnalyzer stand-in recording the claim extraction prompts."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def analyze(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return {"claims": [{"claim": "India's population passed 1.4 billion", "type": "statistical", "confidence": 0.9}]}
+
+    async def stream_json_items(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        yield {"claim": "India's population passed 1.4 billion", "type": "statistical", "confidence": 0.9}
+
+
+@pytest.fixture
+def skip_mode(monkeypatch):
+    monkeypatch.setattr(settings, "CHECKWORTHINESS_FILTER", "skip")
+
+
+@pytest.mark.parametrize("text", [HINDI, SPANISH], ids=["hindi", "spanish"])
+def test_untranslated_text_bypasses_the_english_prefilter(skip_mode, text):
+    llm = RecordingLLM()
+    extractor = ClaimExtractor(llm)
+
+    assert asyncio.run(extractor.extract_claims(text, english=True)) == []
+    assert llm.prompts == []
+    assert len(asyncio.run(extractor.extract_claims(text, english=False))) == 1
+    assert len(llm.prompts) == 1
+
+
+def test_fast_mode_extracts_claims_from_untranslated_hindi(skip_mode, monkeypatch):
+    monkeypatch.setattr(settings, "STREAM_CLAIM_EXTRACTION", False)
+    service = FactCheckService()
+    llm = RecordingLLM()
+    service.claim_extractor = ClaimExtractor(llm)
+    service.language_service.detect_language = lambda text: "hi"
+    checked = []
+
+    async def check(claim_data, *args):
+        checked.append(claim_data.claim)
+        return {"claim": claim_data.claim, "verdict": "unverified", "status": "complete"}
+
+    service._check_claim_within_deadline = check
+    profile = get_analysis_profile("fast")
+    assert not profile.translate
+
+    result = asyncio.run(service._analyze_text(HINDI, None, profile))
+    assert len(llm.prompts) == 1
+    assert checked == ["India's population passed 1.4 billion"]
+    assert result["detected_language"] == "hi"
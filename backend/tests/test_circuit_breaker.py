@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError, is_failure_status
+
+
+def make_breaker(threshold=3, recovery=60):
+    return CircuitBreaker("test", failure_threshold=threshold, recovery_timeout=recovery)
+
+
+def expire(breaker):
+    """Move the open breaker past its recovery timeout."""
+    breaker._opened_at = time.monotonic() - breaker.recovery_timeout - 1
+
+
+def test_opens_after_consecutive_failures():
+    breaker = make_breaker(threshold=3)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    assert breaker.snapshot()["retry_in_seconds"] > 0
+
+
+def test_success_resets_the_failure_count():
+    breaker = make_breaker(threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = make_breaker(threshold=1)
+    breaker.record_failure()
+    expire(breaker)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+
+def test_successful_probe_closes():
+    breaker = make_breaker(threshold=1)
+    breaker.record_failure()
+    expire(breaker)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens():
+    breaker = make_breaker(threshold=5)
+    for _ in range(5):
+        breaker.record_failure()
+    expire(breaker)
+    assert breaker.allow_request()
+    # A single failure in half-open is enough
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow_request()
+
+
+def test_probe_that_never_reports_back_is_replaced():
+    breaker = make_breaker(threshold=1, recovery=60)
+    breaker.record_failure()
+    expire(breaker)
+    assert breaker.allow_request()
+    breaker._probe_started -= breaker.recovery_timeout
+    assert breaker.allow_request()
+
+
+@pytest.mark.parametrize("status, failure", [(200, False), (404, False), (429, True), (500, True), (503, True)])
+def test_failure_statuses(status, failure):
+    assert is_failure_status(status) is failure
@@ -0,0 +1,88 @@
+import asyncio
+
+from app.services.claimreview_index import ClaimReviewIndex
+from app.services.search_service import SearchService
+
+
+def make_claim(text, rating="False", url="https://www.altnews.in/review"):
+    return {"text": text, "claimReview": [{"url": url, "textualRating": rating, "publisher": {"name": "Alt News"}}]}
+
+
+def make_index(tmp_path, **kwargs):
+    return ClaimReviewIndex(str(tmp_path / "claims.sqlite3"), ttl_seconds=3600, **kwargs)
+
+
+def test_search_requires_term_coverage(tmp_path):
+    index = make_index(tmp_path, min_match=0.6)
+    index.add_claims([
+        make_claim("Eiffel Tower was completed in 1889"),
+        make_claim("Great Wall of China is visible from space"),
+    ])
+
+    claims, fresh = index.search("When was the Eiffel Tower completed?")
+    assert [c["text"] for c in claims] == ["Eiffel Tower was completed in 1889"]
+    assert fresh
+    assert index.search("price of onions in Delhi") == ([], True)
+
+
+def test_add_claims_refreshes_existing_record(tmp_path):
+    index = make_index(tmp_path)
+    index.add_claims([make_claim("Eiffel Tower was completed in 1889")], fetched_at=1.0)
+    _, fresh = index.search("Eiffel Tower completed 1889")
+    assert not fresh
+
+    assert index.add_claims([make_claim("Eiffel Tower was completed in 1889", rating="True")]) == 1
+    claims, fresh = index.search("Eiffel Tower completed 1889")
+    assert len(index) == 1
+    assert fresh and claims[0]["claimReview"][0]["textualRating"] == "True"
+
+
+def test_records_without_reviews_are_not_indexed(tmp_path):
+    index = make_index(tmp_path)
+    assert index.add_claims([{"text": "No review"}, {"claimReview": [{}]}, "junk"]) == 0
+    assert len(index) == 0
+
+
+class FakeSearch(SearchService):
+    """SearchService with a scripted Fact Check Tools API."""
+
+    def __init__(self, index, answers):
+        self.claimreview_index = index
+        self.answers = list(answers)
+        self.calls = 0
+
+    async def _fetch_factcheck_claims(self, query):
+        self.calls += 1
+        return self.answers.pop(0)
+
+
+def test_api_answers_below_match_threshold_are_not_cached_as_misses(tmp_path):
+    index = make_index(tmp_path, min_match=0.9)
+    # The API matches semantically: its record shares few of the query's terms
+    semantic = make_claim("Viral video of Paris landmark is doctored")
+    search = FakeSearch(index, [[semantic], [semantic]])
+    query = "Eiffel Tower collapsed after storm"
+
+    assert len(asyncio.run(search.search_factcheck_api(query))) == 1
+    assert len(asyncio.run(search.search_factcheck_api(query))) == 1
+    assert search.calls == 2
+
+
+def test_api_miss_is_answered_locally_within_ttl(tmp_path):
+    index = make_index(tmp_path)
+    search = FakeSearch(index, [[]])
+    query = "Eiffel Tower collapsed after storm"
+
+    assert asyncio.run(search.search_factcheck_api(query)) == []
+    assert asyncio.run(search.search_factcheck_api(query)) == []
+    assert search.calls == 1
+
+
+def test_fresh_local_match_skips_the_api(tmp_path):
+    index = make_index(tmp_path)
+    index.add_claims([make_claim("Eiffel Tower was completed in 1889")])
+    search = FakeSearch(index, [])
+
+    evidence = asyncio.run(search.search_factcheck_api("Eiffel Tower completed in 1889"))
+    assert search.calls == 0
+    assert evidence[0].textual_rating == "False"
@@ -0,0 +1,84 @@
+import random
+
+from app.models import Evidence
+from app.services.dedup import EvidenceDeduplicator, _bands, hamming_distance, simhash
+
+STORY = (
+    "The city council approved a new budget on Tuesday that raises spending on public "
+    "transport by twelve percent and funds three new bus lines across the northern districts. "
+    "The mayor said the first of the new lines would start running in the spring and that fares "
+    "would stay the same for at least two years while the network is being expanded"
+)
+OTHER = (
+    "Researchers at the university published a study showing that coastal wetlands store "
+    "more carbon per hectare than tropical forests over long periods of time"
+)
+
+
+def make_deduplicator(**kwargs):
+    return EvidenceDeduplicator(priority=lambda e: 1.0 if e.url.endswith(".gov/story") else 0.5, **kwargs)
+
+
+def test_simhash_is_stable_and_close_for_small_edits():
+    assert simhash(STORY) == simhash(STORY)
+    edited = STORY.replace("Tuesday", "Wednesday")
+    assert hamming_distance(simhash(STORY), simhash(edited)) <= 6
+    assert hamming_distance(simhash(STORY), simhash(OTHER)) > 6
+    assert simhash("") == 0
+
+
+def test_bands_cover_every_bit_once():
+    for max_distance in (0, 3, 6, 63, 100):
+        bands = _bands(max_distance)
+        assert len(bands) == min(max_distance + 1, 64)
+        covered = 0
+        for shift, mask in bands:
+            assert covered & (mask << shift) == 0
+            covered |= mask << shift
+        assert covered == (1 << 64) - 1
+
+
+def test_keeps_the_most_authoritative_copy_and_records_alternates():
+    evidence = [
+        Evidence(url="https://blog.example/story", snippet=STORY),
+        Evidence(url="https://science.example/wetlands", snippet=OTHER),
+        Evidence(url="https://city.gov/story", snippet=STORY.replace("Tuesday", "Wednesday")),
+        Evidence(url="https://mirror.example/story", snippet=STORY, alternate_citations=["https://copy.example/story"]),
+    ]
+    kept = make_deduplicator().deduplicate(evidence, lambda e: e.snippet)
+    assert [e.url for e in kept] == ["https://science.example/wetlands", "https://city.gov/story"]
+    assert kept[1].alternate_citations == [
+        "https://blog.example/story", "https://mirror.example/story", "https://copy.example/story"
+    ]
+
+
+def test_short_texts_are_always_kept():
+    evidence = [Evidence(url=f"https://site{i}.example/", snippet="Budget approved") for i in range(3)]
+    kept = make_deduplicator().deduplicate(evidence, lambda e: e.snippet)
+    assert kept == evidence
+
+
+def test_banded_lookup_matches_pairwise_comparison():
+    rng = random.Random(7)
+    words = STORY.split() + OTHER.split()
+    texts = []
+    for _ in range(40):
+        base = rng.choice([STORY, OTHER]).split()
+        for _ in range(rng.randint(0, 6)):
+            base[rng.randrange(len(base))] = rng.choice(words)
+        texts.append(" ".join(base))
+    evidence = [Evidence(url=f"https://site{i}.example/", snippet=t) for i, t in enumerate(texts)]
+    kept = make_deduplicator(max_distance=6).deduplicate(evidence, lambda e: e.snippet)
+
+    # Every dropped item is within reach of some item (a pairwise union-find would group the same)
+    fingerprints = [simhash(t) for t in texts]
+    kept_urls = {e.url for e in kept}
+    for i, item in enumerate(evidence):
+        if item.url in kept_urls:
+            continue
+        assert any(hamming_distance(fingerprints[i], fingerprints[j]) <= 6 for j in range(len(texts)) if j != i)
+    # No two kept items are near-duplicates
+    kept_fingerprints = [simhash(e.snippet) for e in kept]
+    for a in range(len(kept_fingerprints)):
+        for b in range(a + 1, len(kept_fingerprints)):
+            assert hamming_distance(kept_fingerprints[a], kept_fingerprints[b]) > 6
@@ -0,0 +1,75 @@
+import asyncio
+
+from app.services.analysis_modes import get_analysis_profile
+from app.services.factcheck_service import FactCheckService
+
+TOPICS = ["volcano", "glacier", "desert", "harbour", "orchard", "canyon"]
+
+
+def paragraph(topic, year):
+    return f"The {topic} museum opened in {year} and welcomes many visitors."
+
+
+def make_service(calls):
+    """Service whose text analysis returns one claim per paragraph, stopping at max_claims."""
+    service = FactCheckService()
+
+    async def analyze_text(text, url=None, deadline_seconds=None, mode=None):
+        calls.append(text.split("\n\n"))
+        limit = get_analysis_profile(mode).max_claims
+        claims = [{"claim": p, "verdict": "true"} for p in text.split("\n\n")[:limit]]
+        return {"claims": claims, "summary": "", "methodology": "", "limitations": ""}
+
+    async def page_language_fields(text, mode, template):
+        return {}
+
+    service.analyze_text = analyze_text
+    service._page_language_fields = page_language_fields
+    return service
+
+
+def visit(service, paragraphs):
+    return asyncio.run(service._analyze_page("https://example.com/page", "\n\n".join(paragraphs), paragraphs, "fast"))
+
+
+def test_paragraphs_after_the_claim_limit_are_analyzed_on_a_later_visit():
+    max_claims = get_analysis_profile("fast").max_claims
+    calls = []
+    service = make_service(calls)
+    page = [paragraph(topic, 1900 + i) for i, topic in enumerate(TOPICS)]
+
+    first = visit(service, page)
+    assert len(first["claims"]) == max_claims
+
+    # One of the claimed paragraphs changes: it and the never examined ones are analyzed together
+    changed = [paragraph("lighthouse", 2001)] + page[1:]
+    second = visit(service, changed)
+    assert calls[-1] == [changed[0]] + page[max_claims:]
+    assert second["incremental"]["reused_claims"] == max_claims - 1
+    assert len(second["claims"]) == max_claims
+    assert [c["claim"] for c in second["claims"]] == page[1:max_claims] + [changed[0]]
+
+
+def test_unchanged_page_with_claim_limit_filled_is_not_analyzed_again():
+    max_claims = get_analysis_profile("fast").max_claims
+    calls = []
+    service = make_service(calls)
+    page = [paragraph(topic, 1900 + i) for i, topic in enumerate(TOPICS)]
+
+    visit(service, page)
+    again = visit(service, page)
+    assert len(calls) == 1
+    assert again["incremental"]["analyzed_paragraphs"] == 0
+    assert [c["claim"] for c in again["claims"]] == page[:max_claims]
+    assert all(c["reused"] for c in again["claims"])
+
+
+def test_short_page_is_fully_seen_after_the_first_visit():
+    calls = []
+    service = make_service(calls)
+    page = [paragraph("volcano", 1950)]
+
+    visit(service, page)
+    again = visit(service, page)
+    assert len(calls) == 1
+    assert again["claims"][0]["reused"] is True
@@ -0,0 +1,68 @@
+import orjson
+import pytest
+
+from app.services.json_stream import JSONArrayStreamParser
+
+REPLY = {
+    "claims": [
+        {"claim": "The bridge opened in 1932 [citation needed]", "checkworthy": True},
+        {"claim": "It is \"the longest\" span, with a } brace", "scores": [1, [2, 3]]},
+        "a bare string, with a comma",
+        42,
+        -1.5e3,
+        True,
+        None,
+    ],
+    "notes": ["not", "this", "array"],
+}
+
+
+def feed_in_chunks(text, size):
+    parser = JSONArrayStreamParser()
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    return parser, items
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 10000])
+def test_yields_the_first_array_whatever_the_chunking(size):
+    parser, items = feed_in_chunks(orjson.dumps(REPLY).decode(), size)
+    assert items == REPLY["claims"]
+    assert parser.done
+
+
+def test_bare_array_with_whitespace():
+    parser, items = feed_in_chunks('\n[ 1 ,\n  "two" , {"three": 3}\t]\n', 3)
+    assert items == [1, "two", {"three": 3}]
+
+
+def test_brackets_inside_strings_before_the_array_are_ignored():
+    parser, items = feed_in_chunks('{"intro": "see [1]", "claims": ["x"]}', 5)
+    assert items == ["x"]
+
+
+def test_escaped_quotes_and_backslashes():
+    text = orjson.dumps({"claims": ['say \\"hi\\"', "ends with \\", 'q"']}).decode()
+    parser, items = feed_in_chunks(text, 1)
+    assert items == ['say \\"hi\\"', "ends with \\", 'q"']
+
+
+def test_elements_are_yielded_as_soon_as_complete():
+    parser = JSONArrayStreamParser()
+    assert parser.feed('{"claims": [{"claim": "a"}, {"cla') == [{"claim": "a"}]
+    assert parser.feed('im": "b"}') == [{"claim": "b"}]
+    assert not parser.done
+    assert parser.feed("]}") == []
+    assert parser.done
+
+
+def test_unparseable_element_is_skipped():
+    parser, items = feed_in_chunks('[{"a": 1}, {"b": oops}, {"c": 3}]', 4)
+    assert items == [{"a": 1}, {"c": 3}]
+
+
+def test_text_after_the_array_is_ignored():
+    parser, items = feed_in_chunks('[1, 2] and then [3]', 2)
+    assert items == [1, 2]
+    assert parser.feed("[4, 5]") == []
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from app.services.rate_limiter import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+def test_bucket_starts_full_and_refills_at_rate():
+    bucket = TokenBucket(rate_per_minute=60)
+    assert bucket.time_until(60) == 0.0
+    bucket.consume(60)
+    assert bucket.time_until(1) == pytest.approx(1.0, abs=0.05)
+    # A request larger than the capacity waits for a full bucket, not forever
+    assert bucket.time_until(1000) == pytest.approx(60.0, abs=0.5)
+
+
+def test_bucket_records_debt():
+    bucket = TokenBucket(rate_per_minute=60, capacity=2)
+    bucket.consume(2)
+    bucket.consume(2)
+    assert bucket.tokens == pytest.approx(-2, abs=0.05)
+    assert bucket.time_until(1) == pytest.approx(3.0, abs=0.05)
+
+
+def test_disabled_limiter_never_waits():
+    async def scenario():
+        limiter = RateLimiter("test", 0)
+        for _ in range(100):
+            await asyncio.wait_for(limiter.acquire(), timeout=0.1)
+
+    asyncio.run(scenario())
+
+
+def test_waiters_are_served_by_priority_then_arrival():
+    async def scenario():
+        # 20 requests per second, drained so every caller has to queue
+        limiter = RateLimiter("test", 1200)
+        limiter._request_bucket.tokens = 0
+        order = []
+
+        async def call(name, priority):
+            await limiter.acquire(priority=priority)
+            order.append(name)
+
+        tasks = [asyncio.create_task(call("batch-1", PRIORITY_BATCH))]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("batch-2", PRIORITY_BATCH)))
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("interactive", PRIORITY_INTERACTIVE)))
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 3
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=2)
+        assert order == ["interactive", "batch-1", "batch-2"]
+        assert limiter.queue_depth == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_gives_up_its_turn():
+    async def scenario():
+        limiter = RateLimiter("test", 1200)
+        limiter._request_bucket.tokens = 0
+        cancelled = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        kept = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.wait_for(kept, timeout=1)
+        assert cancelled.cancelled()
+        # Only the caller that was served took a token
+        assert limiter._request_bucket.tokens > -1
+
+    asyncio.run(scenario())
+
+
+def test_token_budget_limits_large_requests():
+    async def scenario():
+        limiter = RateLimiter("test", 0, tokens_per_minute=6000)
+        await limiter.acquire(tokens=6000)
+        waiting = asyncio.create_task(limiter.acquire(tokens=10))
+        await asyncio.sleep(0.02)
+        assert not waiting.done()
+        # 10 tokens refill in 0.1s
+        await asyncio.wait_for(waiting, timeout=1)
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("value, expected", [("5", 5.0), ("-3", 0.0), ("", None), ("soon", None)])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
@@ -0,0 +1,66 @@
+import pytest
+
+from app.models import CUSTOM_SEARCH, FACT_CHECK_API, Evidence
+from app.services.evidence_ranker import EvidenceRanker, _read_rating
+
+
+@pytest.mark.parametrize("rating, expected", [
+    ("False", ("false", 0.8)),
+    ("FAKE", ("false", 0.8)),
+    ("Pants on Fire!", ("false", 0.8)),
+    ("Doctored video", ("false", 0.8)),
+    ("Not true", ("false", 0.8)),
+    ("Not accurate", ("false", 0.8)),
+    ("No, not correct", ("false", 0.8)),
+    ("True", ("true", 0.8)),
+    ("Correct", ("true", 0.8)),
+    ("Mostly false", ("partially_true", 0.6)),
+    ("Half True", ("partially_true", 0.6)),
+    ("Mixture", ("partially_true", 0.6)),
+    ("Misleading", ("partially_true", 0.6)),
+    ("Exaggerated", ("partially_true", 0.6)),
+    ("Distorted", ("partially_true", 0.6)),
+    ("Needs context", ("partially_true", 0.6)),
+    ("Missing context", ("partially_true", 0.6)),
+    ("Not entirely true", ("partially_true", 0.6)),
+    ("Unproven", ("unverified", 0.6)),
+    ("Unverified", ("unverified", 0.6)),
+    ("Unsupported", ("unverified", 0.6)),
+    ("Not false", None),
+    ("Satire", None),
+    ("Outdated", None),
+    ("Explainer", None),
+])
+def test_read_rating(rating, expected):
+    assert _read_rating(rating) == expected
+
+
+def review(rating, url, source=FACT_CHECK_API, relevance=0.5):
+    return Evidence(
+        title="Fact check", url=url, snippet="", source=source, textual_rating=rating, relevance_score=relevance
+    )
+
+
+def make_ranker():
+    return EvidenceRanker.__new__(EvidenceRanker)
+
+
+def test_rating_verdict_skips_ratings_without_a_verdict():
+    verdict = make_ranker().rating_verdict([
+        review("Satire", "https://www.altnews.in/a", relevance=0.9),
+        review("Misleading", "https://www.boomlive.in/b", relevance=0.5),
+    ])
+    assert (verdict.verdict, verdict.evidence) == ("partially_true", "https://www.boomlive.in/b")
+
+
+def test_rating_verdict_without_reviews_is_unverified():
+    verdict = make_ranker().rating_verdict([review("False", "https://example.com/x", source=CUSTOM_SEARCH)])
+    assert verdict.verdict == "unverified"
+
+
+def test_only_true_or_false_ratings_are_conclusive():
+    ranker = make_ranker()
+    assert ranker.has_conclusive_rating(review("Not true", "https://a"))
+    assert not ranker.has_conclusive_rating(review("Misleading", "https://a"))
+    assert not ranker.has_conclusive_rating(review("False", "https://a", source=CUSTOM_SEARCH))
+
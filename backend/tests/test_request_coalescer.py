@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from app.services.request_coalescer import RequestCoalescer, make_coalescing_key
+
+
+def test_key_ignores_whitespace_and_case():
+    assert make_coalescing_key("The  Eiffel\nTower", None) == make_coalescing_key("the eiffel tower", "")
+    assert make_coalescing_key("a", "balanced") != make_coalescing_key("a", "fast")
+
+
+def test_concurrent_callers_share_one_execution():
+    async def scenario():
+        coalescer = RequestCoalescer()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"calls": calls}
+
+        results = await asyncio.gather(*(coalescer.run("k", work) for _ in range(5)))
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert coalescer.in_flight == 0
+        # Finished executions are not reused
+        await coalescer.run("k", work)
+        assert calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_cancel_shared_execution():
+    async def scenario():
+        coalescer = RequestCoalescer()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(coalescer.run("k", work))
+        second = asyncio.create_task(coalescer.run("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(scenario())
+
+
+def test_caller_arriving_after_last_waiter_left_starts_fresh():
+    async def scenario():
+        coalescer = RequestCoalescer()
+        started = 0
+
+        async def work():
+            nonlocal started
+            started += 1
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                # Cleanup that keeps the cancelled task alive for a moment
+                await asyncio.sleep(0.01)
+                raise
+            return "fresh"
+
+        abandoned = asyncio.create_task(coalescer.run("k", work))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        await asyncio.sleep(0)
+        # The shared task is cancelled but has not finished yet
+        assert await coalescer.run("k", work) == "fresh"
+        assert started == 2
+
+    asyncio.run(scenario())
+
+
+def test_errors_reach_every_waiter():
+    async def scenario():
+        coalescer = RequestCoalescer()
+
+        async def work():
+            await asyncio.sleep(0)
+            raise ValueError("upstream failed")
+
+        results = await asyncio.gather(*(coalescer.run("k", work) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+
+    asyncio.run(scenario())
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+
+from app.services import translation_service
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.rate_limiter import RateLimiter
+from app.services.translation_service import TranslationService
+
+
+class HangingClient:
+    """Translation client whose calls block until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def translate(self, text, target_language="en"):
+        self.release.wait(5)
+        return {"translatedText": text}
+
+
+def make_service(client, breaker):
+    service = TranslationService()
+    service.initialized = service.enabled = True
+    service.client = client
+    service.rate_limiter = RateLimiter("translation-test", 0)
+    service.breaker = breaker
+    return service
+
+
+def test_timeout_counts_as_breaker_failure(monkeypatch):
+    monkeypatch.setattr(translation_service, "stage_timeout", lambda default: 0.05)
+    client = HangingClient()
+    breaker = CircuitBreaker("translation-test", failure_threshold=2, recovery_timeout=60)
+    service = make_service(client, breaker)
+
+    async def scenario():
+        for i in range(2):
+            text = f"texto de prueba número {i}"
+            assert await service.translate_to_english(text) == text
+        assert breaker.is_open
+        client.release.set()
+
+    asyncio.run(scenario())
+
+
+def test_success_resets_the_failure_count(monkeypatch):
+    monkeypatch.setattr(translation_service, "stage_timeout", lambda default: 1.0)
+    client = HangingClient()
+    client.release.set()
+    breaker = CircuitBreaker("translation-test", failure_threshold=2, recovery_timeout=60)
+    breaker.record_failure()
+    service = make_service(client, breaker)
+
+    assert asyncio.run(service.translate_to_english("una frase distinta")) == "una frase distinta"
+    assert breaker.snapshot() == {"state": "closed", "consecutive_failures": 0}